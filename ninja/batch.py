@@ -0,0 +1,228 @@
+"""
+Batch endpoint - NinjaAPI(batch_url="/batch")
+
+Accepts a json list of sub-requests:
+
+    [{"method": "GET", "path": "/items/1", "query": {"fields": "name"}}, ...]
+
+Each sub-request is resolved against the api urls and executed in-process
+through the regular operation pipeline (auth, validation, serialization)
+with a copy of the batch request (same user, cookies and headers).
+Results are returned in the same order:
+
+    [{"status": 200, "headers": {...}, "body": {...}}, ...]
+
+Unhandled exceptions of a sub-request become its 500 result (and are logged).
+
+If api has async operations the batch view is async and sub-requests
+run concurrently.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from django.http import HttpRequest, HttpResponse, QueryDict, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.urls import URLPattern, URLResolver, path
+from django.urls.exceptions import Resolver404
+from django.urls.resolvers import ResolverMatch, RoutePattern
+from django.utils.datastructures import MultiValueDict
+from pydantic import ValidationError, parse_obj_as
+
+from ninja.compatibility.request import HttpHeaders
+from ninja.conf import settings
+from ninja.schema import Schema
+from ninja.utils import normalize_path
+
+if TYPE_CHECKING:
+    from ninja import NinjaAPI  # pragma: no cover
+
+__all__ = ["BatchItem", "BatchView", "get_batch_url"]
+
+logger = logging.getLogger("django")
+
+
+class BatchItem(Schema):
+    method: str = "GET"
+    path: str
+    query: Dict[str, Any] = {}
+    body: Any = None
+
+
+class BatchView:
+    def __init__(
+        self,
+        api: "NinjaAPI",
+        route: str,
+        patterns: List[Union[URLPattern, URLResolver]],
+    ) -> None:
+        self.api = api
+        self.route = route
+        self.resolver = URLResolver(RoutePattern(""), patterns)
+        self.is_async = any(
+            asyncio.iscoroutinefunction(getattr(p, "callback", None)) for p in patterns
+        )
+
+    def get_view(self) -> Callable:
+        view: Callable
+        if self.is_async:
+            view = self._async_view
+        else:
+            view = self._sync_view
+        view.__func__.csrf_exempt = True  # type: ignore
+        return view
+
+    def _sync_view(self, request: HttpRequest) -> HttpResponseBase:
+        items, error = self._parse_items(request)
+        if error is not None:
+            return error
+        results = []
+        for item in items:
+            match, sub_request = self._resolve(request, item)
+            if match is None:
+                results.append(self._not_found())
+                continue
+            try:
+                response = match.func(sub_request, *match.args, **match.kwargs)
+            except Exception as e:  # not handled by api exception handlers
+                results.append(self._server_error(e))
+                continue
+            results.append(self._to_result(response))
+        return self.api.create_response(request, results)
+
+    async def _async_view(self, request: HttpRequest) -> HttpResponseBase:
+        from asgiref.sync import sync_to_async
+
+        items, error = self._parse_items(request)
+        if error is not None:
+            return error
+        calls = []
+        for item in items:
+            match, sub_request = self._resolve(request, item)
+            if match is None:
+                calls.append(self._not_found_async())
+                continue
+            func = match.func
+            if not asyncio.iscoroutinefunction(func):
+                func = sync_to_async(func)
+            calls.append(func(sub_request, *match.args, **match.kwargs))
+        responses = await asyncio.gather(*calls, return_exceptions=True)
+        results = []
+        for response in responses:
+            if isinstance(response, dict):
+                results.append(response)
+            elif isinstance(response, Exception):
+                results.append(self._server_error(response))
+            elif isinstance(response, BaseException):
+                raise response  # e.g. cancellation
+            else:
+                results.append(self._to_result(response))
+        return self.api.create_response(request, results)
+
+    def _parse_items(
+        self, request: HttpRequest
+    ) -> Tuple[List[BatchItem], Optional[HttpResponse]]:
+        try:
+            data = self.api.parser.parse_body(request)
+        except Exception:
+            return [], self._error(request, "Cannot parse request body", 400)
+        try:
+            items = parse_obj_as(List[BatchItem], data)
+        except ValidationError as e:
+            # loc of parse_obj_as errors starts with "__root__"
+            errors = [dict(i, loc=("body",) + i["loc"][1:]) for i in e.errors()]
+            return [], self.api.create_response(request, {"detail": errors}, status=422)
+        if len(items) > settings.BATCH_MAX_ITEMS:
+            message = f"Too many batch items (max {settings.BATCH_MAX_ITEMS})"
+            return [], self._error(request, message, 400)
+        return items, None
+
+    def _resolve(
+        self, request: HttpRequest, item: BatchItem
+    ) -> Tuple[Optional[ResolverMatch], HttpRequest]:
+        item_path, _, query_string = item.path.partition("?")
+        item_path = normalize_path("/" + item_path)
+        sub_request = self._build_request(request, item, item_path, query_string)
+        try:
+            return self.resolver.resolve(item_path.lstrip("/")), sub_request
+        except Resolver404:
+            return None, sub_request
+
+    def _build_request(
+        self, request: HttpRequest, item: BatchItem, item_path: str, query_string: str
+    ) -> HttpRequest:
+        sub = copy.copy(request)
+        sub.__dict__.pop("_ninja_context", None)
+        body = b"" if item.body is None else json.dumps(item.body).encode()
+        query = QueryDict(query_string, mutable=True)
+        for key, value in item.query.items():
+            values = value if isinstance(value, list) else [value]
+            query.setlist(key, [str(v) for v in values])
+
+        sub.method = item.method.upper()
+        prefix_end = request.path.rfind(self.route)
+        prefix = request.path[:prefix_end] if prefix_end >= 0 else "/"
+        sub.path = prefix + item_path[1:]
+        sub.path_info = sub.path
+        sub.GET = query  # type: ignore
+        sub.META = dict(
+            request.META,
+            REQUEST_METHOD=sub.method,
+            PATH_INFO=sub.path,
+            QUERY_STRING=query.urlencode(),
+            CONTENT_TYPE="application/json",
+            CONTENT_LENGTH=str(len(body)),
+        )
+        sub.headers = HttpHeaders(sub.META)  # type: ignore
+        if isinstance(request, HttpRequest):
+            sub._body = body
+            sub.__dict__.pop("_post", None)
+            sub.__dict__.pop("_files", None)
+        else:  # mocked request (ninja.testing)
+            sub.body = body
+            sub.POST = QueryDict()
+            sub.FILES = MultiValueDict()
+        return sub
+
+    def _to_result(self, response: HttpResponseBase) -> Dict[str, Any]:
+        if isinstance(response, StreamingHttpResponse):
+            content = b"".join(response.streaming_content)  # type: ignore
+        else:
+            content = response.content  # type: ignore
+        media_type = response.get("Content-Type", "").split(";")[0]
+        body: Any = content.decode(response.charset)
+        if content and media_type == "application/json":
+            body = json.loads(content)
+        return {
+            "status": response.status_code,
+            "headers": dict(response.items()),
+            "body": body,
+        }
+
+    def _not_found(self) -> Dict[str, Any]:
+        return {"status": 404, "headers": {}, "body": {"detail": "Not Found"}}
+
+    async def _not_found_async(self) -> Dict[str, Any]:
+        return self._not_found()
+
+    def _server_error(self, exc: Exception) -> Dict[str, Any]:
+        logger.error("Batch sub-request failed", exc_info=exc)
+        return {
+            "status": 500,
+            "headers": {},
+            "body": {"detail": "Internal Server Error"},
+        }
+
+    def _error(self, request: HttpRequest, message: str, status: int) -> HttpResponse:
+        return self.api.create_response(request, {"detail": message}, status=status)
+
+
+def get_batch_url(
+    api: "NinjaAPI", patterns: List[Union[URLPattern, URLResolver]]
+) -> URLPattern:
+    route = normalize_path(str(api.batch_url)).lstrip("/")
+    view = BatchView(api, route, patterns)
+    return path(route, view.get_view(), name="batch")
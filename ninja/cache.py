@@ -0,0 +1,227 @@
+import datetime
+import json
+from collections import OrderedDict
+from enum import Enum
+from hashlib import sha256
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Tuple
+
+from django.core.cache import BaseCache, caches
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import patch_vary_headers
+
+from ninja.responses import NinjaJSONEncoder
+from ninja.types import DictStrAny
+
+__all__ = ["TTLCache", "ResponseCache", "cache_response"]
+
+
+class TTLCache:
+    """
+    Thread safe in-memory cache: keeps at most `maxsize` least recently used
+    items, each item expires `ttl` seconds after it was set
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float = 60) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires, value = item
+            if expires <= monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires = monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CacheKeyEncoder(NinjaJSONEncoder):
+    "Encodes any validated param value - equal values give equal keys"
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, Enum):
+            return o.value
+        if isinstance(o, (set, frozenset)):
+            return sorted(o, key=repr)
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()  # keeps microseconds
+        try:
+            return super().default(o)
+        except TypeError:
+            return repr(o)
+
+
+class ResponseCache:
+    """
+    Rendered responses of an operation (see cache_response)
+
+    Responses are stored in the django cache `cache` (None - only in memory)
+    with an in-process TTLCache in front of it. Entries expire `ttl` seconds
+    after they were rendered in both tiers.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60,
+        vary_on_headers: Sequence[str] = (),
+        vary_on_auth: bool = True,
+        cache: Optional[str] = "default",
+        local_ttl: Optional[float] = None,
+        local_maxsize: int = 1024,
+    ) -> None:
+        self.ttl = ttl
+        self.vary_on_headers = list(vary_on_headers)
+        self.vary_on_auth = vary_on_auth
+        self.cache_alias = cache
+        local_ttl = ttl if local_ttl is None else min(local_ttl, ttl)
+        self._local = TTLCache(maxsize=local_maxsize, ttl=local_ttl)
+
+    @property
+    def backend(self) -> Optional[BaseCache]:
+        if self.cache_alias is None:
+            return None
+        return caches[self.cache_alias]
+
+    def get_key(self, prefix: str, request: HttpRequest, values: DictStrAny) -> str:
+        "Cache key of validated operation params (+ vary headers and auth)"
+        from ninja.context import get_request_context
+
+        key_data: List[Any] = [values]
+        if self.vary_on_headers:
+            headers = get_request_context(request).headers
+            key_data.append([headers.get(name) for name in self.vary_on_headers])
+        if self.vary_on_auth:
+            # request.__dict__ - mocked requests have any attribute
+            auth = request.__dict__.get("auth")
+            key_data.append(str(getattr(auth, "pk", auth)))
+        data = json.dumps(key_data, sort_keys=True, cls=CacheKeyEncoder)
+        return f"ninja:response:{prefix}:{sha256(data.encode()).hexdigest()}"
+
+    def get(self, key: str) -> Optional[HttpResponse]:
+        entry = self._local.get(key)
+        if entry is None and self.backend is not None:
+            entry = self._set_local(key, self.backend.get(key))
+        return entry and self._to_response(entry)
+
+    def set(self, key: str, response: HttpResponseBase) -> None:
+        entry = self._to_entry(response)
+        if entry is None:
+            return
+        self._set_local(key, entry)
+        if self.backend is not None:
+            self.backend.set(key, entry, timeout=self.ttl)
+
+    async def aget(self, key: str) -> Optional[HttpResponse]:
+        from asgiref.sync import sync_to_async
+
+        entry = self._local.get(key)
+        if entry is None and self.backend is not None:
+            entry = await sync_to_async(self.backend.get)(key)
+            entry = self._set_local(key, entry)
+        return entry and self._to_response(entry)
+
+    async def aset(self, key: str, response: HttpResponseBase) -> None:
+        from asgiref.sync import sync_to_async
+
+        entry = self._to_entry(response)
+        if entry is None:
+            return
+        self._set_local(key, entry)
+        if self.backend is not None:
+            await sync_to_async(self.backend.set)(key, entry, timeout=self.ttl)
+
+    def clear(self) -> None:
+        "Clears in-process entries (backend entries expire after ttl)"
+        self._local.clear()
+
+    def _set_local(self, key: str, entry: Optional[Tuple]) -> Optional[Tuple]:
+        "Keeps backend entry in memory until it expires (expired entry is a miss)"
+        if entry is None:
+            return None
+        ttl = entry[0] - time()
+        if ttl <= 0:
+            return None
+        self._local.set(key, entry, ttl=min(self._local.ttl, ttl))
+        return entry
+
+    def _to_entry(self, response: HttpResponseBase) -> Optional[Tuple]:
+        "Only successful responses without cookies are cached"
+        if response.status_code != 200 or response.streaming or response.cookies:
+            return None
+        if self.vary_on_headers:
+            patch_vary_headers(response, self.vary_on_headers)
+        content = response.content  # type: ignore
+        return (
+            time() + self.ttl,
+            content,
+            response.status_code,
+            list(response.items()),
+        )
+
+    def _to_response(self, entry: Tuple) -> HttpResponse:
+        _, content, status, headers = entry
+        response = HttpResponse(content, status=status)
+        for name, value in headers:
+            response[name] = value
+        return response
+
+
+def cache_response(
+    ttl: float = 60,
+    *,
+    vary_on_headers: Sequence[str] = (),
+    vary_on_auth: bool = True,
+    cache: Optional[str] = "default",
+    local_ttl: Optional[float] = None,
+    local_maxsize: int = 1024,
+) -> Callable:
+    """
+    Caches rendered responses of a GET operation by its validated params:
+
+        @api.get("/countries", response=List[CountrySchema])
+        @cache_response(ttl=300)
+        def countries(request, region: str = None):
+            ...
+    """
+    response_cache = ResponseCache(
+        ttl=ttl,
+        vary_on_headers=vary_on_headers,
+        vary_on_auth=vary_on_auth,
+        cache=cache,
+        local_ttl=local_ttl,
+        local_maxsize=local_maxsize,
+    )
+
+    def decorator(func: Callable) -> Callable:
+        func._ninja_response_cache = response_cache  # type: ignore
+        return func
+
+    return decorator
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from django.conf import settings as django_settings
 from pydantic import BaseModel, Field
 
@@ -7,6 +9,11 @@ class Settings(BaseModel):
         "ninja.pagination.LimitOffsetPagination", alias="NINJA_PAGINATION_CLASS"
     )
     PAGINATION_PER_PAGE: int = Field(100, alias="NINJA_PAGINATION_PER_PAGE")
+    STREAM_CHUNK_SIZE: int = Field(2000, alias="NINJA_STREAM_CHUNK_SIZE")
+    SYNC_THREAD_POOL_SIZE: Optional[int] = Field(
+        None, alias="NINJA_SYNC_THREAD_POOL_SIZE"
+    )
+    BATCH_MAX_ITEMS: int = Field(50, alias="NINJA_BATCH_MAX_ITEMS")
 
     class Config:
         orm_mode = True
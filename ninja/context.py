@@ -0,0 +1,72 @@
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
+
+from django.http import HttpRequest
+
+from ninja.compatibility.request import HttpHeaders, get_headers
+from ninja.errors import HttpError
+from ninja.parser import Parser
+from ninja.types import DictStrAny
+
+if TYPE_CHECKING:
+    from ninja import NinjaAPI  # pragma: no cover
+
+__all__ = ["RequestContext", "get_request_context"]
+
+CONTEXT_ATTR = "_ninja_context"
+
+_missing = object()
+
+
+class RequestContext:
+    """
+    Request data parsed once and shared by auth classes, param models
+    and user code (e.g. signature auth that needs the parsed body)
+
+    Returned values are shared - do not modify them
+    """
+
+    def __init__(self, request: HttpRequest, parser: Parser) -> None:
+        self.request = request
+        self.parser = parser
+        self._headers: Optional[HttpHeaders] = None
+        self._body: Any = _missing
+        self._query: Dict[Tuple[str, ...], DictStrAny] = {}
+        # File(...) limit error found while reading the upload
+        self.upload_error: Optional[HttpError] = None
+
+    @property
+    def headers(self) -> HttpHeaders:
+        if self._headers is None:
+            self._headers = get_headers(self.request)
+        return self._headers
+
+    @property
+    def body(self) -> Any:
+        "Request body parsed with api parser (parsing errors are not cached)"
+        if self._body is _missing:
+            self._body = self.parser.parse_body(self.request)
+        return self._body
+
+    def query(self, list_fields: Sequence[str] = ()) -> DictStrAny:
+        "Query string as a dict, list_fields are returned as lists"
+        key = tuple(list_fields)
+        data = self._query.get(key)
+        if data is None:
+            data = self.parser.parse_querydict(
+                self.request.GET, list(list_fields), self.request
+            )
+            self._query[key] = data
+        return data
+
+
+def get_request_context(
+    request: HttpRequest, api: Optional["NinjaAPI"] = None
+) -> RequestContext:
+    "Returns context attached to the request (creates it on first call)"
+    # request.__dict__ - not getattr, mocked requests have any attribute
+    context = request.__dict__.get(CONTEXT_ATTR)
+    if context is None:
+        parser = api.parser if api is not None else Parser()
+        context = RequestContext(request, parser)
+        request.__dict__[CONTEXT_ATTR] = context
+    return context
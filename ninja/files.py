@@ -1,8 +1,31 @@
-from typing import Any, Callable, Iterable, Type
+import hashlib
+from tempfile import SpooledTemporaryFile
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Type,
+)
 
+from django.conf import settings
 from django.core.files.uploadedfile import UploadedFile as DjangoUploadedFile
+from django.core.files.uploadhandler import (
+    FileUploadHandler,
+    SkipFile,
+    StopFutureHandlers,
+)
 
-__all__ = ["UploadedFile"]
+from ninja.errors import ConfigError, HttpError
+
+if TYPE_CHECKING:
+    from ninja.context import RequestContext  # pragma: no cover
+
+__all__ = ["UploadedFile", "UploadLimits", "LimitedUploadHandler"]
 
 
 class UploadedFile(bytes):
@@ -15,3 +38,156 @@ class UploadedFile(bytes):
         if not isinstance(v, DjangoUploadedFile):
             raise ValueError(f"Expected UploadFile, received: {type(v)}")
         return v
+
+
+class UploadLimits:
+    """
+    Limits of a File(...) param
+
+    max_size - max size of each file (bytes)
+    max_files - max number of files
+    content_types - allowed content types ("image/png" or "image/*")
+    memory_size - files larger than this are spooled to a temporary file
+                  (default settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+    hash_algorithm - hashlib algorithm, file.hash is set to its hexdigest
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = None,
+        max_files: Optional[int] = None,
+        content_types: Optional[Iterable[str]] = None,
+        memory_size: Optional[int] = None,
+        hash_algorithm: Optional[str] = None,
+    ) -> None:
+        if hash_algorithm and hash_algorithm not in hashlib.algorithms_available:
+            raise ConfigError(f"Unknown hash algorithm '{hash_algorithm}'")
+        self.max_size = max_size
+        self.max_files = max_files
+        self.content_types: Optional[FrozenSet[str]] = None
+        if content_types is not None:
+            self.content_types = frozenset(content_types)
+        self.memory_size = memory_size
+        self.hash_algorithm = hash_algorithm
+
+    def check_count(self, field_name: str, count: int) -> Optional[HttpError]:
+        if self.max_files is not None and count > self.max_files:
+            return HttpError(
+                400, f"Too many files in '{field_name}' (max {self.max_files})"
+            )
+        return None
+
+    def check_content_type(
+        self, file_name: str, content_type: Optional[str]
+    ) -> Optional[HttpError]:
+        if not self.content_types or content_type in self.content_types:
+            return None
+        main_type = (content_type or "").split("/")[0]
+        if f"{main_type}/*" in self.content_types:
+            return None
+        return HttpError(
+            415, f"File '{file_name}' has unsupported content type '{content_type}'"
+        )
+
+    def check_size(self, file_name: str, size: int) -> Optional[HttpError]:
+        if self.max_size is not None and size > self.max_size:
+            return HttpError(
+                413, f"File '{file_name}' exceeds max size of {self.max_size} bytes"
+            )
+        return None
+
+    def validate(self, field_name: str, files: List[DjangoUploadedFile]) -> None:
+        "Checks files that were not read by LimitedUploadHandler"
+        error = self.check_count(field_name, len(files))
+        if error is not None:
+            raise error
+        for file in files:
+            name = str(file.name)
+            error = self.check_content_type(name, file.content_type)
+            error = error or self.check_size(name, file.size or 0)
+            if error is not None:
+                raise error
+            if self.hash_algorithm and not hasattr(file, "hash"):
+                hasher = hashlib.new(self.hash_algorithm)
+                for chunk in file.chunks():
+                    hasher.update(chunk)
+                file.seek(0)
+                file.hash = hasher.hexdigest()  # type: ignore
+
+
+class LimitedUploadHandler(FileUploadHandler):
+    """
+    Reads files of params with UploadLimits, checking the limits while the
+    request is read (files of other params are left to the next handlers)
+
+    Errors are stored in the request context and raised by FileModel
+    """
+
+    def __init__(
+        self, context: "RequestContext", limits: Dict[str, UploadLimits]
+    ) -> None:
+        super().__init__(context.request)
+        self.context = context
+        self.limits = limits
+        self.counts: Dict[str, int] = {}
+        self.current: Optional[UploadLimits] = None
+
+    def new_file(
+        self, field_name: str, file_name: str, content_type: str, *args: Any
+    ) -> None:
+        super().new_file(field_name, file_name, content_type, *args)
+        self.current = self.limits.get(field_name)
+        if self.current is None:
+            return
+        if self.context.upload_error is not None:
+            raise SkipFile()
+
+        limits = self.current
+        self.counts[field_name] = count = self.counts.get(field_name, 0) + 1
+        self._fail(
+            limits.check_count(field_name, count)
+            or limits.check_content_type(file_name, content_type)
+            or limits.check_size(file_name, self.content_length or 0)
+        )
+        memory_size = limits.memory_size
+        if memory_size is None:
+            memory_size = settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+        self.file = SpooledTemporaryFile(
+            max_size=memory_size, dir=settings.FILE_UPLOAD_TEMP_DIR
+        )
+        self.size = 0
+        self.hasher = limits.hash_algorithm and hashlib.new(limits.hash_algorithm)
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> Optional[bytes]:
+        if self.current is None:
+            return raw_data
+        self.size += len(raw_data)
+        self._fail(self.current.check_size(str(self.file_name), self.size))
+        if self.hasher:
+            self.hasher.update(raw_data)
+        self.file.write(raw_data)
+        return None
+
+    def file_complete(self, file_size: int) -> Optional[DjangoUploadedFile]:
+        if self.current is None:
+            return None
+        self.file.seek(0)
+        uploaded = DjangoUploadedFile(
+            file=self.file,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+        )
+        if self.hasher:
+            uploaded.hash = self.hasher.hexdigest()  # type: ignore
+        return uploaded
+
+    def _fail(self, error: Optional[HttpError]) -> None:
+        if error is not None:
+            self.context.upload_error = error
+            self.current = None
+            raise SkipFile()
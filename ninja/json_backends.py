@@ -0,0 +1,102 @@
+"""
+JSON encoding/decoding backends used by the default renderer and parser
+
+When `orjson` is installed it is used automatically, otherwise everything goes
+through the standard `json` module. Both backends produce `bytes` and encode
+the same extra types as `NinjaJSONEncoder` (datetime, Decimal, UUID, lazy
+translation strings, pydantic models).
+"""
+
+import json
+import math
+from typing import Any, Union
+
+from pydantic import BaseModel
+
+from ninja.responses import NinjaJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+__all__ = [
+    "JSONBackend",
+    "StdlibJSONBackend",
+    "OrjsonBackend",
+    "get_default_json_backend",
+]
+
+
+class JSONBackend:
+    def dumps(self, data: Any) -> bytes:
+        raise NotImplementedError("Please implement .dumps() method")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        raise NotImplementedError("Please implement .loads() method")
+
+
+class StdlibJSONBackend(JSONBackend):
+    "Standard library json with NinjaJSONEncoder"
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, cls=NinjaJSONEncoder).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    orjson based backend
+
+    Dates and times are passed to NinjaJSONEncoder so they are formatted
+    exactly like DjangoJSONEncoder does. Whatever orjson refuses to encode
+    (integers over 64 bits, tuple subclasses, ...) is encoded with the
+    standard library backend instead, so is data with NaN/Infinity floats
+    (orjson writes them as null). Invalid input is decoded with the
+    standard library too, so error messages (and accepted documents,
+    e.g. NaN) stay the same.
+    """
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        self._encoder = NinjaJSONEncoder()
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        self._fallback = StdlibJSONBackend()
+
+    def dumps(self, data: Any) -> bytes:
+        try:
+            content = orjson.dumps(
+                data, default=self._encoder.default, option=self._options
+            )
+        except TypeError:
+            return self._fallback.dumps(data)
+        if b"null" in content and _has_non_finite(data):
+            return self._fallback.dumps(data)
+        return content
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            return self._fallback.loads(data)
+
+
+def _has_non_finite(data: Any) -> bool:
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    if isinstance(data, BaseModel):
+        return _has_non_finite(data.dict())
+    return False
+
+
+def get_default_json_backend() -> JSONBackend:
+    if orjson is not None:
+        return OrjsonBackend()
+    return StdlibJSONBackend()
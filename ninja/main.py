@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import Executor
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,6 +16,7 @@ from typing import (
 from django.http import HttpRequest, HttpResponse
 from django.urls import URLPattern, URLResolver, reverse
 
+from ninja.batch import get_batch_url
 from ninja.constants import NOT_SET
 from ninja.errors import ConfigError, set_default_exc_handlers
 from ninja.openapi import get_schema
@@ -23,6 +25,7 @@ from ninja.openapi.urls import get_openapi_urls, get_root_url
 from ninja.parser import Parser
 from ninja.renderers import BaseRenderer, JSONRenderer
 from ninja.router import Router
+from ninja.routing import RouteTreePattern
 from ninja.types import TCallable
 from ninja.utils import is_debug_server, normalize_path
 
@@ -51,6 +54,10 @@ class NinjaAPI:
         auth: Union[Sequence[Callable], Callable, object] = NOT_SET,
         renderer: Optional[BaseRenderer] = None,
         parser: Optional[Parser] = None,
+        validate_response: Union[bool, float] = True,
+        route_tree: bool = False,
+        sync_executor: Union[str, Executor] = "thread_sensitive",
+        batch_url: Optional[str] = None,
     ):
         self.title = title
         self.version = version
@@ -61,6 +68,10 @@ class NinjaAPI:
         self.csrf = csrf
         self.renderer = renderer or JSONRenderer()
         self.parser = parser or Parser()
+        self.validate_response = validate_response
+        self.route_tree = route_tree
+        self.sync_executor = sync_executor
+        self.batch_url = batch_url
 
         self._exception_handlers: Dict[Exc, ExcHandler] = {}
         self.set_default_exception_handlers()
@@ -90,6 +101,13 @@ class NinjaAPI:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.default_router.get(
             path,
@@ -106,6 +124,13 @@ class NinjaAPI:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def post(
@@ -125,6 +150,13 @@ class NinjaAPI:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.default_router.post(
             path,
@@ -141,6 +173,13 @@ class NinjaAPI:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def delete(
@@ -160,6 +199,13 @@ class NinjaAPI:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.default_router.delete(
             path,
@@ -176,6 +222,13 @@ class NinjaAPI:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def patch(
@@ -195,6 +248,13 @@ class NinjaAPI:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.default_router.patch(
             path,
@@ -211,6 +271,13 @@ class NinjaAPI:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def put(
@@ -230,6 +297,13 @@ class NinjaAPI:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.default_router.put(
             path,
@@ -246,6 +320,13 @@ class NinjaAPI:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def api_operation(
@@ -266,6 +347,13 @@ class NinjaAPI:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.default_router.api_operation(
             methods,
@@ -283,6 +371,13 @@ class NinjaAPI:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def add_router(
@@ -322,9 +417,18 @@ class NinjaAPI:
     def _get_urls(self) -> List[Union[URLResolver, URLPattern]]:
         result = get_openapi_urls(self)
 
+        paths = []
         for prefix, router in self._routers:
             for path in router.urls_paths(prefix):
-                result.append(path)
+                paths.append(path)
+
+        operation_patterns: List[Union[URLResolver, URLPattern]] = list(paths)
+        if self.route_tree:
+            # tree resolves operations, regular patterns are kept for reverse()
+            operation_patterns.insert(0, RouteTreePattern(paths))
+        if self.batch_url:
+            result.append(get_batch_url(self, operation_patterns))
+        result.extend(operation_patterns)
 
         result.append(get_root_url(self))
         return result
@@ -338,10 +442,13 @@ class NinjaAPI:
         self, request: HttpRequest, data: Any, *, status: int = 200
     ) -> HttpResponse:
         content = self.renderer.render(request, data, response_status=status)
-        content_type = "{}; charset={}".format(
-            self.renderer.media_type, self.renderer.charset
+        return HttpResponse(
+            content, status=status, content_type=self.get_content_type()
         )
-        return HttpResponse(content, status=status, content_type=content_type)
+
+    def get_content_type(self, renderer: Optional[BaseRenderer] = None) -> str:
+        renderer = renderer or self.renderer
+        return "{}; charset={}".format(renderer.media_type, renderer.charset)
 
     def get_openapi_schema(self, path_prefix: Optional[str] = None) -> OpenAPISchema:
         if path_prefix is None:
@@ -234,6 +234,10 @@ class OpenAPISchema(dict):
     def responses(self, operation: Operation) -> Dict[int, DictStrAny]:
         assert bool(operation.response_models), f"{operation.response_models} empty"
 
+        media_type = "application/json"
+        if operation.renderer is not None and operation.renderer.media_type:
+            media_type = operation.renderer.media_type
+
         result = {}
         for status, model in operation.response_models.items():
 
@@ -247,7 +251,7 @@ class OpenAPISchema(dict):
                 schema = self._create_schema_from_model(
                     model, by_alias=operation.by_alias
                 )[0]
-                details[status]["content"] = {"application/json": {"schema": schema}}
+                details[status]["content"] = {media_type: {"schema": schema}}
             result.update(details)
 
         return result
@@ -1,12 +1,18 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from inspect import isawaitable
+from random import random
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -15,13 +21,34 @@ from typing import (
 
 import django
 import pydantic
-from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.exceptions import SynchronousOnlyOperation
+from django.db.models import Manager, QuerySet
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    StreamingHttpResponse,
+)
 from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, set_response_etag
+from django.utils.http import quote_etag
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SEQUENCE, ModelField
 
+from ninja.cache import ResponseCache
+from ninja.conf import settings
 from ninja.constants import NOT_SET
+from ninja.context import get_request_context
 from ninja.errors import ConfigError, ValidationError
+from ninja.files import LimitedUploadHandler, UploadLimits
+from ninja.orm.projection import project_queryset
+from ninja.orm.related import get_item_schema, optimize_queryset
 from ninja.params_models import TModels
-from ninja.schema import Schema
+from ninja.renderers import BaseRenderer, JSONRenderer
+from ninja.schema import DjangoGetter, Schema
+from ninja.security.base import AuthBase
+from ninja.serializers import SchemaSerializer
 from ninja.signature import ViewSignature, is_async
 from ninja.types import DictStrAny
 from ninja.utils import check_csrf
@@ -31,6 +58,11 @@ if TYPE_CHECKING:
 
 __all__ = ["Operation", "PathView", "ResponseObject"]
 
+STREAM_SHAPES = (SHAPE_LIST, SHAPE_SEQUENCE)
+SYNC_EXECUTORS = ("thread_sensitive", "thread_pool")
+UNAUTHORIZED = {"detail": "Unauthorized"}
+SAFE_METHODS = ("GET", "HEAD")
+
 
 class Operation:
     def __init__(
@@ -51,6 +83,13 @@ class Operation:
         exclude_defaults: bool = False,
         exclude_none: bool = False,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> None:
         self.is_async = False
         self.path: str = path
@@ -79,6 +118,13 @@ class Operation:
         self.tags = tags
         self.deprecated = deprecated
         self.include_in_schema = include_in_schema
+        self.stream = stream
+        self.etag = etag
+        self.auto_related = auto_related
+        self.only_fields = only_fields
+        self.renderer = renderer
+        self.validate_response = validate_response
+        self.sync_executor = sync_executor
 
         # Exporting models params
         self.by_alias = by_alias
@@ -86,14 +132,54 @@ class Operation:
         self.exclude_defaults = exclude_defaults
         self.exclude_none = exclude_none
 
+        # execution plan (see _compile), built once the api instance is known
+        self._checks: List[Callable[[HttpRequest], Optional[HttpResponse]]] = []
+        self._auth_plan: List[Tuple[Callable, Optional[Callable]]] = []
+        self._unauthorized_body: Optional[Tuple[Any, str]] = None
+        self._param_models: List[Tuple[Any, Tuple[str], Dict[Tuple, Tuple]]] = []
+        self._default_status: int = 200
+        self._validate_rate: float = 1.0
+        self._response_fields: Dict[Any, Tuple[ModelField, Callable, Callable]] = {}
+        self._renderer: BaseRenderer = cast(BaseRenderer, None)
+        self._sync_executor: Union[str, Executor] = "thread_sensitive"
+        self._async_runner: Optional[Callable] = None
+        self._content_type: Optional[str] = None
+        self._stream_fields: Dict[Any, Tuple[ModelField, Callable, Callable]] = {}
+        self._etag_func: Optional[Callable] = None
+        self._response_cache: Optional[ResponseCache] = None
+        self._cache_prefix: str = ""
+        self._related_schemas: Dict[Any, Type[BaseModel]] = {}
+        self._only_schemas: Dict[Any, Type[BaseModel]] = {}
+
+        # decorators (e.g. @paginate) can adjust the operation
+        contribute = getattr(view_func, "_ninja_contribute_to_operation", None)
+        if contribute is not None:
+            contribute(self)
+
     def run(self, request: HttpRequest, **kw: Any) -> HttpResponseBase:
+        get_request_context(request, self.api)  # parsing with api parser
         error = self._run_checks(request)
         if error:
             return error
         try:
+            etag = self._get_etag(request, kw)
+            if etag is not None:
+                not_modified = self._not_modified(request, etag)
+                if not_modified is not None:
+                    return not_modified
             values = self._get_values(request, kw)
-            result = self.view_func(request, **values)
-            return self._result_to_response(request, result)
+            response: Optional[HttpResponseBase] = None
+            cache_key = self._get_cache_key(request, values)
+            if cache_key is not None:
+                response = self._cache.get(cache_key)
+            if response is None:
+                result = self.view_func(request, **values)
+                response = self._result_to_response(request, result)
+                if cache_key is not None:
+                    self._cache.set(cache_key, response)
+            if self.etag:
+                response = self._conditional_response(request, response, etag)
+            return response
         except Exception as e:
             if isinstance(e, TypeError) and "required positional argument" in str(e):
                 msg = "Did you fail to use functools.wraps() in a decorator?"
@@ -113,6 +199,165 @@ class Operation:
             if router.tags is not None:
                 self.tags = router.tags
 
+        self._sync_executor = self.api.sync_executor
+        for executor in (self.sync_executor, router.sync_executor):
+            if executor is not NOT_SET:
+                self._sync_executor = executor
+                break
+
+        self._compile()
+
+    def _compile(self) -> None:
+        """
+        Precomputes everything that does not depend on the request,
+        so that per-request path only does the work this operation needs
+        """
+        # auth callbacks with the presence check of their credential
+        self._auth_plan = []
+        header_auth_only = bool(self.auth_callbacks)
+        for callback in self.auth_callbacks:
+            check = None
+            if isinstance(callback, AuthBase):
+                check = callback._get_credential_check()
+            header_auth_only = header_auth_only and bool(check and check[0] == "header")
+            self._auth_plan.append((callback, check and check[1]))
+
+        self._upload_limits: Dict[str, UploadLimits] = {}
+        for model in self.models:
+            self._upload_limits.update(getattr(model, "_upload_limits", {}))
+
+        self._checks = []
+        if self._upload_limits:  # must be set before request.FILES is read
+            self._checks.append(self._set_upload_handler)
+        if self._auth_plan:
+            self._checks.append(self._run_authentication)
+        # browsers never add auth headers on their own - no csrf needed
+        if self.api.csrf and not header_auth_only:
+            self._checks.append(self._run_csrf)
+
+        self._param_models = []
+        for model in self.models:
+            source = model._param_source
+            error_locs = {
+                loc: (source,) + mapped
+                for loc, mapped in model._flatten_map_reverse.items()
+            }
+            self._param_models.append((model, (source,), error_locs))
+
+        self._renderer = self.renderer or self.api.renderer
+        stream = self.stream or self._renderer.streaming
+
+        self._default_status = 200
+        if len(self.response_models) == 1:
+            self._default_status = next(iter(self.response_models))
+
+        validate_response = self.validate_response
+        if validate_response is NOT_SET:
+            validate_response = self.api.validate_response
+        self._validate_rate = float(validate_response)
+        if not 0 <= self._validate_rate <= 1:
+            raise ConfigError(
+                f"validate_response must be a bool or a rate between 0 and 1 ({self.view_func})"
+            )
+
+        serializer = SchemaSerializer(
+            by_alias=self.by_alias,
+            exclude_unset=self.exclude_unset,
+            exclude_defaults=self.exclude_defaults,
+            exclude_none=self.exclude_none,
+        )
+        self._response_fields = {}
+        self._stream_fields = {}
+        for status, model in self.response_models.items():
+            if model is not None and model is not NOT_SET:
+                field = model.__fields__["response"]
+                self._response_fields[status] = (
+                    field,
+                    serializer.for_field(field),
+                    serializer.for_trusted_field(field, model),
+                )
+                if stream and field.shape in STREAM_SHAPES:
+                    item_field = cast(List[ModelField], field.sub_fields)[0]
+                    self._stream_fields[status] = (
+                        item_field,
+                        serializer.for_field(item_field),
+                        serializer.for_trusted_field(item_field, model),
+                    )
+        # schemas whose relations are selected/prefetched for queryset results
+        # and schemas whose columns are the only ones loaded (only_fields)
+        self._related_schemas = {}
+        self._only_schemas = {}
+        for status, (field, _, _) in self._response_fields.items():
+            schema = get_item_schema(field)
+            if schema is None:
+                continue
+            if self.auto_related:
+                self._related_schemas[status] = schema
+            if self.only_fields:
+                self._only_schemas[status] = schema
+
+        if self.stream and not self._stream_fields:
+            raise ConfigError(
+                f"stream=True requires a List[...] response schema ({self.view_func})"
+            )
+
+        self._etag_func = None
+        if callable(self.etag):
+            self._etag_func = self.etag
+        elif not isinstance(self.etag, bool):
+            raise ConfigError(f"etag must be a bool or a callable ({self.view_func})")
+
+        # @cache_response
+        self._response_cache = getattr(self.view_func, "_ninja_response_cache", None)
+        if self._response_cache is not None:
+            operation_id = self.operation_id or self.api.get_openapi_operation_id(self)
+            self._cache_prefix = f"{self.api.urls_namespace}:{operation_id}"
+
+        executor = self._sync_executor
+        if executor not in SYNC_EXECUTORS and not isinstance(executor, Executor):
+            raise ConfigError(
+                f"sync_executor must be one of {SYNC_EXECUTORS} or an Executor instance"
+            )
+        self._async_runner = None
+
+        from ninja.main import NinjaAPI
+
+        # responses are created directly unless api overrides create_response
+        default_create_response = (
+            type(self.api).create_response is NinjaAPI.create_response
+        )
+        self._content_type = None
+        if self.renderer is not None or default_create_response:
+            self._content_type = self.api.get_content_type(self._renderer)
+
+        self._unauthorized_body = None
+        if default_create_response and (
+            type(self.api.renderer).render is JSONRenderer.render
+        ):
+            content = self.api.renderer.render(
+                cast(HttpRequest, None), UNAUTHORIZED, response_status=401
+            )
+            self._unauthorized_body = (content, self.api.get_content_type())
+
+    async def run_in_executor(
+        self, request: HttpRequest, *a: Any, **kw: Any
+    ) -> HttpResponseBase:
+        "Runs sync operation from an async view (see sync_executor option)"
+        if self._async_runner is None:
+            self._async_runner = self._create_async_runner()
+        return await self._async_runner(request, *a, **kw)  # type: ignore
+
+    def _create_async_runner(self) -> Callable:
+        executor = self._sync_executor
+        if executor == "thread_sensitive":
+            return cast(Callable, sync_to_async(self.run))
+        if executor == "thread_pool":
+            executor = _get_thread_pool()
+        pool = cast(ThreadPoolExecutor, executor)
+        return cast(
+            Callable, sync_to_async(self.run, thread_sensitive=False, executor=pool)
+        )
+
     def _set_auth(
         self, auth: Optional[Union[Sequence[Callable], Callable, object]]
     ) -> None:
@@ -121,31 +366,48 @@ class Operation:
 
     def _run_checks(self, request: HttpRequest) -> Optional[HttpResponse]:
         "Runs security checks for each operation"
-        # auth:
-        if self.auth_callbacks:
-            error = self._run_authentication(request)
-            if error:
-                return error
-
-        # csrf:
-        if self.api.csrf:
-            error = check_csrf(request, self.view_func)
+        for check in self._checks:
+            error = check(request)
             if error:
                 return error
+        return None
 
+    def _set_upload_handler(self, request: HttpRequest) -> Optional[HttpResponse]:
+        if "_files" not in request.__dict__:  # otherwise limits are checked later
+            context = get_request_context(request, self.api)
+            handler = LimitedUploadHandler(context, self._upload_limits)
+            request.upload_handlers.insert(0, handler)
         return None
 
+    def _run_csrf(self, request: HttpRequest) -> Optional[HttpResponse]:
+        return check_csrf(request, self.view_func)
+
+    def _auth_candidates(self, request: HttpRequest) -> Iterator[Callable]:
+        "Auth callbacks that can authenticate the request (have its credential)"
+        for callback, has_credential in self._auth_plan:
+            if has_credential is None or has_credential(request):
+                yield callback
+
     def _run_authentication(self, request: HttpRequest) -> Optional[HttpResponse]:
-        for callback in self.auth_callbacks:
+        for callback in self._auth_candidates(request):
             try:
                 result = callback(request)
+                if isawaitable(result):
+                    # async authenticate()/__call__ used with a sync operation
+                    result = async_to_sync(_await)(result)
             except Exception as exc:
                 return self.api.on_exception(request, exc)
 
             if result:
                 request.auth = result  # type: ignore
                 return None
-        return self.api.create_response(request, {"detail": "Unauthorized"}, status=401)
+        return self._unauthorized(request)
+
+    def _unauthorized(self, request: HttpRequest) -> HttpResponse:
+        if self._unauthorized_body is not None:
+            content, content_type = self._unauthorized_body
+            return HttpResponse(content, status=401, content_type=content_type)
+        return self.api.create_response(request, UNAUTHORIZED, status=401)
 
     def _result_to_response(
         self, request: HttpRequest, result: Any
@@ -159,55 +421,148 @@ class Operation:
         if isinstance(result, HttpResponseBase):
             return result
 
-        status: int = 200
-        if len(self.response_models) == 1:
-            status = list(self.response_models.keys())[0]
+        status: int = self._default_status
 
         if isinstance(result, tuple) and len(result) == 2:
             status = result[0]
             result = result[1]
 
-        if status in self.response_models:
-            response_model = self.response_models[status]
-        elif Ellipsis in self.response_models:
-            response_model = self.response_models[Ellipsis]
-        else:
-            raise ConfigError(
-                f"Schema for status {status} is not set in response {self.response_models.keys()}"
-            )
+        status_key: Any = status
+        if status not in self.response_models:
+            if Ellipsis not in self.response_models:
+                raise ConfigError(
+                    f"Schema for status {status} is not set in response {self.response_models.keys()}"
+                )
+            status_key = Ellipsis
+        response_model = self.response_models[status_key]
 
         if response_model is NOT_SET:
-            return self.api.create_response(request, result, status=status)
+            return self._create_response(request, result, status)
 
         if response_model is None:
             return HttpResponse(status=status)
             # TODO: ^ maybe self.api.create_empty_response ?
             # return self.api.create_response(request, result, status=status)
 
-        resp_object = ResponseObject(result)
-        # ^ we need object because getter_dict seems work only with from_orm
-        result = response_model.from_orm(resp_object).dict(
-            by_alias=self.by_alias,
-            exclude_unset=self.exclude_unset,
-            exclude_defaults=self.exclude_defaults,
-            exclude_none=self.exclude_none,
-        )["response"]
-        return self.api.create_response(request, result, status=status)
+        if status_key in self._related_schemas:
+            result = optimize_queryset(result, self._related_schemas[status_key])
+
+        if status_key in self._only_schemas:
+            result = project_queryset(result, self._only_schemas[status_key])
+
+        if status_key in self._stream_fields:
+            return self._stream_response(request, result, status, status_key)
+
+        field, serialize, serialize_trusted = self._response_fields[status_key]
+        if not self._should_validate():
+            return self._create_response(request, serialize_trusted(result), status)
+
+        result = DjangoGetter.convert_result(result)
+        result, errors = field.validate(result, {}, loc=field.alias, cls=response_model)
+        if errors:
+            raise pydantic.ValidationError([errors], response_model)
+        result = serialize(result)
+        return self._create_response(request, result, status)
+
+    @property
+    def _cache(self) -> ResponseCache:
+        return cast(ResponseCache, self._response_cache)
+
+    def _get_cache_key(self, request: HttpRequest, values: DictStrAny) -> Optional[str]:
+        "Response cache key of GET requests (if operation uses @cache_response)"
+        if self._response_cache is None or request.method not in SAFE_METHODS:
+            return None
+        return self._response_cache.get_key(self._cache_prefix, request, values)
+
+    def _get_etag(self, request: HttpRequest, path_params: Any) -> Any:
+        "Version from etag=callable (evaluated before the view)"
+        if self._etag_func is None or request.method not in SAFE_METHODS:
+            return None
+        return self._etag_func(request, **path_params)
+
+    def _not_modified(
+        self, request: HttpRequest, version: Any
+    ) -> Optional[HttpResponse]:
+        "304 (or 412 on failed If-Match) when the version matches the request"
+        etag = quote_etag(str(version))
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            response["ETag"] = etag
+        return response
+
+    def _conditional_response(
+        self, request: HttpRequest, response: HttpResponseBase, version: Any
+    ) -> HttpResponseBase:
+        """
+        Sets ETag of successful GET responses - the version from etag=callable
+        or a hash of the rendered body - and answers If-None-Match with 304
+        """
+        if request.method not in SAFE_METHODS or response.status_code != 200:
+            return response
+        if version is not None:
+            response["ETag"] = quote_etag(str(version))
+        elif not response.has_header("ETag"):
+            set_response_etag(response)  # streaming and empty responses are skipped
+        etag = response.get("ETag")
+        if etag is None:
+            return response
+        return get_conditional_response(request, etag=etag, response=response)  # type: ignore
+
+    def _should_validate(self) -> bool:
+        "validate_response can be a rate - to validate only some responses"
+        rate = self._validate_rate
+        return rate >= 1 or (rate > 0 and random() < rate)
+
+    def _create_response(
+        self, request: HttpRequest, data: Any, status: int
+    ) -> HttpResponse:
+        if self._content_type is None:
+            return self.api.create_response(request, data, status=status)
+        content = self._renderer.render(request, data, response_status=status)
+        return HttpResponse(content, status=status, content_type=self._content_type)
+
+    def _stream_response(
+        self, request: HttpRequest, result: Any, status: int, status_key: Any
+    ) -> StreamingHttpResponse:
+        """
+        Validates and serializes items one by one while the response is sent,
+        querysets are fetched from the database in chunks
+        """
+        response_model = self.response_models[status_key]
+        field, serialize, serialize_trusted = self._stream_fields[status_key]
+        validate = self._should_validate()
+        if isinstance(result, Manager):
+            result = result.all()
+        if isinstance(result, getattr(QuerySet, "__origin__", QuerySet)):
+            result = result.iterator(chunk_size=settings.STREAM_CHUNK_SIZE)  # type: ignore
+
+        def items() -> Iterator[Any]:
+            for index, item in enumerate(result):
+                if not validate:
+                    yield serialize_trusted(item)
+                    continue
+                value, errors = field.validate(
+                    item, {}, loc=("response", index), cls=response_model
+                )
+                if errors:
+                    raise pydantic.ValidationError([errors], response_model)
+                yield serialize(value)
+
+        renderer = self._renderer
+        content = renderer.render_stream(request, items(), response_status=status)
+        content_type = self._content_type or self.api.get_content_type(renderer)
+        return StreamingHttpResponse(content, status=status, content_type=content_type)
 
     def _get_values(self, request: HttpRequest, path_params: Any) -> DictStrAny:
         values, errors = {}, []
-        for model in self.models:
+        for model, source, error_locs in self._param_models:
             try:
                 data = model.resolve(request, self.api, path_params)
                 values.update(data)
             except pydantic.ValidationError as e:
-                items = []
                 for i in e.errors():
-                    i["loc"] = (model._param_source,) + model._flatten_map_reverse.get(
-                        i["loc"], i["loc"]
-                    )
-                    items.append(dict(i))
-                errors.extend(items)
+                    i["loc"] = error_locs.get(i["loc"]) or source + i["loc"]
+                    errors.append(dict(i))
         if errors:
             raise ValidationError(errors)
         return values
@@ -235,18 +590,97 @@ class AsyncOperation(Operation):
             raise Exception("Async operations are supported only with Django 3.1+")
         super().__init__(*args, **kwargs)
         self.is_async = True
+        # sync auth callbacks that turned out to use the database
+        self._threaded_auth_callbacks: Set[int] = set()
 
     async def run(self, request: HttpRequest, **kw: Any) -> HttpResponseBase:  # type: ignore
-        error = self._run_checks(request)
+        get_request_context(request, self.api)  # parsing with api parser
+        error = await self._run_checks(request)
         if error:
             return error
         try:
+            etag = self._get_etag(request, kw)
+            if isawaitable(etag):
+                etag = await etag
+            if etag is not None:
+                not_modified = self._not_modified(request, etag)
+                if not_modified is not None:
+                    return not_modified
             values = self._get_values(request, kw)
-            result = await self.view_func(request, **values)
-            return self._result_to_response(request, result)
+            response: Optional[HttpResponseBase] = None
+            cache_key = self._get_cache_key(request, values)
+            if cache_key is not None:
+                response = await self._cache.aget(cache_key)
+            if response is None:
+                result = await self.view_func(request, **values)
+                response = self._result_to_response(request, result)
+                if cache_key is not None:
+                    await self._cache.aset(cache_key, response)
+            if self.etag:
+                response = self._conditional_response(request, response, etag)
+            return response
         except Exception as e:
             return self.api.on_exception(request, e)
 
+    async def _run_checks(self, request: HttpRequest) -> Optional[HttpResponse]:  # type: ignore
+        for check in self._checks:
+            error = check(request)
+            if isawaitable(error):
+                error = await error
+            if error:
+                return error
+        return None
+
+    async def _run_authentication(self, request: HttpRequest) -> Optional[HttpResponse]:  # type: ignore
+        for callback in self._auth_candidates(request):
+            try:
+                result = await self._call_auth_callback(callback, request)
+            except Exception as exc:
+                return self.api.on_exception(request, exc)
+
+            if result:
+                request.auth = result  # type: ignore
+                return None
+        return self._unauthorized(request)
+
+    async def _call_auth_callback(
+        self, callback: Callable, request: HttpRequest
+    ) -> Any:
+        """
+        Async callbacks are awaited, sync ones are called directly - unless they
+        access the database, then they are (from now on) run in a thread
+        """
+        if id(callback) in self._threaded_auth_callbacks:
+            result = await sync_to_async(callback)(request)
+        else:
+            try:
+                result = callback(request)
+            except SynchronousOnlyOperation:
+                self._threaded_auth_callbacks.add(id(callback))
+                result = await sync_to_async(callback)(request)
+
+        if isawaitable(result):
+            result = await result
+        return result
+
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_thread_pool() -> ThreadPoolExecutor:
+    "Thread pool shared by all operations with sync_executor='thread_pool'"
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=settings.SYNC_THREAD_POOL_SIZE,
+            thread_name_prefix="ninja-sync",
+        )
+    return _thread_pool
+
+
+async def _await(awaitable: Awaitable) -> Any:
+    return await awaitable
+
 
 class PathView:
     def __init__(self) -> None:
@@ -273,6 +707,13 @@ class PathView:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Operation:
         if url_name:
             self.url_name = url_name
@@ -298,6 +739,13 @@ class PathView:
             exclude_defaults=exclude_defaults,
             exclude_none=exclude_none,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
         self.operations.append(operation)
@@ -327,15 +775,13 @@ class PathView:
     async def _async_view(
         self, request: HttpRequest, *a: Any, **kw: Any
     ) -> HttpResponse:
-        from asgiref.sync import sync_to_async
-
         operation, error = self._find_operation(request)
         if error:
             return error
         if operation.is_async:
             return await operation.run(request, *a, **kw)  # type: ignore
         else:
-            return await sync_to_async(operation.run)(request, *a, **kw)  # type: ignore
+            return await operation.run_in_executor(request, *a, **kw)  # type: ignore
 
     def _find_operation(
         self, request: HttpRequest
@@ -52,13 +52,16 @@ class SchemaFactory:
             return self.schemas[key]
 
         definitions = {}
+        django_fields = {}
         for fld in self._selected_model_fields(model, fields, exclude):
             python_type, field_info = get_schema_field(fld, depth=depth)
             definitions[fld.name] = (python_type, field_info)
+            django_fields[fld.name] = fld
 
         if custom_fields:
             for fld_name, python_type, field_info in custom_fields:
                 definitions[fld_name] = (python_type, field_info)
+                django_fields.pop(fld_name, None)
 
         if name in self.schema_names:
             name = self._get_unique_name(name)
@@ -72,6 +75,8 @@ class SchemaFactory:
                 **definitions,  # type: ignore
             ),
         )
+        # model metadata of schema fields (see ninja.schema.get_converters)
+        schema.__django_fields__ = django_fields  # type: ignore
         self.schemas[key] = schema
         self.schema_names.add(name)
         return schema
@@ -1,6 +1,7 @@
 import datetime
 from decimal import Decimal
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -18,7 +19,8 @@ from django.db.models.fields import Field
 from pydantic import IPvAnyAddress
 from pydantic.fields import FieldInfo, Undefined
 
-from ninja.openapi.schema import OpenAPISchema
+if TYPE_CHECKING:
+    from ninja.openapi.schema import OpenAPISchema  # pragma: no cover
 
 __all__ = ["create_m2m_link_type", "get_schema_field", "get_related_field_schema"]
 
@@ -148,7 +150,7 @@ def get_schema_field(field: Field, *, depth: int = 0) -> Tuple:
 
 
 @no_type_check
-def get_related_field_schema(field: Field, *, depth: int) -> Tuple[OpenAPISchema]:
+def get_related_field_schema(field: Field, *, depth: int) -> Tuple["OpenAPISchema"]:
     from ninja.orm import create_schema
 
     model = field.related_model
@@ -0,0 +1,129 @@
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Type
+
+from django.db.models import FileField, Manager, Model, QuerySet
+from django.db.models.query import ModelIterable
+from pydantic import BaseModel
+
+from ninja.orm.related import _get_relations, get_item_schema
+
+__all__ = ["get_projection", "project_queryset"]
+
+# only() lookups, values() names (None - model instances are needed) and
+# names that are not model attributes (annotations or missing attributes)
+Projection = Tuple[Tuple[str, ...], Optional[Tuple[str, ...]], Tuple[str, ...]]
+
+_Path = FrozenSet[Tuple[Type[BaseModel], Type[Model]]]
+
+
+@lru_cache(maxsize=None)
+def get_projection(schema: Type[BaseModel], model: Type[Model]) -> Optional[Projection]:
+    """
+    Columns of `model` that `schema` reads (nested schemas of foreign keys
+    and one-to-one relations are followed)
+
+    None if schema reads properties or methods - the columns they use are unknown
+    """
+    path = frozenset([(schema, model)])
+    result = _collect_columns(schema, model, "", path)
+    if result is None:
+        return None
+    only, values_ok, unknown = result
+    values = None
+    if values_ok:
+        values = tuple(
+            f.alias for f in schema.__fields__.values() if f.alias not in unknown
+        )
+    return tuple(only), values, tuple(unknown)
+
+
+def project_queryset(
+    items: Any, schema: Type[BaseModel], required: Sequence[str] = ()
+) -> Any:
+    """
+    Loads only the columns `schema` reads (+ `required` fields) - with
+    .values() if no model instances are needed, otherwise with .only()
+    """
+    if isinstance(items, Manager):
+        items = items.all()
+    if not isinstance(items, QuerySet) or items._iterable_class is not ModelIterable:
+        return items
+    if items._result_cache is not None:
+        return items  # evaluated by the view - a new query would lose its changes
+    query = items.query
+    if query.deferred_loading != (frozenset(), True) or query.select_related is True:
+        return items  # already projected or all relations selected
+    projection = get_projection(schema, items.model)  # type: ignore
+    if projection is None:
+        return items
+    only, values, unknown = projection
+    if (
+        values is not None
+        and not query.select_related
+        and not items._prefetch_related_lookups  # type: ignore
+    ):
+        annotations = [name for name in unknown if name in query.annotations]
+        names = dict.fromkeys([*values, *annotations, *required])
+        return items.values(*names)
+
+    lookups = list(only) + list(required)
+    select_related = query.select_related or {}
+    for path in _select_related_paths(select_related):
+        if not any(
+            lookup == path or lookup.startswith(path + "__") for lookup in lookups
+        ):
+            lookups.append(path)  # relation not read by schema - all columns
+    return items.only(*dict.fromkeys(lookups))
+
+
+def _collect_columns(
+    schema: Type[BaseModel], model: Type[Model], prefix: str, path: _Path
+) -> Optional[Tuple[List[str], bool, List[str]]]:
+    concrete: Dict[str, Any] = {"pk": model._meta.pk}
+    for column in model._meta.concrete_fields:
+        concrete[column.name] = concrete[column.attname] = column
+    relations = _get_relations(model)
+
+    only: List[str] = []
+    unknown: List[str] = []
+    values_ok = True
+    for field in schema.__fields__.values():
+        name = field.alias
+        relation = relations.get(name)
+        if relation is not None:
+            values_ok = False
+            related_model, many = relation
+            if many:
+                continue  # prefetched with another query
+            lookup = prefix + name
+            nested = get_item_schema(field)
+            result = None
+            if nested is not None and (nested, related_model) not in path:
+                nested_path = path | {(nested, related_model)}
+                result = _collect_columns(
+                    nested, related_model, lookup + "__", nested_path
+                )
+            if result is None or not result[0]:
+                only.append(lookup)
+            else:
+                only.extend(result[0])
+            continue
+
+        model_field = concrete.get(name)
+        if model_field is not None:
+            only.append(prefix + model_field.name)
+            if isinstance(model_field, FileField):
+                values_ok = False  # values are not FieldFile instances
+            continue
+        if hasattr(model, name):
+            return None  # property or method
+        unknown.append(name)
+    return only, values_ok, unknown
+
+
+def _select_related_paths(
+    select_related: Dict[str, Any], prefix: str = ""
+) -> Iterator[str]:
+    for name, nested in select_related.items():
+        yield prefix + name
+        yield from _select_related_paths(nested, prefix + name + "__")
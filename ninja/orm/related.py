@@ -0,0 +1,109 @@
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type
+
+from django.db.models import Manager, Model, QuerySet
+from django.db.models.fields.related import RelatedField
+from django.db.models.query import ModelIterable
+from pydantic import BaseModel
+from pydantic.fields import ModelField
+
+__all__ = ["get_related_lookups", "get_item_schema", "optimize_queryset"]
+
+# (schema, model) pairs on the current path - stops recursive schemas
+_Path = FrozenSet[Tuple[Type[BaseModel], Type[Model]]]
+
+
+def get_item_schema(field: ModelField) -> Optional[Type[BaseModel]]:
+    "Schema of `field` or of its items (List[Schema])"
+    item_type = field.type_
+    if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+        return item_type
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_related_lookups(
+    schema: Type[BaseModel], model: Type[Model]
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    select_related and prefetch_related lookups for relations that `schema`
+    reads from `model` instances (nested schemas are followed)
+    """
+    select: List[str] = []
+    prefetch: List[str] = []
+    path = frozenset([(schema, model)])
+    _collect_lookups(schema, model, "", False, select, prefetch, path)
+    return tuple(select), tuple(prefetch)
+
+
+def optimize_queryset(items: Any, schema: Type[BaseModel]) -> Any:
+    "Applies related lookups of `schema` to a queryset (other items are returned as is)"
+    if isinstance(items, Manager):
+        items = items.all()
+    if not isinstance(items, QuerySet) or items._iterable_class is not ModelIterable:
+        return items
+    if items._result_cache is not None:
+        return items  # evaluated by the view - a new query would lose its changes
+    if items.query.deferred_loading != (frozenset(), True):
+        return items  # .only()/.defer() - selected relations could be deferred
+    select, prefetch = get_related_lookups(schema, items.model)  # type: ignore
+    if select:
+        items = items.select_related(*select)
+    seen = {
+        getattr(lookup, "prefetch_to", lookup)
+        for lookup in items._prefetch_related_lookups
+    }
+    prefetch = tuple(lookup for lookup in prefetch if lookup not in seen)
+    if prefetch:
+        items = items.prefetch_related(*prefetch)
+    return items
+
+
+def _collect_lookups(
+    schema: Type[BaseModel],
+    model: Type[Model],
+    prefix: str,
+    prefetch_only: bool,
+    select: List[str],
+    prefetch: List[str],
+    path: _Path,
+) -> None:
+    relations = _get_relations(model)
+    for field in schema.__fields__.values():
+        relation = relations.get(field.alias)
+        if relation is None:
+            continue
+        related_model, many = relation
+        lookup = prefix + field.alias
+        is_prefetch = many or prefetch_only
+        if is_prefetch:
+            prefetch.append(lookup)
+        else:
+            select.append(lookup)
+
+        nested = get_item_schema(field)
+        if nested is not None and (nested, related_model) not in path:
+            _collect_lookups(
+                nested,
+                related_model,
+                lookup + "__",
+                is_prefetch,
+                select,
+                prefetch,
+                path | {(nested, related_model)},
+            )
+
+
+def _get_relations(model: Type[Model]) -> Dict[str, Tuple[Type[Model], bool]]:
+    "attribute name -> (related model, is to-many) of model relations"
+    relations = {}
+    for field in model._meta.get_fields():
+        if not field.is_relation or field.related_model is None:
+            continue  # e.g. GenericForeignKey
+        if isinstance(field, RelatedField):
+            name = field.name
+        else:  # reverse relation
+            name = field.get_accessor_name()  # type: ignore
+        many = bool(field.many_to_many or field.one_to_many)
+        relations[name] = (field.related_model, many)
+    return relations
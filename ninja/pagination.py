@@ -1,19 +1,47 @@
+import datetime
 import inspect
+import json
 from abc import ABC, abstractmethod
-from functools import wraps
-from typing import Any, Callable, Type
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from functools import partial, wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
-from django.db.models import QuerySet
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.db import connections
+from django.db.models import Count, Manager, Q, QuerySet, Window
+from django.db.models.query import ModelIterable, ValuesIterable
 from django.http import HttpRequest
 from django.utils.module_loading import import_string
+from pydantic import BaseModel
 
 from ninja import Field, Query, Schema
+from ninja.cache import TTLCache
 from ninja.conf import settings
 from ninja.constants import NOT_SET
-from ninja.errors import ConfigError
-from ninja.signature import has_kwargs
+from ninja.errors import ConfigError, HttpError
+from ninja.orm.projection import project_queryset
+from ninja.orm.related import get_item_schema, optimize_queryset
+from ninja.responses import NinjaJSONEncoder
+from ninja.signature import has_kwargs, is_async
 from ninja.types import DictStrAny
 
+if TYPE_CHECKING:
+    from ninja.operation import Operation  # pragma: no cover
+
+COUNT_MODES = ("window", "cached", "estimate")
+COUNT_ALIAS = "_ninja_count"
+
 
 class PaginationBase(ABC):
     class Input(Schema):
@@ -21,6 +49,15 @@ class PaginationBase(ABC):
 
     InputSource = Query(...)
 
+    # paginators that return a page object (not just items) set the Output
+    # schema - its `items` field is typed by the operation response schema
+    Output: Optional[Type[Schema]] = None
+
+    # items schema - its relations are selected/prefetched before paginating
+    _related_schema: Optional[Type[BaseModel]] = None
+    # items schema - only its columns are loaded (only_fields=True)
+    _only_schema: Optional[Type[BaseModel]] = None
+
     def __init__(self, **kwargs: DictStrAny) -> None:
         pass
 
@@ -30,19 +67,86 @@ class PaginationBase(ABC):
     ) -> QuerySet:
         pass  # pragma: no cover
 
+    def required_fields(self, items: QuerySet) -> List[str]:
+        "Fields the paginator reads from items (loaded besides the schema fields)"
+        return []
+
+
+class CountedOutput(Schema):
+    items: List[Any]
+    count: int
+
+
+class ItemsCounter:
+    """
+    Returns a page of items with the total count ({"items": ..., "count": ...})
+
+    Modes:
+     window - count is selected with the page: COUNT(*) OVER ()
+              (a separate COUNT query if database has no window functions)
+     cached - count is cached for `ttl` seconds by the queryset sql,
+              on a cache miss the count is selected with the page
+     estimate - tables with more than `estimate_threshold` rows (estimated by
+                the PostgreSQL planner with an extra EXPLAIN query) get the
+                estimated count, other tables (and databases) use the window
+                count
+    """
+
+    def __init__(
+        self,
+        mode: str = "window",
+        *,
+        ttl: float = 60,
+        estimate_threshold: int = 100_000,
+    ) -> None:
+        if mode not in COUNT_MODES:
+            raise ConfigError(f"count must be one of {COUNT_MODES}")
+        self.mode = mode
+        self.estimate_threshold = estimate_threshold
+        self._cache = TTLCache(ttl=ttl)
+
+    def page(self, items: Any, offset: int, limit: int) -> DictStrAny:
+        if not isinstance(items, QuerySet):
+            items = list(items)
+            return {"items": items[offset : offset + limit], "count": len(items)}
+
+        sql = _get_sql(items)
+        count = key = None
+        if sql is None:  # .none() queryset
+            count = 0
+        elif self.mode == "cached":
+            key = _cache_key(sql)
+            count = self._cache.get(key)
+        elif self.mode == "estimate":
+            estimate = _estimate_count(items, sql)
+            if estimate is not None and estimate > self.estimate_threshold:
+                count = estimate
+
+        if count is not None:
+            return {"items": list(items[offset : offset + limit]), "count": count}
+        page, count = _window_page(items, offset, limit)
+        if key is not None:
+            self._cache.set(key, count)
+        return {"items": page, "count": count}
+
 
 class LimitOffsetPagination(PaginationBase):
     class Input(Schema):
         limit: int = Field(settings.PAGINATION_PER_PAGE, gt=0)
         offset: int = Field(0, gt=-1)
 
+    def __init__(self, count: Optional[str] = None, **count_options: Any) -> None:
+        self.counter = _get_counter(self, count, count_options)
+
     def paginate_queryset(
         self, items: QuerySet, request: HttpRequest, **params: DictStrAny
-    ) -> QuerySet:
+    ) -> Any:
         offset: int
         limit: int
         limit, offset = params["pagination"].limit, params["pagination"].offset  # type: ignore
 
+        if self.counter is not None:
+            return self.counter.page(items, offset, limit)
         return items[offset : offset + limit]  # noqa: E203
 
 
@@ -50,17 +154,218 @@ class PageNumberPagination(PaginationBase):
     class Input(Schema):
         page: int = Field(1, gt=0)
 
-    def __init__(self, page_size: int = settings.PAGINATION_PER_PAGE) -> None:
+    def __init__(
+        self,
+        page_size: int = settings.PAGINATION_PER_PAGE,
+        count: Optional[str] = None,
+        **count_options: Any,
+    ) -> None:
         self.page_size = page_size
+        self.counter = _get_counter(self, count, count_options)
 
     def paginate_queryset(
         self, items: QuerySet, request: HttpRequest, **params: DictStrAny
-    ) -> QuerySet:
+    ) -> Any:
         page: int = params["pagination"].page  # type: ignore
         offset = (page - 1) * self.page_size
+        if self.counter is not None:
+            return self.counter.page(items, offset, self.page_size)
         return items[offset : offset + self.page_size]  # noqa: E203
 
 
+class CursorJSONEncoder(NinjaJSONEncoder):
+    "Keeps microseconds of datetimes - a rounded position would repeat rows"
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CursorPagination(PaginationBase):
+    """
+    Keyset pagination - pages are filtered with `WHERE key > last key`
+    instead of OFFSET, so deep pages are as fast as the first one
+
+    ordering - fields the items are ordered by ("-created", ...), pk is
+               added to make the ordering unique (fields must not be null)
+    """
+
+    class Input(Schema):
+        cursor: Optional[str] = None
+
+    class Output(Schema):
+        items: List[Any]
+        next: Optional[str]
+        previous: Optional[str]
+
+    def __init__(
+        self,
+        ordering: Union[str, Sequence[str]] = "pk",
+        page_size: int = settings.PAGINATION_PER_PAGE,
+    ) -> None:
+        if isinstance(ordering, str):
+            ordering = [ordering]
+        self.ordering = [(f.lstrip("-"), f.startswith("-")) for f in ordering]
+        self.page_size = page_size
+
+    def paginate_queryset(
+        self, items: QuerySet, request: HttpRequest, **params: DictStrAny
+    ) -> Any:
+        cursor: Optional[str] = params["pagination"].cursor  # type: ignore
+        ordering = self._get_ordering(items)
+        position, reverse = self._decode_cursor(cursor, len(ordering))
+        if reverse:
+            ordering = [(name, not desc) for name, desc in ordering]
+
+        items = items.order_by(*[("-" if d else "") + name for name, d in ordering])
+        if position is not None:
+            try:
+                items = items.filter(self._keyset_filter(ordering, position))
+            except (ValueError, TypeError, ValidationError):
+                # cursor values that do not match the ordering fields
+                raise HttpError(400, "Invalid cursor")
+        page = list(items[: self.page_size + 1])
+        has_more = len(page) > self.page_size
+        page = page[: self.page_size]
+
+        next_position = previous_position = None
+        if reverse:
+            page.reverse()
+            if page:
+                next_position = self._get_position(page[-1], ordering)
+                if has_more:
+                    previous_position = self._get_position(page[0], ordering)
+        elif page:
+            if has_more:
+                next_position = self._get_position(page[-1], ordering)
+            if position is not None:
+                previous_position = self._get_position(page[0], ordering)
+
+        return {
+            "items": page,
+            "next": self._encode_cursor(next_position, False),
+            "previous": self._encode_cursor(previous_position, True),
+        }
+
+    def _get_ordering(self, items: QuerySet) -> List[Tuple[str, bool]]:
+        "Ordering made unique with pk"
+        pk_name = items.model._meta.pk.name
+        ordering = [(pk_name if n == "pk" else n, d) for n, d in self.ordering]
+        if all(name != pk_name for name, _ in ordering):
+            ordering.append((pk_name, ordering[-1][1]))
+        return ordering
+
+    def required_fields(self, items: QuerySet) -> List[str]:
+        return [name for name, _ in self._get_ordering(items)]
+
+    def _keyset_filter(
+        self, ordering: List[Tuple[str, bool]], position: List[Any]
+    ) -> Q:
+        "(a > 1) | (a = 1 & b > 2) | ... for ordering (a, b, ...)"
+        result: Optional[Q] = None
+        for (name, desc), value in reversed(list(zip(ordering, position))):
+            after = Q(**{f"{name}__{'lt' if desc else 'gt'}": value})
+            if result is not None:
+                after |= Q(**{name: value}) & result
+            result = after
+        return cast(Q, result)
+
+    def _get_position(self, item: Any, ordering: List[Tuple[str, bool]]) -> List[Any]:
+        position = []
+        for name, _ in ordering:
+            if isinstance(item, dict):  # .values() querysets
+                value = item[name]
+            else:
+                value = item
+                for attr in name.split("__"):
+                    value = getattr(value, attr)
+            position.append(value)
+        return position
+
+    def _encode_cursor(
+        self, position: Optional[List[Any]], reverse: bool
+    ) -> Optional[str]:
+        if position is None:
+            return None
+        data = json.dumps({"p": position, "r": reverse}, cls=CursorJSONEncoder)
+        return urlsafe_b64encode(data.encode()).decode()
+
+    def _decode_cursor(
+        self, cursor: Optional[str], size: int
+    ) -> Tuple[Optional[List[Any]], bool]:
+        if not cursor:
+            return None, False
+        try:
+            data = json.loads(urlsafe_b64decode(cursor.encode()))
+            position, reverse = data["p"], data["r"]
+        except Exception:
+            raise HttpError(400, "Invalid cursor")
+        if not isinstance(position, list) or len(position) != size:
+            raise HttpError(400, "Invalid cursor")
+        return position, bool(reverse)
+
+
+def _get_counter(
+    paginator: PaginationBase, count: Optional[str], options: DictStrAny
+) -> Optional[ItemsCounter]:
+    "count=mode - paginator returns {items, count} (see ItemsCounter)"
+    if count is None:
+        return None
+    paginator.Output = CountedOutput
+    return ItemsCounter(count, **options)
+
+
+def _get_sql(queryset: QuerySet) -> Optional[Tuple[str, Tuple]]:
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    return sql, tuple(params)
+
+
+def _cache_key(sql: Tuple[str, Tuple]) -> Tuple[str, str]:
+    "Params can be unhashable (e.g. lists for array lookups)"
+    return sql[0], repr(sql[1])
+
+
+def _window_page(queryset: QuerySet, offset: int, limit: int) -> Tuple[List, int]:
+    "Page of the queryset and the total count - in one query if possible"
+    connection = connections[queryset.db]
+    # window functions are computed before DISTINCT - they would count duplicates
+    if not (
+        connection.features.supports_over_clause
+        and queryset._iterable_class in (ModelIterable, ValuesIterable)
+        and not queryset.query.distinct
+    ):
+        return list(queryset[offset : offset + limit]), queryset.count()
+
+    counted = queryset.annotate(**{COUNT_ALIAS: Window(Count("*"))})
+    page = list(counted[offset : offset + limit])
+    if not page:
+        return page, queryset.count() if offset else 0
+    if isinstance(page[0], dict):
+        count = page[0][COUNT_ALIAS]
+        for row in page:
+            del row[COUNT_ALIAS]
+    else:
+        count = getattr(page[0], COUNT_ALIAS)
+    return page, count
+
+
+def _estimate_count(queryset: QuerySet, sql: Tuple[str, Tuple]) -> Optional[int]:
+    "Row count estimated by the PostgreSQL planner (None for other databases)"
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql[0]}", sql[1])
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 def paginate(
     func_or_pgn_class: Any = NOT_SET, **paginator_params: DictStrAny
 ) -> Callable:
@@ -94,10 +399,25 @@ def _inject_pagination(
 
     paginator: PaginationBase = paginator_class(**paginator_params)
 
-    @wraps(func)
-    def view_with_pagination(request: HttpRequest, **kw: DictStrAny) -> Any:
-        items = func(request, **kw)
-        return paginator.paginate_queryset(items, request, **kw)
+    view_with_pagination: Callable
+    if is_async(func):
+
+        @wraps(func)
+        async def view_with_pagination(request: HttpRequest, **kw: DictStrAny) -> Any:
+            from asgiref.sync import sync_to_async
+
+            items = await func(request, **kw)
+            # the page is fetched in a thread - querysets can't be evaluated
+            # in the event loop (when the response is serialized)
+            items = _optimize_items(paginator, items)
+            return await sync_to_async(_evaluate_page)(paginator, items, request, kw)
+
+    else:
+
+        @wraps(func)
+        def view_with_pagination(request: HttpRequest, **kw: DictStrAny) -> Any:
+            items = _optimize_items(paginator, func(request, **kw))
+            return paginator.paginate_queryset(items, request, **kw)
 
     view_with_pagination._ninja_contribute_args = [  # type: ignore
         (
@@ -106,5 +426,52 @@ def _inject_pagination(
             paginator.InputSource,
         ),
     ]
+    view_with_pagination._ninja_contribute_to_operation = partial(  # type: ignore
+        _contribute_to_operation, paginator
+    )
 
     return view_with_pagination
+
+
+def _evaluate_page(
+    paginator: PaginationBase, items: Any, request: HttpRequest, params: DictStrAny
+) -> Any:
+    page = paginator.paginate_queryset(items, request, **params)
+    if isinstance(page, QuerySet):
+        return list(page)
+    return page
+
+
+def _optimize_items(paginator: PaginationBase, items: Any) -> Any:
+    if paginator._related_schema is not None:
+        items = optimize_queryset(items, paginator._related_schema)
+    if isinstance(items, Manager):
+        items = items.all()
+    if paginator._only_schema is not None and isinstance(items, QuerySet):
+        required = paginator.required_fields(items)
+        items = project_queryset(items, paginator._only_schema, required)
+    return items
+
+
+def _contribute_to_operation(paginator: PaginationBase, operation: "Operation") -> None:
+    """
+    Takes the items schema from response schema List[Item] of the operation
+    (status 200) and replaces the response with paginator.Output schema
+    that has `items: List[Item]` (if paginator has Output)
+    """
+    model = operation.response_models.get(200)
+    if model is None or model is NOT_SET:
+        return
+    field = model.__fields__["response"]
+    if operation.auto_related:
+        paginator._related_schema = get_item_schema(field)
+    if operation.only_fields:
+        paginator._only_schema = get_item_schema(field)
+    if paginator.Output is None:
+        return
+    item_type = field.type_
+    output = paginator.Output
+    name = f"Paged{getattr(item_type, '__name__', 'Item')}"
+    attrs = {"__annotations__": {"items": List[item_type]}}  # type: ignore
+    schema = type(name, (output,), attrs)
+    operation.response_models[200] = operation._create_response_model(schema)
@@ -1,8 +1,9 @@
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from pydantic.fields import FieldInfo, ModelField
 
 from ninja import params_models
+from ninja.files import UploadLimits
 
 __all__ = ["Param", "Path", "Query", "Header", "Cookie", "Body", "Form", "File"]
 
@@ -79,7 +80,35 @@ class Form(Param):
 class File(Param):
     _model = params_models.FileModel
 
+    def __init__(
+        self,
+        default: Any,
+        *,
+        max_size: Optional[int] = None,
+        max_files: Optional[int] = None,
+        content_types: Optional[Iterable[str]] = None,
+        memory_size: Optional[int] = None,
+        hash_algorithm: Optional[str] = None,
+        **kwargs: Any,
+    ):
+        self.upload_limits: Optional[UploadLimits] = None
+        limits = (max_size, max_files, content_types, memory_size, hash_algorithm)
+        if any(value is not None for value in limits):
+            self.upload_limits = UploadLimits(
+                max_size=max_size,
+                max_files=max_files,
+                content_types=content_types,
+                memory_size=memory_size,
+                hash_algorithm=hash_algorithm,
+            )
+        super().__init__(default, **kwargs)
+
 
 class _MultiPartBody(Param):
     _model = params_models._MultiPartBodyModel
     _param_source = Body._param_source
+
+
+class _StreamBody(Param):
+    _model = params_models._StreamBodyModel
+    _param_source = Body._param_source
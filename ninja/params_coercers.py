@@ -0,0 +1,182 @@
+"""
+Fast path for operations that take only scalar path/query/header params
+
+Instead of creating a pydantic model for every request, values are converted
+by small functions specialized for every field. Those functions follow
+pydantic conversion rules and whenever something does not fit (wrong value,
+missing required param, unusual input type) - they give up and the pydantic
+model is used to produce exactly the same validation error.
+"""
+
+from enum import Enum, IntEnum
+from typing import Any, Callable, List, Optional, Tuple, Type, Union
+from uuid import UUID
+
+from pydantic.fields import SHAPE_SINGLETON, ModelField
+
+from ninja.compatibility.util import get_origin
+from ninja.types import DictStrAny
+
+__all__ = ["create_coercer"]
+
+Coercer = Callable[[DictStrAny], DictStrAny]
+FieldCoercer = Callable[[Any], Any]
+
+MAX_STR_INT = 4300  # same limit as pydantic's int_validator
+BOOL_TRUE = {"1", "on", "t", "true", "y", "yes"}
+BOOL_FALSE = {"0", "off", "f", "false", "n", "no"}
+NUMBER_CONSTRAINTS = ("gt", "ge", "lt", "le")
+LENGTH_CONSTRAINTS = ("min_length", "max_length")
+OTHER_CONSTRAINTS = (
+    "regex",
+    "multiple_of",
+    "max_digits",
+    "decimal_places",
+    "min_items",
+    "max_items",
+    "const",
+)
+
+
+def create_coercer(model: Type[Any], annotations: DictStrAny) -> Optional[Coercer]:
+    """
+    Returns a function that turns request data into the same values
+    the model would produce, or None if some field is not a simple scalar
+    """
+    fields: List[Tuple[str, str, bool, Any, FieldCoercer]] = []
+    for name, field in model.__fields__.items():
+        coerce = _create_field_coercer(field, annotations[name])
+        if coerce is None:
+            return None
+        fields.append((name, field.alias, field.required, field.default, coerce))
+
+    def coercer(data: DictStrAny) -> DictStrAny:
+        values = {}
+        for name, alias, required, default, coerce in fields:
+            value = data.get(alias)
+            if value is None:
+                if required:
+                    raise ValueError(f"{alias} is required")
+                values[name] = default
+            else:
+                values[name] = coerce(value)
+        return values
+
+    return coercer
+
+
+def _create_field_coercer(field: ModelField, annotation: Any) -> Optional[FieldCoercer]:
+    if field.shape != SHAPE_SINGLETON or field.sub_fields or field.class_validators:
+        return None
+
+    annotation = _unwrap_optional(annotation)
+    field_info = field.field_info
+    if any(getattr(field_info, c, None) is not None for c in OTHER_CONSTRAINTS):
+        return None
+    numbers = {
+        c: getattr(field_info, c)
+        for c in NUMBER_CONSTRAINTS
+        if getattr(field_info, c, None) is not None
+    }
+    lengths = {
+        c: getattr(field_info, c)
+        for c in LENGTH_CONSTRAINTS
+        if getattr(field_info, c, None) is not None
+    }
+
+    if annotation in (int, float) and not lengths:
+        convert: FieldCoercer = _int if annotation is int else _float
+        return _constrained_number(convert, **numbers) if numbers else convert
+    if annotation is str and not numbers:
+        return _constrained_str(**lengths) if lengths else _str
+    if numbers or lengths:
+        return None
+    if annotation is bool:
+        return _bool
+    if annotation is UUID:
+        return _uuid
+    if isinstance(annotation, type) and issubclass(annotation, IntEnum):
+        return lambda value: annotation(_int(value))
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    return None
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [a for a in annotation.__args__ if a is not type(None)]  # noqa: E721
+        return len(args) == 1 and args[0] or None
+    return annotation
+
+
+def _int(value: Any) -> int:
+    if type(value) is int:
+        return value
+    if type(value) is not str or len(value) > MAX_STR_INT:
+        raise TypeError(value)
+    return int(value)
+
+
+def _float(value: Any) -> float:
+    if type(value) not in (str, int, float):
+        raise TypeError(value)
+    return float(value)
+
+
+def _str(value: Any) -> str:
+    if type(value) is not str:
+        raise TypeError(value)
+    return value
+
+
+def _bool(value: Any) -> bool:
+    if type(value) is not str:
+        raise TypeError(value)
+    value = value.lower()
+    if value in BOOL_TRUE:
+        return True
+    if value in BOOL_FALSE:
+        return False
+    raise ValueError(value)
+
+
+def _uuid(value: Any) -> UUID:
+    if type(value) is not str:
+        raise TypeError(value)
+    return UUID(value)
+
+
+def _constrained_number(
+    convert: FieldCoercer,
+    gt: Optional[float] = None,
+    ge: Optional[float] = None,
+    lt: Optional[float] = None,
+    le: Optional[float] = None,
+) -> FieldCoercer:
+    def coerce(value: Any) -> Any:
+        value = convert(value)
+        if gt is not None and not value > gt:
+            raise ValueError(value)
+        if ge is not None and not value >= ge:
+            raise ValueError(value)
+        if lt is not None and not value < lt:
+            raise ValueError(value)
+        if le is not None and not value <= le:
+            raise ValueError(value)
+        return value
+
+    return coerce
+
+
+def _constrained_str(
+    min_length: Optional[int] = None, max_length: Optional[int] = None
+) -> FieldCoercer:
+    def coerce(value: Any) -> str:
+        result = _str(value)
+        if min_length is not None and len(result) < min_length:
+            raise ValueError(value)
+        if max_length is not None and len(result) > max_length:
+            raise ValueError(value)
+        return result
+
+    return coerce
@@ -3,7 +3,7 @@
 # what it basically does makes function XXX that create instance of params.XXX
 # and annotates function with result = Any
 # idea from https://github.com/tiangolo/fastapi/blob/master/fastapi/param_functions.py
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from ninja import params
 
@@ -154,9 +154,13 @@ def Body(  # noqa: N802
     max_length: Optional[int] = None,
     regex: Optional[str] = None,
     deprecated: Optional[bool] = None,
+    stream: bool = False,
     **extra: Any,
 ) -> Any:
-    return params.Body(
+    # stream=True - items of a json array/ndjson body are parsed and validated
+    # while the view iterates over them (List[Item] or Iterator[Item] param)
+    body_cls: Any = params._StreamBody if stream else params.Body
+    return body_cls(
         default,
         alias=alias,
         title=title,
@@ -220,6 +224,11 @@ def File(  # noqa: N802
     max_length: Optional[int] = None,
     regex: Optional[str] = None,
     deprecated: Optional[bool] = None,
+    max_size: Optional[int] = None,
+    max_files: Optional[int] = None,
+    content_types: Optional[Iterable[str]] = None,
+    memory_size: Optional[int] = None,
+    hash_algorithm: Optional[str] = None,
     **extra: Any,
 ) -> Any:
     return params.File(
@@ -235,5 +244,10 @@ def File(  # noqa: N802
         max_length=max_length,
         regex=regex,
         deprecated=deprecated,
+        max_size=max_size,
+        max_files=max_files,
+        content_types=content_types,
+        memory_size=memory_size,
+        hash_algorithm=hash_algorithm,
         **extra,
     )
@@ -1,17 +1,35 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Type, TypeVar
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import pydantic
 from django.conf import settings
 from django.http import HttpRequest
+from django.utils.datastructures import MultiValueDict
 from pydantic import BaseModel
+from pydantic.fields import ModelField
 
-from ninja.compatibility import get_headers
-from ninja.errors import HttpError
+from ninja.context import get_request_context
+from ninja.errors import HttpError, ValidationError
+from ninja.parser import Parser
 from ninja.types import DictStrAny
 
 if TYPE_CHECKING:
     from ninja import NinjaAPI  # pragma: no cover
+    from ninja.files import UploadLimits  # pragma: no cover
 
 __all__ = [
     "ParamModel",
@@ -34,6 +52,7 @@ def NestedDict() -> DictStrAny:
 
 class ParamModel(BaseModel, ABC):
     _param_source = None
+    _coercer: Optional[Callable[[DictStrAny], DictStrAny]] = None
 
     @classmethod
     @abstractmethod
@@ -48,11 +67,17 @@ class ParamModel(BaseModel, ABC):
         request: HttpRequest,
         api: "NinjaAPI",
         path_params: DictStrAny,
-    ) -> TModel:
+    ) -> Union[TModel, DictStrAny]:
         data = cls.get_request_data(request, api, path_params)
         if data is None:
             return cls()
 
+        if cls._coercer is not None:
+            try:
+                return cls._coercer(data)
+            except (TypeError, ValueError):
+                pass  # letting pydantic build the validation error
+
         data = cls._map_data_paths(data)
         return cls(**data)
 
@@ -86,7 +111,7 @@ class QueryModel(ParamModel):
         cls, request: HttpRequest, api: "NinjaAPI", path_params: DictStrAny
     ) -> Optional[DictStrAny]:
         list_fields = getattr(cls, "_collection_fields", [])
-        return api.parser.parse_querydict(request.GET, list_fields, request)
+        return get_request_context(request, api).query(list_fields)
 
 
 class PathModel(ParamModel):
@@ -105,7 +130,7 @@ class HeaderModel(ParamModel):
         cls, request: HttpRequest, api: "NinjaAPI", path_params: DictStrAny
     ) -> Optional[DictStrAny]:
         data = {}
-        headers = get_headers(request)
+        headers = get_request_context(request, api).headers
         for name in cls._flatten_map:
             if name in headers:
                 data[name] = headers[name]
@@ -129,12 +154,9 @@ class BodyModel(ParamModel):
     ) -> Optional[DictStrAny]:
         if request.body:
             try:
-                data = api.parser.parse_body(request)
+                data: DictStrAny = get_request_context(request, api).body
             except Exception as e:
-                msg = "Cannot parse request body"
-                if settings.DEBUG:
-                    msg += f" ({e})"
-                raise HttpError(400, msg)
+                raise cls._parse_error(e)
 
             varname = getattr(cls, "_single_attr", None)
             if varname:
@@ -143,6 +165,53 @@ class BodyModel(ParamModel):
 
         return None
 
+    @staticmethod
+    def _parse_error(e: Exception) -> HttpError:
+        msg = "Cannot parse request body"
+        if settings.DEBUG:
+            msg += f" ({e})"
+        return HttpError(400, msg)
+
+
+class _StreamBodyModel(ParamModel):
+    _stream_attr: str
+    _stream_alias: str
+    _item_field: ModelField
+
+    @classmethod
+    def resolve(
+        cls: Type[TModel],
+        request: HttpRequest,
+        api: "NinjaAPI",
+        path_params: DictStrAny,
+    ) -> Union[TModel, DictStrAny]:
+        return cast(DictStrAny, cls.get_request_data(request, api, path_params))
+
+    @classmethod
+    def get_request_data(
+        cls, request: HttpRequest, api: "NinjaAPI", path_params: DictStrAny
+    ) -> Optional[DictStrAny]:
+        return {cls._stream_attr: cls._iter_items(request, api)}
+
+    @classmethod
+    def _iter_items(cls, request: HttpRequest, api: "NinjaAPI") -> Iterator[Any]:
+        items = api.parser.parse_body_stream(request)
+        loc = ("body", cls._stream_alias)
+        index = 0
+        while True:
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            except Exception as e:
+                raise BodyModel._parse_error(e)
+            value, errors = cls._item_field.validate(item, {}, loc=loc + (index,))
+            if errors:
+                error = pydantic.ValidationError([errors], cls)
+                raise ValidationError([dict(i) for i in error.errors()])
+            yield value
+            index += 1
+
 
 class FormModel(ParamModel):
     @classmethod
@@ -154,12 +223,24 @@ class FormModel(ParamModel):
 
 
 class FileModel(ParamModel):
+    _upload_limits: Dict[str, "UploadLimits"] = {}
+
     @classmethod
     def get_request_data(
         cls, request: HttpRequest, api: "NinjaAPI", path_params: DictStrAny
     ) -> Optional[DictStrAny]:
+        files = request.FILES
+        if cls._upload_limits:
+            context = get_request_context(request, api)
+            if context.upload_error is not None:
+                raise context.upload_error
+            for name, limits in cls._upload_limits.items():
+                if isinstance(files, MultiValueDict):
+                    limits.validate(name, files.getlist(name))
+                elif name in files:  # plain dict (e.g. TestClient FILES)
+                    limits.validate(name, [files[name]])
         list_fields = getattr(cls, "_collection_fields", [])
-        return api.parser.parse_querydict(request.FILES, list_fields, request)
+        return api.parser.parse_querydict(files, list_fields, request)
 
 
 class _HttpRequest(HttpRequest):
@@ -174,14 +255,24 @@ class _MultiPartBodyModel(BodyModel):
     def get_request_data(
         cls, request: HttpRequest, api: "NinjaAPI", path_params: DictStrAny
     ) -> Optional[DictStrAny]:
-        req = _HttpRequest()
-        get_request_data = super(_MultiPartBodyModel, cls).get_request_data
+        # form fields are json values, except plain (not quoted) strings
+        loads = None
+        if type(api.parser).parse_body is Parser.parse_body:
+            loads = api.parser.json_backend.loads
         results: DictStrAny = {}
         for name, annotation in cls._body_params.items():
-            if name in request.POST:
-                data = request.POST[name]
-                if annotation == str and data[0] != '"' and data[-1] != '"':
-                    data = f'"{data}"'
+            if name not in request.POST:
+                continue
+            data = request.POST[name]
+            if annotation == str and data[:1] != '"' and data[-1:] != '"':
+                results[name] = data
+            elif loads is not None:
+                try:
+                    results[name] = loads(data)
+                except Exception as e:
+                    raise cls._parse_error(e)
+            else:  # custom parser - parsing the field as a request body
+                req = _HttpRequest()
                 req.body = data.encode()
-                results[name] = get_request_data(req, api, path_params)
+                results[name] = super().get_request_data(req, api, path_params)
         return results
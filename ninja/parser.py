@@ -1,9 +1,14 @@
+import codecs
 import json
-from typing import List, cast
+import re
+from io import BytesIO
+from typing import IO, Any, Iterator, List, cast
 
 from django.http import HttpRequest
 from django.utils.datastructures import MultiValueDict
 
+from ninja.compatibility.request import get_headers
+from ninja.json_backends import JSONBackend, get_default_json_backend
 from ninja.types import DictStrAny
 
 __all__ = ["Parser"]
@@ -12,8 +17,19 @@ __all__ = ["Parser"]
 class Parser:
     "Default json parser"
 
+    json_backend: JSONBackend = get_default_json_backend()
+    stream_chunk_size: int = 64 * 1024
+
     def parse_body(self, request: HttpRequest) -> DictStrAny:
-        return cast(DictStrAny, json.loads(request.body))
+        return cast(DictStrAny, self.json_backend.loads(request.body))
+
+    def parse_body_stream(self, request: HttpRequest) -> Iterator[Any]:
+        "Items of a json array or ndjson body (see Body(stream=True))"
+        stream = _get_body_stream(request)
+        content_type = get_headers(request).get("Content-Type", "")
+        if content_type.split(";")[0].strip() == NDJSON_CONTENT_TYPE:
+            return (self.json_backend.loads(line) for line in stream if line.strip())
+        return iter(JSONArrayReader(stream, self.stream_chunk_size))
 
     def parse_querydict(
         self, data: MultiValueDict, list_fields: List[str], request: HttpRequest
@@ -25,3 +41,84 @@ class Parser:
             else:
                 result[key] = data[key]
         return result
+
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JSONArrayReader:
+    "Parses items of a json array while it's read from the stream"
+
+    def __init__(self, stream: IO[bytes], chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        char = self._next_char()
+        if not char:  # empty body
+            return
+        if char != "[":
+            raise ValueError("Expected a json array")
+        if self._peek() == "]":
+            self.pos += 1
+        else:
+            while True:
+                yield self._value()
+                char = self._next_char()
+                if char == "]":
+                    break
+                if char != ",":
+                    raise ValueError("Expected ',' or ']' after array item")
+        if self._peek():
+            raise ValueError("Extra data after json array")
+
+    def _peek(self) -> str:
+        "Next non whitespace character ('' at the end of the stream)"
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read():
+                return ""
+
+    def _next_char(self) -> str:
+        char = self._peek()
+        self.pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                continue
+            # a value at the end of the buffer may be incomplete (e.g. a number)
+            if end < len(self.buffer) or not self._read():
+                self.pos = end
+                return value
+
+    def _read(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        self.eof = not chunk
+        text = self.text_decoder.decode(chunk, final=self.eof)
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return not self.eof or bool(text)
+
+
+def _get_body_stream(request: HttpRequest) -> IO[bytes]:
+    if isinstance(request, HttpRequest) and "_body" not in request.__dict__:
+        return cast(IO[bytes], request)  # body is not loaded - reading the stream
+    body = request.body
+    return BytesIO(body.encode() if isinstance(body, str) else body)
@@ -1,25 +1,89 @@
 import json
-from typing import Any, Mapping, Optional, Type
+from typing import Any, Iterable, Iterator, Mapping, Optional, Type
 
 from django.http import HttpRequest
 
+from ninja.json_backends import JSONBackend, get_default_json_backend
 from ninja.responses import NinjaJSONEncoder
 
-__all__ = ["BaseRenderer", "JSONRenderer"]
+__all__ = ["BaseRenderer", "JSONRenderer", "NDJSONRenderer"]
 
 
 class BaseRenderer:
     media_type: Optional[str] = None
     charset: str = "utf-8"
+    streaming: bool = False  # List responses are streamed (same as stream=True)
 
     def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
         raise NotImplementedError("Please implement .render() method")
 
+    def render_stream(
+        self, request: HttpRequest, items: Iterable[Any], *, response_status: int
+    ) -> Iterator[Any]:
+        "Renders a list that is produced while response is sent (see stream=True)"
+        yield self.render(request, list(items), response_status=response_status)
+
 
 class JSONRenderer(BaseRenderer):
     media_type = "application/json"
     encoder_class: Type[json.JSONEncoder] = NinjaJSONEncoder
     json_dumps_params: Mapping[str, Any] = {}
+    json_backend: JSONBackend = get_default_json_backend()
+    stream_buffer_size: int = 64 * 1024
 
     def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        if self.encoder_class is NinjaJSONEncoder and not self.json_dumps_params:
+            return self.json_backend.dumps(data)
+        # custom encoder or dumps params are only supported by the json module
         return json.dumps(data, cls=self.encoder_class, **self.json_dumps_params)
+
+    def render_stream(
+        self, request: HttpRequest, items: Iterable[Any], *, response_status: int
+    ) -> Iterator[bytes]:
+        "Renders items as a json array, yielding about stream_buffer_size bytes"
+        buffer = bytearray(b"[")
+        for index, item in enumerate(items):
+            if index:
+                buffer += b","
+            content = self.render(request, item, response_status=response_status)
+            if isinstance(content, str):
+                content = content.encode(self.charset)
+            buffer += content
+            if len(buffer) >= self.stream_buffer_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"]"
+        yield bytes(buffer)
+
+
+class NDJSONRenderer(JSONRenderer):
+    """
+    Newline delimited JSON (JSON Lines): every list item goes on its own line
+
+    List responses are streamed, so clients can process lines as they arrive
+    """
+
+    media_type = "application/x-ndjson"
+    streaming = True
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        items = data if isinstance(data, list) else [data]
+        return b"".join(
+            self.render_stream(request, items, response_status=response_status)
+        )
+
+    def render_stream(
+        self, request: HttpRequest, items: Iterable[Any], *, response_status: int
+    ) -> Iterator[bytes]:
+        buffer = bytearray()
+        for item in items:
+            content = super().render(request, item, response_status=response_status)
+            if isinstance(content, str):
+                content = content.encode(self.charset)
+            buffer += content
+            buffer += b"\n"
+            if len(buffer) >= self.stream_buffer_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
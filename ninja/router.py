@@ -7,6 +7,7 @@ from typing import (
     List,
     Optional,
     Tuple,
+    Union,
     cast,
 )
 
@@ -15,6 +16,7 @@ from django.urls import URLPattern, path as django_path
 from ninja.constants import NOT_SET
 from ninja.errors import ConfigError
 from ninja.operation import PathView
+from ninja.renderers import BaseRenderer
 from ninja.types import TCallable
 from ninja.utils import normalize_path
 
@@ -27,11 +29,16 @@ __all__ = ["Router"]
 
 class Router:
     def __init__(
-        self, *, auth: Any = NOT_SET, tags: Optional[List[str]] = None
+        self,
+        *,
+        auth: Any = NOT_SET,
+        tags: Optional[List[str]] = None,
+        sync_executor: Any = NOT_SET,
     ) -> None:
         self.api: Optional["NinjaAPI"] = None
         self.auth = auth
         self.tags = tags
+        self.sync_executor = sync_executor
         self.path_operations: Dict[str, PathView] = {}
         self._routers: List[Tuple[str, Router]] = []
 
@@ -52,6 +59,13 @@ class Router:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.api_operation(
             ["GET"],
@@ -69,6 +83,13 @@ class Router:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def post(
@@ -88,6 +109,13 @@ class Router:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.api_operation(
             ["POST"],
@@ -105,6 +133,13 @@ class Router:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def delete(
@@ -124,6 +159,13 @@ class Router:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.api_operation(
             ["DELETE"],
@@ -141,6 +183,13 @@ class Router:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def patch(
@@ -160,6 +209,13 @@ class Router:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.api_operation(
             ["PATCH"],
@@ -177,6 +233,13 @@ class Router:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def put(
@@ -196,6 +259,13 @@ class Router:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         return self.api_operation(
             ["PUT"],
@@ -213,6 +283,13 @@ class Router:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
 
     def api_operation(
@@ -233,6 +310,13 @@ class Router:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         def decorator(view_func: TCallable) -> TCallable:
             self.add_api_operation(
@@ -252,6 +336,13 @@ class Router:
                 exclude_none=exclude_none,
                 url_name=url_name,
                 include_in_schema=include_in_schema,
+                only_fields=only_fields,
+                auto_related=auto_related,
+                etag=etag,
+                sync_executor=sync_executor,
+                validate_response=validate_response,
+                renderer=renderer,
+                stream=stream,
             )
             return view_func
 
@@ -276,6 +367,13 @@ class Router:
         exclude_none: bool = False,
         url_name: Optional[str] = None,
         include_in_schema: bool = True,
+        only_fields: bool = False,
+        auto_related: bool = True,
+        etag: Union[bool, Callable] = False,
+        sync_executor: Any = NOT_SET,
+        validate_response: Any = NOT_SET,
+        renderer: Optional[BaseRenderer] = None,
+        stream: bool = False,
     ) -> None:
         if path not in self.path_operations:
             path_view = PathView()
@@ -299,6 +397,13 @@ class Router:
             exclude_none=exclude_none,
             url_name=url_name,
             include_in_schema=include_in_schema,
+            only_fields=only_fields,
+            auto_related=auto_related,
+            etag=etag,
+            sync_executor=sync_executor,
+            validate_response=validate_response,
+            renderer=renderer,
+            stream=stream,
         )
         if self.api:
             path_view.set_api_instance(self.api, self)
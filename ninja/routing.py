@@ -0,0 +1,131 @@
+"""
+Prefix tree (radix tree) url resolver
+
+Django resolves urls by trying every pattern one by one (a regex match per
+pattern). With `NinjaAPI(route_tree=True)` all operation urls are put into a
+tree of path segments and resolved by a single url pattern: static segments
+are looked up in a dict, parameters are checked with their path converters.
+
+Regular django patterns are still added after the tree pattern, so that
+reverse()/url_name work as usual and urls that the tree can't handle
+(like `{path:name}` or parameters inside a segment) still resolve.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Pattern, Sequence, Tuple
+
+from django.urls import URLPattern
+from django.urls.resolvers import ResolverMatch, RoutePattern
+
+__all__ = ["RouteTree", "RouteTreePattern"]
+
+PARAM_SEGMENT = re.compile(r"^<(?:(?P<converter>[^>:]+):)?(?P<name>\w+)>$")
+Param = Tuple[str, Any, Pattern, "RouteNode"]
+Route = Tuple[Callable, Optional[str], str]
+
+
+class RouteNode:
+    __slots__ = ("static", "params", "route")
+
+    def __init__(self) -> None:
+        self.static: Dict[str, RouteNode] = {}
+        self.params: List[Param] = []
+        self.route: Optional[Route] = None
+
+
+class RouteTree:
+    def __init__(self) -> None:
+        self.root = RouteNode()
+
+    def add(self, pattern: URLPattern) -> bool:
+        "Adds django url pattern, returns False if it can't be added to the tree"
+        route = str(pattern.pattern)
+        converters = getattr(pattern.pattern, "converters", {})
+        segments = route.split("/")
+        parsed: List[Tuple[Optional[str], Any]] = []
+        for segment in segments:
+            if "<" not in segment:
+                parsed.append((None, segment))
+                continue
+            match = PARAM_SEGMENT.match(segment)
+            if not match or match["converter"] == "path":
+                return False
+            parsed.append((match["name"], converters[match["name"]]))
+
+        node = self.root
+        for name, value in parsed:
+            if name is None:
+                node = node.static.setdefault(value, RouteNode())
+                continue
+            for param_name, converter, _, child in node.params:
+                if param_name == name and type(converter) is type(value):
+                    node = child
+                    break
+            else:
+                child = RouteNode()
+                regex = re.compile(value.regex)
+                node.params.append((name, value, regex, child))
+                node = child
+
+        if node.route is None:  # same as django: first pattern wins
+            node.route = (pattern.callback, pattern.name, route)
+        return True
+
+    def resolve(self, path: str) -> Optional[Tuple[Route, Dict[str, Any]]]:
+        kwargs: Dict[str, Any] = {}
+        route = self._resolve(self.root, path.split("/"), 0, kwargs)
+        if route is None:
+            return None
+        return route, kwargs
+
+    def _resolve(
+        self,
+        node: RouteNode,
+        segments: Sequence[str],
+        index: int,
+        kwargs: Dict[str, Any],
+    ) -> Optional[Route]:
+        if index == len(segments):
+            return node.route
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            route = self._resolve(child, segments, index + 1, kwargs)
+            if route is not None:
+                return route
+
+        for name, converter, regex, child in node.params:
+            if not segment or not regex.fullmatch(segment):
+                continue
+            try:
+                kwargs[name] = converter.to_python(segment)
+            except ValueError:
+                continue
+            route = self._resolve(child, segments, index + 1, kwargs)
+            if route is not None:
+                return route
+            del kwargs[name]
+
+        return None
+
+
+class RouteTreePattern(URLPattern):
+    "Single django url pattern resolving all the urls added to the tree"
+
+    def __init__(self, patterns: Sequence[URLPattern]) -> None:
+        super().__init__(RoutePattern("", is_endpoint=False), self._not_callable)
+        self.tree = RouteTree()
+        for pattern in patterns:
+            self.tree.add(pattern)
+
+    def resolve(self, path: str) -> Optional[ResolverMatch]:
+        resolved = self.tree.resolve(path)
+        if resolved is None:
+            return None
+        (callback, name, route), kwargs = resolved
+        return ResolverMatch(callback, (), kwargs, name, route=route)
+
+    @staticmethod
+    def _not_callable(*args: Any, **kwargs: Any) -> Any:  # pragma: no cover
+        raise AssertionError("RouteTreePattern is never returned by resolve()")
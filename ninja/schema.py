@@ -1,15 +1,71 @@
-from typing import Any
+import datetime
+from decimal import Decimal
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Type
+from uuid import UUID
 
 import pydantic
-from django.db.models import Manager, QuerySet
+from django.db.models import Field as DjangoField, FileField, Manager, QuerySet
 from django.db.models.fields.files import FieldFile
 from pydantic import BaseModel, Field, validator
+from pydantic.fields import (
+    SHAPE_LIST,
+    SHAPE_SEQUENCE,
+    SHAPE_SET,
+    SHAPE_SINGLETON,
+    SHAPE_TUPLE_ELLIPSIS,
+    ModelField,
+)
+from pydantic.types import (
+    ConstrainedBytes,
+    ConstrainedDecimal,
+    ConstrainedFloat,
+    ConstrainedInt,
+    ConstrainedStr,
+)
 from pydantic.utils import GetterDict
 
 pydantic_version = list(map(int, pydantic.VERSION.split(".")[:2]))
 assert pydantic_version >= [1, 6], "Pydantic 1.6+ required"
 
-__all__ = ["BaseModel", "Field", "validator", "DjangoGetter", "Schema"]
+__all__ = [
+    "BaseModel",
+    "Field",
+    "validator",
+    "DjangoGetter",
+    "Schema",
+    "get_converters",
+    "get_getter_dict",
+]
+
+Converter = Callable[[Any], Any]
+
+MANY_SHAPES = (
+    SHAPE_LIST,
+    SHAPE_SET,
+    SHAPE_TUPLE_ELLIPSIS,
+    SHAPE_SEQUENCE,
+)
+
+# values of these types can't be managers, querysets or files
+SCALAR_TYPES = (
+    int,
+    float,
+    Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    UUID,
+)
+
+# pydantic con*() types - validated as their base types
+CONSTRAINED_TYPES = (
+    ConstrainedBytes,
+    ConstrainedDecimal,
+    ConstrainedFloat,
+    ConstrainedInt,
+    ConstrainedStr,
+)
 
 
 # Since "Model" word would be very confusing when used in django context
@@ -18,24 +74,120 @@ __all__ = ["BaseModel", "Field", "validator", "DjangoGetter", "Schema"]
 
 
 class DjangoGetter(GetterDict):
+    """
+    Reads attributes of ORM objects for `Schema.from_orm`
+
+    `converters` (see get_converters) - conversion of each schema field,
+    other attributes are converted with convert_result
+    """
+
+    __slots__ = ("_converters",)
+
+    def __init__(
+        self, obj: Any, converters: Optional[Dict[str, Optional[Converter]]] = None
+    ) -> None:
+        super().__init__(obj)
+        self._converters = converters
+
     def get(self, key: Any, default: Any = None) -> Any:
         result = super().get(key, default)
+        converters = self._converters
+        if converters is not None and key in converters:
+            convert = converters[key]
+            return result if convert is None else convert(result)
+        return self.convert_result(result)
+
+    @staticmethod
+    def convert_result(result: Any) -> Any:
+        "Turns managers, querysets and files into something pydantic can validate"
+        return _convert_file(_convert_many(result))
+
 
-        if isinstance(result, Manager):
-            return list(result.all())
+def _convert_many(result: Any) -> Any:
+    if isinstance(result, Manager):
+        return list(result.all())
+    elif isinstance(result, getattr(QuerySet, "__origin__", QuerySet)):
+        return list(result)
+    return result
 
-        elif isinstance(result, getattr(QuerySet, "__origin__", QuerySet)):
-            return list(result)
 
-        elif isinstance(result, FieldFile):
-            if not result:
-                return None
-            return result.url
+def _convert_file(result: Any) -> Any:
+    if isinstance(result, FieldFile):
+        return result.url if result else None
+    return result
 
-        return result
+
+def get_converters(schema: Type[BaseModel]) -> Dict[str, Optional[Converter]]:
+    """
+    Field alias -> conversion the field values can need (None - values are
+    used as is)
+
+    Model fields of ModelSchema use the model metadata, other fields
+    are checked by type: lists can be managers/querysets, strings can be files
+    """
+    django_fields = schema.__dict__.get("__django_fields__", {})
+    converters = {}
+    for name, field in schema.__fields__.items():
+        django_field = django_fields.get(name)
+        if django_field is not None:
+            converters[field.alias] = _model_field_converter(django_field)
+        else:
+            converters[field.alias] = _field_converter(field)
+    return converters
+
+
+def get_getter_dict(schema: Type[BaseModel]) -> Callable[[Any], GetterDict]:
+    """
+    Returns getter_dict of schema - DjangoGetter gets the field converters
+    (compiled once per schema)
+    """
+    getter = schema.__dict__.get("__ninja_getter_dict__")
+    if getter is None:
+        getter = schema.__config__.getter_dict
+        if (
+            issubclass(getter, DjangoGetter)
+            and getter.convert_result is DjangoGetter.convert_result
+        ):
+            getter = partial(getter, converters=get_converters(schema))
+        setattr(schema, "__ninja_getter_dict__", getter)
+    return getter
+
+
+def _model_field_converter(field: DjangoField) -> Optional[Converter]:
+    if field.many_to_many or field.one_to_many:
+        return _convert_many
+    if isinstance(field, FileField):
+        return _convert_file
+    return None
+
+
+def _field_converter(field: ModelField) -> Optional[Converter]:
+    if field.shape != SHAPE_SINGLETON:
+        if field.shape in MANY_SHAPES:
+            return _convert_many
+        return DjangoGetter.convert_result
+    type_ = field.type_
+    if field.sub_fields or not isinstance(type_, type):
+        return DjangoGetter.convert_result
+    if hasattr(type_, "__get_validators__") and not issubclass(
+        type_, CONSTRAINED_TYPES
+    ):
+        # custom types (and nested schemas) can accept anything
+        return DjangoGetter.convert_result
+    if issubclass(type_, SCALAR_TYPES):
+        return None
+    if issubclass(type_, (str, bytes)):
+        return _convert_file
+    return DjangoGetter.convert_result
 
 
 class Schema(BaseModel):
     class Config:
         orm_mode = True
         getter_dict = DjangoGetter
+
+    @classmethod
+    def _decompose_class(cls, obj: Any) -> GetterDict:
+        if isinstance(obj, GetterDict):
+            return obj
+        return get_getter_dict(cls)(obj)
@@ -1,4 +1,5 @@
 from ninja.security.apikey import APIKeyCookie, APIKeyHeader, APIKeyQuery
+from ninja.security.cache import AuthCache
 from ninja.security.http import HttpBasicAuth, HttpBearer
 from ninja.security.session import SessionAuth
 
@@ -6,6 +7,7 @@ __all__ = [
     "APIKeyCookie",
     "APIKeyHeader",
     "APIKeyQuery",
+    "AuthCache",
     "HttpBasicAuth",
     "HttpBearer",
     "SessionAuth",
@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from django.http import HttpRequest
 
-from ninja.compatibility.request import get_headers
-from ninja.security.base import AuthBase
+from ninja.context import get_request_context
+from ninja.security.base import AuthBase, CredentialCheck
 
 __all__ = ["APIKeyBase", "APIKeyQuery", "APIKeyCookie", "APIKeyHeader"]
 
@@ -19,7 +19,14 @@ class APIKeyBase(AuthBase, ABC):
 
     def __call__(self, request: HttpRequest) -> Optional[Any]:
         key = self._get_key(request)
-        return self.authenticate(request, key)
+        return self._authenticate_cached(key, self.authenticate, request, key)
+
+    # authenticate() is called with key=None when key is missing, so api key
+    # auths only tell where the key is (see AuthBase._get_credential_check)
+    def _has_default_lookup(self, get_key: Callable) -> bool:
+        "True if subclass reads the key with the given (not overridden) _get_key"
+        klass = type(self)
+        return klass.__call__ is APIKeyBase.__call__ and klass._get_key is get_key
 
     @abstractmethod
     def _get_key(self, request: HttpRequest) -> Optional[str]:
@@ -36,6 +43,11 @@ class APIKeyQuery(APIKeyBase, ABC):
     def _get_key(self, request: HttpRequest) -> Optional[str]:
         return request.GET.get(self.param_name)
 
+    def _get_credential_check(self) -> Optional[CredentialCheck]:
+        if not self._has_default_lookup(APIKeyQuery._get_key):
+            return None
+        return "query", None
+
 
 class APIKeyCookie(APIKeyBase, ABC):
     openapi_in: str = "cookie"
@@ -43,10 +55,20 @@ class APIKeyCookie(APIKeyBase, ABC):
     def _get_key(self, request: HttpRequest) -> Optional[str]:
         return request.COOKIES.get(self.param_name)
 
+    def _get_credential_check(self) -> Optional[CredentialCheck]:
+        if not self._has_default_lookup(APIKeyCookie._get_key):
+            return None
+        return "cookie", None
+
 
 class APIKeyHeader(APIKeyBase, ABC):
     openapi_in: str = "header"
 
     def _get_key(self, request: HttpRequest) -> Optional[str]:
-        headers = get_headers(request)
+        headers = get_request_context(request).headers
         return headers.get(self.param_name)
+
+    def _get_credential_check(self) -> Optional[CredentialCheck]:
+        if not self._has_default_lookup(APIKeyHeader._get_key):
+            return None
+        return "header", None
@@ -1,12 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Tuple
 
 from django.http import HttpRequest
 
 from ninja.errors import ConfigError
+from ninja.security.cache import AuthCache
 
 __all__ = ["SecuritySchema", "AuthBase"]
 
+# (location, is_present) - where auth reads its credential from ("header",
+# "cookie" or "query", None - unknown or sent by browsers on their own)
+# and a function telling if request carries it
+# (None - auth must be called even for requests without the credential)
+CredentialCheck = Tuple[Optional[str], Optional[Callable[[HttpRequest], bool]]]
+
 
 class SecuritySchema(dict):
     def __init__(self, type: str, **kwargs: Any) -> None:
@@ -14,6 +21,8 @@ class SecuritySchema(dict):
 
 
 class AuthBase(ABC):
+    auth_cache: Optional[AuthCache] = None
+
     def __init__(self) -> None:
         if not hasattr(self, "openapi_type"):
             raise ConfigError("If you extend AuthBase you need to define openapi_type")
@@ -28,3 +37,18 @@ class AuthBase(ABC):
     @abstractmethod
     def __call__(self, request: HttpRequest) -> Optional[Any]:
         pass  # pragma: no cover
+
+    def _authenticate_cached(
+        self, credential: Optional[str], authenticate: Callable, *args: Any
+    ) -> Optional[Any]:
+        "Calls authenticate(*args) - through auth_cache if it's set"
+        if self.auth_cache is None or not credential:
+            return authenticate(*args)
+        return self.auth_cache.authenticate(credential, authenticate, *args)
+
+    def _get_credential_check(self) -> Optional[CredentialCheck]:
+        """
+        Lets operations skip this auth for requests without its credential and
+        skip csrf checks for header-only auth (None - location is unknown)
+        """
+        return None
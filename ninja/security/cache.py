@@ -0,0 +1,68 @@
+from hashlib import sha256
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Optional
+
+from ninja.cache import TTLCache
+
+__all__ = ["AuthCache"]
+
+_missing = object()
+_invalid = object()
+
+
+class AuthCache:
+    """
+    Caches results of `authenticate` by credential (token, api key, ...)
+
+    Credentials are stored only as sha256 hashes. Invalid credentials
+    (authenticate returned a falsy value) are cached for `negative_ttl`
+    seconds (by default they are not cached). Exceptions are never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60,
+        maxsize: int = 1024,
+        negative_ttl: Optional[float] = None,
+    ) -> None:
+        self.negative_ttl = negative_ttl
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def authenticate(
+        self, credential: str, authenticate: Callable, *args: Any
+    ) -> Optional[Any]:
+        "Returns cached result or calls authenticate(*args) and caches its result"
+        key = self._key(credential)
+        result = self._cache.get(key, _missing)
+        if result is _invalid:
+            return None
+        if result is not _missing:
+            return result
+
+        result = authenticate(*args)
+        if isawaitable(result):
+            return self._set_awaited(key, result)
+        self._set(key, result)
+        return result
+
+    def invalidate(self, credential: str) -> None:
+        "Removes credential from the cache (e.g. when a token is revoked)"
+        self._cache.delete(self._key(credential))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    async def _set_awaited(self, key: bytes, awaitable: Awaitable) -> Optional[Any]:
+        result = await awaitable
+        self._set(key, result)
+        return result
+
+    def _set(self, key: bytes, result: Any) -> None:
+        if result:
+            self._cache.set(key, result)
+        elif self.negative_ttl:
+            self._cache.set(key, _invalid, ttl=self.negative_ttl)
+
+    def _key(self, credential: str) -> bytes:
+        return sha256(credential.encode()).digest()
@@ -7,8 +7,8 @@ from urllib.parse import unquote
 from django.conf import settings
 from django.http import HttpRequest
 
-from ninja.compatibility import get_headers
-from ninja.security.base import AuthBase
+from ninja.context import get_request_context
+from ninja.security.base import AuthBase, CredentialCheck
 
 __all__ = ["HttpAuthBase", "HttpBearer", "DecodeError", "HttpBasicAuth"]
 
@@ -18,6 +18,14 @@ logger = logging.getLogger("django")
 
 class HttpAuthBase(AuthBase, ABC):
     openapi_type: str = "http"
+    header: str = "Authorization"
+
+    def _header_check(self, call: Any) -> Optional[CredentialCheck]:
+        "Credential check for subclasses that do not override __call__"
+        if type(self).__call__ is not call:
+            return None
+        header = self.header
+        return "header", lambda request: header in get_request_context(request).headers
 
 
 class HttpBearer(HttpAuthBase, ABC):
@@ -25,7 +33,7 @@ class HttpBearer(HttpAuthBase, ABC):
     header: str = "Authorization"
 
     def __call__(self, request: HttpRequest) -> Optional[Any]:
-        headers = get_headers(request)
+        headers = get_request_context(request).headers
         auth_value = headers.get(self.header)
         if not auth_value:
             return None
@@ -36,7 +44,10 @@ class HttpBearer(HttpAuthBase, ABC):
                 logger.error(f"Unexpected auth - '{auth_value}'")
             return None
         token = " ".join(parts[1:])
-        return self.authenticate(request, token)
+        return self._authenticate_cached(token, self.authenticate, request, token)
+
+    def _get_credential_check(self) -> Optional[CredentialCheck]:
+        return self._header_check(HttpBearer.__call__)
 
     @abstractmethod
     def authenticate(self, request: HttpRequest, token: str) -> Optional[Any]:
@@ -52,7 +63,7 @@ class HttpBasicAuth(HttpAuthBase, ABC):  # TODO: maybe HttpBasicAuthBase
     header = "Authorization"
 
     def __call__(self, request: HttpRequest) -> Optional[Any]:
-        headers = get_headers(request)
+        headers = get_request_context(request).headers
         auth_value = headers.get(self.header)
         if not auth_value:
             return None
@@ -63,7 +74,15 @@ class HttpBasicAuth(HttpAuthBase, ABC):  # TODO: maybe HttpBasicAuthBase
             if settings.DEBUG:
                 logger.exception(e)
             return None
-        return self.authenticate(request, username, password)
+        return self._authenticate_cached(
+            auth_value, self.authenticate, request, username, password
+        )
+
+    def _get_credential_check(self) -> Optional[CredentialCheck]:
+        check = self._header_check(HttpBasicAuth.__call__)
+        # browsers re-send cached basic credentials on their own (like cookies)
+        # - no location, so that csrf is still checked
+        return check and (None, check[1])
 
     @abstractmethod
     def authenticate(
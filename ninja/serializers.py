@@ -0,0 +1,290 @@
+"""
+Turning validated response schemas into plain python data
+
+Does the same job as `Schema.dict(...)`, but instead of dispatching on every
+value at runtime, each schema field gets a function compiled for its type:
+scalar fields are copied as is, nested schemas and lists of schemas
+go straight to the serializer of that schema.
+
+Trusted serializers (see `validate_response=False`) do the same for data that
+was not validated: ORM objects and dicts are read through the schema fields
+(names, aliases, defaults), without calling any validators.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.typing import is_namedtuple
+from pydantic.utils import ROOT_KEY, sequence_like
+
+from ninja.schema import DjangoGetter, get_getter_dict
+
+__all__ = ["SchemaSerializer"]
+
+Serializer = Callable[[Any], Any]
+FieldPlan = Tuple[str, Optional[Serializer], Any, Any]
+TrustedFieldPlan = Tuple[str, str, Optional[str], ModelField, Optional[Serializer]]
+
+_missing = object()
+
+
+class SchemaSerializer:
+    """
+    Serializes schema instances respecting the same export options
+    as `Schema.dict(by_alias, exclude_unset, exclude_defaults, exclude_none)`
+    """
+
+    def __init__(
+        self,
+        *,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> None:
+        self.by_alias = by_alias
+        self.exclude_unset = exclude_unset
+        self.exclude_defaults = exclude_defaults
+        self.exclude_none = exclude_none
+        self._schemas: Dict[Type[BaseModel], Serializer] = {}
+        self._trusted_schemas: Dict[Type[BaseModel], Serializer] = {}
+
+    def for_field(self, field: ModelField) -> Serializer:
+        "Returns a function serializing values of the given (validated) field"
+        serializer = self._compile_field(field)
+        if serializer is None:
+            return _identity
+        return lambda value: None if value is None else serializer(value)
+
+    def for_trusted_field(
+        self, field: ModelField, model: Type[BaseModel]
+    ) -> Serializer:
+        """
+        Same as for_field, but for values that were not validated
+        (field types that can't be read this way are still validated)
+        """
+        serializer = self._compile_trusted_field(field, model)
+        if serializer is None:
+            return DjangoGetter.convert_result
+        return lambda value: None if value is None else serializer(value)
+
+    def serialize(self, value: Any) -> Any:
+        "Serializes any value (used when types are not known in advance)"
+        if isinstance(value, BaseModel):
+            return self._schema_serializer(type(value))(value)
+        if isinstance(value, dict):
+            return {k: self.serialize(v) for k, v in value.items()}
+        if sequence_like(value):
+            items = (self.serialize(v) for v in value)
+            if is_namedtuple(value.__class__):
+                return value.__class__(*items)
+            return value.__class__(items)
+        return value
+
+    def _schema_serializer(self, schema: Type[BaseModel]) -> Serializer:
+        serializer = self._schemas.get(schema)
+        if serializer is None:
+            serializer = self._compile_schema(schema)
+            self._schemas[schema] = serializer
+        return serializer
+
+    def _serialize_schema(self, value: BaseModel) -> Any:
+        return self._schema_serializer(type(value))(value)
+
+    def _compile_schema(self, schema: Type[BaseModel]) -> Serializer:
+        if not self._can_compile(schema):
+            return self._schema_dict
+
+        fields: Dict[str, FieldPlan] = {}
+        for name, field in schema.__fields__.items():
+            key = field.alias if self.by_alias else name
+            serializer = self._compile_field(field)
+            fields[name] = (key, serializer, field.required, field.default)
+        return self._make_schema_serializer(fields)
+
+    def _make_schema_serializer(self, fields: Dict[str, FieldPlan]) -> Serializer:
+        serialize = self.serialize
+        exclude_unset = self.exclude_unset
+        exclude_defaults = self.exclude_defaults
+        exclude_none = self.exclude_none
+
+        def serialize_schema(obj: BaseModel) -> Any:
+            fields_set = obj.__fields_set__
+            result = {}
+            for name, value in obj.__dict__.items():
+                if exclude_unset and name not in fields_set:
+                    continue
+                if exclude_none and value is None:
+                    continue
+                plan = fields.get(name)
+                if plan is None:  # extra attributes
+                    result[name] = serialize(value)
+                    continue
+                key, serializer, required, default = plan
+                if exclude_defaults and not required and value == default:
+                    continue
+                if serializer is not None and value is not None:
+                    value = serializer(value)
+                result[key] = value
+
+            if ROOT_KEY in result:
+                return result[ROOT_KEY]
+            return result
+
+        return serialize_schema
+
+    def _compile_field(self, field: ModelField) -> Optional[Serializer]:
+        "Returns None when field values can be used as is"
+        if field.sub_fields and field.shape == SHAPE_LIST:
+            item_serializer = self._compile_field(field.sub_fields[0])
+            if item_serializer is None:
+                return None
+            return lambda value: [
+                None if v is None else item_serializer(v) for v in value
+            ]
+
+        if field.shape != SHAPE_SINGLETON or field.sub_fields:
+            return self.serialize
+
+        type_ = field.type_
+        if type_ is Any or not isinstance(type_, type):
+            return self.serialize
+        if issubclass(type_, BaseModel):
+            return self._serialize_schema
+        if issubclass(type_, (dict, list, tuple, set, frozenset)):
+            return self.serialize
+        if type_ is object or hasattr(type_, "__get_validators__"):
+            # custom types can return anything from their validators
+            return self.serialize
+        return None
+
+    def _compile_trusted_field(
+        self, field: ModelField, model: Type[BaseModel]
+    ) -> Optional[Serializer]:
+        "Returns None when field values can be used as is"
+        convert = DjangoGetter.convert_result
+        if field.sub_fields and field.shape == SHAPE_LIST:
+            item_serializer = self._compile_trusted_field(field.sub_fields[0], model)
+            if item_serializer is None:
+                return lambda value: list(convert(value))
+            return lambda value: [
+                None if v is None else item_serializer(v) for v in convert(value)
+            ]
+
+        if field.shape == SHAPE_SINGLETON and not field.sub_fields:
+            type_ = field.type_
+            if (
+                isinstance(type_, type)
+                and issubclass(type_, BaseModel)
+                and self._can_compile(type_)
+                and not type_.__custom_root_type__
+            ):
+                return lambda value: self._trusted_schema_serializer(type_)(value)
+            if self._compile_field(field) is None:
+                return None
+
+        return self._make_validating_serializer(field, model)
+
+    def _make_validating_serializer(
+        self, field: ModelField, model: Type[BaseModel]
+    ) -> Serializer:
+        serializer = self._compile_field(field) or _identity
+
+        def validate(value: Any) -> Any:
+            value = DjangoGetter.convert_result(value)
+            value, errors = field.validate(value, {}, loc=field.alias, cls=model)
+            if errors:
+                raise ValidationError([errors], model)
+            return serializer(value)
+
+        return validate
+
+    def _trusted_schema_serializer(self, schema: Type[BaseModel]) -> Serializer:
+        serializer = self._trusted_schemas.get(schema)
+        if serializer is None:
+            serializer = self._compile_trusted_schema(schema)
+            self._trusted_schemas[schema] = serializer
+        return serializer
+
+    def _compile_trusted_schema(self, schema: Type[BaseModel]) -> Serializer:
+        config = schema.__config__
+        fields: List[TrustedFieldPlan] = []
+        for name, field in schema.__fields__.items():
+            key = field.alias if self.by_alias else name
+            alt_name = None
+            if config.allow_population_by_field_name and field.alt_alias:
+                alt_name = name
+            serializer = self._compile_trusted_field(field, schema)
+            fields.append((key, field.alias, alt_name, field, serializer))
+        return self._make_trusted_schema_serializer(schema, fields)
+
+    def _make_trusted_schema_serializer(
+        self, schema: Type[BaseModel], fields: List[TrustedFieldPlan]
+    ) -> Serializer:
+        getter_dict = get_getter_dict(schema)
+        orm_mode = schema.__config__.orm_mode
+        exclude_unset = self.exclude_unset
+        exclude_defaults = self.exclude_defaults
+        exclude_none = self.exclude_none
+
+        def validated(obj: Any) -> Any:
+            if orm_mode and not isinstance(obj, dict):
+                return self.serialize(schema.from_orm(obj))
+            return self.serialize(schema.parse_obj(obj))
+
+        def serialize_trusted(obj: Any) -> Any:
+            if isinstance(obj, BaseModel):
+                return self.serialize(obj)
+            data: Any
+            if isinstance(obj, dict):
+                data = obj
+            elif orm_mode:
+                data = getter_dict(obj)
+            else:
+                return validated(obj)
+
+            result = {}
+            for key, alias, alt_name, field, serializer in fields:
+                value = data.get(alias, _missing)
+                if value is _missing and alt_name is not None:
+                    value = data.get(alt_name, _missing)
+                if value is _missing:
+                    if field.required:
+                        # let validation produce the error
+                        return validated(obj)
+                    if exclude_unset:
+                        continue
+                    value = field.get_default()
+                if exclude_none and value is None:
+                    continue
+                if exclude_defaults and not field.required and value == field.default:
+                    continue
+                if serializer is not None and value is not None:
+                    value = serializer(value)
+                result[key] = value
+            return result
+
+        return serialize_trusted
+
+    def _can_compile(self, schema: Type[BaseModel]) -> bool:
+        return (
+            getattr(schema, "__exclude_fields__", None) is None
+            and getattr(schema, "__include_fields__", None) is None
+            and not getattr(schema.__config__, "use_enum_values", False)
+        )
+
+    def _schema_dict(self, value: BaseModel) -> Any:
+        result = value.dict(
+            by_alias=self.by_alias,
+            exclude_unset=self.exclude_unset,
+            exclude_defaults=self.exclude_defaults,
+            exclude_none=self.exclude_none,
+        )
+        if ROOT_KEY in result:
+            return result[ROOT_KEY]
+        return result
+
+
+def _identity(value: Any) -> Any:
+    return value
@@ -1,14 +1,16 @@
+import collections.abc
 import inspect
 import warnings
 from collections import defaultdict, namedtuple
-from typing import Any, Callable, Dict, Generator, List, Tuple
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
 import pydantic
 
 from ninja import UploadedFile, params
 from ninja.compatibility.util import get_origin as get_collection_origin
 from ninja.errors import ConfigError
-from ninja.params import Body, File, Form, _MultiPartBody
+from ninja.params import Body, File, Form, _MultiPartBody, _StreamBody
+from ninja.params_coercers import create_coercer
 from ninja.params_models import TModel, TModels
 from ninja.signature.utils import get_path_param_names, get_typed_signature
 
@@ -106,6 +108,15 @@ class ViewSignature:
         if is_multipart_response_with_body:
             params_by_source_cls[_MultiPartBody] = params_by_source_cls.pop(Body)
 
+        stream_body = params_by_source_cls.get(_StreamBody)
+        if stream_body and (
+            len(stream_body) > 1
+            or {Body, _MultiPartBody, File, Form} & set(params_by_source_cls)
+        ):
+            raise ConfigError(
+                f"Body(stream=True) must be the only body parameter ({self.view_func})"
+            )
+
         result = []
         for param_cls, args in params_by_source_cls.items():
             cls_name: str = param_cls.__name__ + "Params"
@@ -114,7 +125,11 @@ class ViewSignature:
             attrs["_flatten_map_reverse"] = {}
 
             if attrs["_param_source"] == "file":
-                pass
+                attrs["_upload_limits"] = {
+                    i.alias: i.source.upload_limits
+                    for i in args
+                    if getattr(i.source, "upload_limits", None)
+                }
 
             elif attrs["_param_source"] in {
                 "form",
@@ -133,12 +148,24 @@ class ViewSignature:
                 assert attrs["_param_source"] == "body"
                 if is_multipart_response_with_body:
                     attrs["_body_params"] = {i.alias: i.annotation for i in args}
+                elif param_cls is _StreamBody:
+                    attrs["_stream_attr"] = args[0].name
+                    attrs["_stream_alias"] = args[0].alias
                 else:
                     # ::TODO:: this is still sus.  build some test cases
                     attrs["_single_attr"] = args[0].name if len(args) == 1 else None
 
             # adding annotations
             attrs["__annotations__"] = {i.name: i.annotation for i in args}
+            if param_cls is _StreamBody:
+                arg = args[0]
+                item_type = get_stream_item_type(arg.annotation)
+                if item_type is None:
+                    raise ConfigError(
+                        f"Body(stream=True) param '{arg.name}' must be annotated "
+                        "as List[...] or Iterator[...]"
+                    )
+                attrs["__annotations__"] = {arg.name: List[item_type]}  # type: ignore
 
             # collection fields:
             attrs["_collection_fields"] = detect_collection_fields(
@@ -147,6 +174,15 @@ class ViewSignature:
 
             base_cls = param_cls._model
             model_cls = type(cls_name, (base_cls,), attrs)
+            if param_cls is _StreamBody:
+                list_field = model_cls.__fields__[args[0].name]  # type: ignore
+                model_cls._item_field = list_field.sub_fields[0]  # type: ignore
+
+            if attrs["_param_source"] in {"query", "header", "path"}:
+                # scalar-only params are converted without creating model instance
+                model_cls._coercer = create_coercer(  # type: ignore
+                    model_cls, attrs["__annotations__"]
+                )
             # TODO: https://pydantic-docs.helpmanual.io/usage/models/#dynamic-model-creation - check if anything special in create_model method that I did not use
             result.append(model_cls)
         return result
@@ -255,6 +291,15 @@ def is_collection_type(annotation: Any) -> bool:
         return origin in types  # TODO: I guess we should handle only list
 
 
+def get_stream_item_type(annotation: Any) -> Optional[Any]:
+    "Item type of List[X], Iterator[X] or Iterable[X] (Body(stream=True) params)"
+    origin = get_collection_origin(annotation)
+    stream_types = (List, list, collections.abc.Iterator, collections.abc.Iterable)
+    if origin in stream_types and getattr(annotation, "__args__", None):
+        return annotation.__args__[0]
+    return None
+
+
 def detect_collection_fields(
     args: List[FuncParam], flatten_map: Dict[str, Tuple[str, ...]]
 ) -> List[str]:
@@ -14,10 +14,16 @@ def normalize_path(path: str) -> str:
     return path
 
 
+_csrf_middleware: Optional[CsrfViewMiddleware] = None
+
+
 def check_csrf(
     request: HttpRequest, callback: Callable
 ) -> Optional[HttpResponseForbidden]:
-    mware = CsrfViewMiddleware(lambda x: HttpResponseForbidden())  # pragma: no cover
+    global _csrf_middleware
+    if _csrf_middleware is None:  # created once - as django does with middlewares
+        _csrf_middleware = CsrfViewMiddleware(lambda x: HttpResponseForbidden())
+    mware = _csrf_middleware
     request.csrf_processing_done = False  # type: ignore
     mware.process_request(request)
     return mware.process_view(request, callback, (), {})
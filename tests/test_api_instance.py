@@ -4,6 +4,7 @@ import pytest
 
 from ninja import NinjaAPI, Router
 from ninja.errors import ConfigError
+from ninja.testing import TestClient
 
 api = NinjaAPI()
 router = Router()
@@ -45,3 +46,42 @@ def test_reuse_router_error():
     # The error should be ignored under debug server to allow other errors to be reported
     with mock.patch("ninja.main._imported_while_running_in_debug_server", True):
         test_api.add_router("/another-path", test_router)
+
+
+def test_operation_plan():
+    test_api = NinjaAPI(csrf=True, auth=lambda request: True)
+
+    @test_api.get("/plan/{item_id}", response={201: int})
+    def plan_op(request, item_id: int, q: str = "x"):
+        return item_id
+
+    operation = test_api.default_router.path_operations["/plan/{item_id}"]
+    operation = operation.operations[0]
+    assert operation._checks == [
+        operation._run_authentication,
+        operation._run_csrf,
+    ]
+    assert [source for _, source, _ in operation._param_models] == [
+        ("path",),
+        ("query",),
+    ]
+    assert operation._default_status == 201
+    assert operation._content_type == "application/json; charset=utf-8"
+
+
+def test_custom_create_response():
+    class CustomAPI(NinjaAPI):
+        def create_response(self, request, data, *, status=200):
+            response = super().create_response(request, data, status=status)
+            response["X-Custom"] = "yes"
+            return response
+
+    test_api = CustomAPI()
+
+    @test_api.get("/custom")
+    def custom_op(request):
+        return {"custom": True}
+
+    response = TestClient(test_api).get("/custom")
+    assert response.json() == {"custom": True}
+    assert response["X-Custom"] == "yes"
@@ -0,0 +1,132 @@
+import asyncio
+
+import django
+import pytest
+from django.core.exceptions import SynchronousOnlyOperation
+
+from ninja import NinjaAPI
+from ninja.errors import HttpError
+from ninja.security import APIKeyQuery, HttpBearer
+from ninja.security.base import AuthBase
+from ninja.testing import TestAsyncClient, TestClient
+
+
+class AsyncBearer(HttpBearer):
+    async def authenticate(self, request, token):
+        await asyncio.sleep(0)
+        if token == "secret":
+            return token
+
+
+class AsyncCallable(AuthBase):
+    openapi_type = "apiKey"
+
+    async def __call__(self, request):
+        await asyncio.sleep(0)
+        if request.GET.get("call") == "secret":
+            return "call"
+
+
+class SyncKey(APIKeyQuery):
+    def authenticate(self, request, key):
+        if key == "secret":
+            return key
+
+
+async def async_function_auth(request):
+    if request.GET.get("function") == "error":
+        raise HttpError(403, "Forbidden")
+    if request.GET.get("function") == "secret":
+        return "function"
+
+
+api = NinjaAPI(auth=[AsyncBearer(), AsyncCallable(), SyncKey(), async_function_auth])
+
+
+@api.get("/async")
+async def async_view(request):
+    return {"auth": request.auth}
+
+
+@api.get("/sync")
+def sync_view(request):
+    return {"auth": request.auth}
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher")
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url,headers,status,auth",
+    [
+        ("/async", {}, 401, None),
+        ("/async", {"Authorization": "Bearer secret"}, 200, "secret"),
+        ("/async", {"Authorization": "Bearer wrong"}, 401, None),
+        ("/async?call=secret", {}, 200, "call"),
+        ("/async?key=secret", {}, 200, "secret"),
+        ("/async?function=secret", {}, 200, "function"),
+        ("/async?function=error", {}, 403, None),
+    ],
+)
+async def test_async_operation(url, headers, status, auth):
+    response = await TestAsyncClient(api).get(url, headers=headers)
+    assert response.status_code == status
+    if status == 200:
+        assert response.json() == {"auth": auth}
+
+
+@pytest.mark.parametrize(
+    "url,headers,status,auth",
+    [
+        ("/sync", {}, 401, None),
+        ("/sync", {"Authorization": "Bearer secret"}, 200, "secret"),
+        ("/sync?call=secret", {}, 200, "call"),
+        ("/sync?function=secret", {}, 200, "function"),
+        ("/sync?function=error", {}, 403, None),
+    ],
+)
+def test_sync_operation(url, headers, status, auth):
+    response = TestClient(api).get(url, headers=headers)
+    assert response.status_code == status
+    if status == 200:
+        assert response.json() == {"auth": auth}
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher")
+@pytest.mark.asyncio
+async def test_sync_callback_using_database():
+    calls = []
+
+    def db_auth(request):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            calls.append("thread")
+            return "user"
+        calls.append("event loop")
+        raise SynchronousOnlyOperation("You cannot call this from an async context")
+
+    api = NinjaAPI()
+
+    @api.get("/db", auth=db_auth)
+    async def view(request):
+        return request.auth
+
+    client = TestAsyncClient(api)
+    assert (await client.get("/db")).json() == "user"
+    assert (await client.get("/db")).json() == "user"
+    # after the first failure the callback is always called in a thread
+    assert calls == ["event loop", "thread", "thread"]
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher")
+@pytest.mark.asyncio
+async def test_async_operation_with_csrf():
+    api = NinjaAPI(csrf=True, auth=AsyncBearer())
+
+    @api.post("/csrf")
+    async def view(request):
+        return request.auth
+
+    client = TestAsyncClient(api)
+    response = await client.post("/csrf", headers={"Authorization": "Bearer secret"})
+    assert response.json() == "secret"
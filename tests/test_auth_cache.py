@@ -0,0 +1,171 @@
+import asyncio
+from base64 import b64encode
+from unittest import mock
+
+import django
+import pytest
+
+from ninja import NinjaAPI
+from ninja.errors import HttpError
+from ninja.security import (
+    APIKeyQuery,
+    AuthCache,
+    HttpBasicAuth,
+    HttpBearer,
+)
+from ninja.testing import TestAsyncClient, TestClient
+
+calls = []
+
+
+class Bearer(HttpBearer):
+    auth_cache = AuthCache(ttl=60, negative_ttl=10)
+
+    def authenticate(self, request, token):
+        calls.append(token)
+        if token == "error":
+            raise HttpError(403, "Forbidden")
+        if token.startswith("valid"):
+            return {"token": token}
+
+
+class Key(APIKeyQuery):
+    auth_cache = AuthCache()
+
+    def authenticate(self, request, key):
+        calls.append(key)
+        if key == "valid":
+            return key
+
+
+class Basic(HttpBasicAuth):
+    auth_cache = AuthCache()
+
+    def authenticate(self, request, username, password):
+        calls.append(username)
+        if password == "secret":
+            return username
+
+
+class AsyncBearer(HttpBearer):
+    auth_cache = AuthCache(negative_ttl=10)
+
+    async def authenticate(self, request, token):
+        await asyncio.sleep(0)
+        calls.append(token)
+        if token == "valid":
+            return token
+
+
+api = NinjaAPI()
+
+
+@api.get("/bearer", auth=Bearer())
+def bearer(request):
+    return request.auth
+
+
+@api.get("/key", auth=Key())
+def key(request):
+    return request.auth
+
+
+@api.get("/basic", auth=Basic())
+def basic(request):
+    return request.auth
+
+
+@api.get("/async", auth=AsyncBearer())
+async def async_view(request):
+    return request.auth
+
+
+client = TestClient(api)
+
+
+def get_bearer(token):
+    return client.get("/bearer", headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    for auth in (Bearer, Key, Basic, AsyncBearer):
+        auth.auth_cache.clear()
+    calls.clear()
+
+
+def test_cached_result():
+    assert get_bearer("valid-1").json() == {"token": "valid-1"}
+    assert get_bearer("valid-1").json() == {"token": "valid-1"}
+    assert get_bearer("valid-2").json() == {"token": "valid-2"}
+    assert calls == ["valid-1", "valid-2"]
+
+
+def test_expiration():
+    with mock.patch("ninja.cache.monotonic", return_value=0):
+        get_bearer("valid")
+        get_bearer("invalid")
+    with mock.patch("ninja.cache.monotonic", return_value=30):
+        get_bearer("valid")
+        get_bearer("invalid")  # negative cache expired
+    with mock.patch("ninja.cache.monotonic", return_value=61):
+        get_bearer("valid")
+    assert calls == ["valid", "invalid", "invalid", "valid"]
+
+
+def test_negative_cache():
+    assert get_bearer("invalid").status_code == 401
+    assert get_bearer("invalid").status_code == 401
+    assert calls == ["invalid"]
+
+    # not cached without negative_ttl
+    assert client.get("/key?key=invalid").status_code == 401
+    assert client.get("/key?key=invalid").status_code == 401
+    assert calls == ["invalid", "invalid", "invalid"]
+
+
+def test_exceptions_are_not_cached():
+    assert get_bearer("error").status_code == 403
+    assert get_bearer("error").status_code == 403
+    assert calls == ["error", "error"]
+
+
+def test_invalidate():
+    get_bearer("valid")
+    Bearer.auth_cache.invalidate("valid")
+    get_bearer("valid")
+    assert calls == ["valid", "valid"]
+
+
+def test_credentials_are_hashed():
+    get_bearer("valid")
+    keys = list(Bearer.auth_cache._cache._data)
+    assert keys and all(b"valid" not in key for key in keys)
+
+
+def test_api_key_and_basic():
+    assert client.get("/key?key=valid").json() == "valid"
+    assert client.get("/key?key=valid").json() == "valid"
+    # missing credential is never cached
+    assert client.get("/key").status_code == 401
+    assert client.get("/key").status_code == 401
+    assert calls == ["valid", None, None]
+
+    headers = {"Authorization": "Basic " + b64encode(b"user:secret").decode()}
+    assert client.get("/basic", headers=headers).json() == "user"
+    assert client.get("/basic", headers=headers).json() == "user"
+    headers = {"Authorization": "Basic " + b64encode(b"user:wrong").decode()}
+    assert client.get("/basic", headers=headers).status_code == 401
+    assert calls == ["valid", None, None, "user", "user"]
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher")
+@pytest.mark.asyncio
+async def test_async_authenticate():
+    client = TestAsyncClient(api)
+    for token in ["valid", "valid", "invalid", "invalid"]:
+        response = await client.get(
+            "/async", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == (200 if token == "valid" else 401)
+    assert calls == ["valid", "invalid"]
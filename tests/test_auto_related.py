@@ -0,0 +1,245 @@
+from typing import List, Optional
+
+import pytest
+from django.contrib.auth.models import Group, Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Prefetch
+from someapp.models import Category, Event
+
+from ninja import NinjaAPI, Schema
+from ninja.orm import create_schema
+from ninja.orm.related import get_related_lookups, optimize_queryset
+from ninja.pagination import LimitOffsetPagination, paginate
+from ninja.testing import TestClient
+
+
+class ContentTypeSchema(Schema):
+    app_label: str
+
+
+class PermissionSchema(Schema):
+    codename: str
+    content_type: ContentTypeSchema
+
+
+class GroupSchema(Schema):
+    name: str
+    permissions: List[PermissionSchema]
+
+
+class UserSchema(Schema):
+    username: str
+    groups: List[GroupSchema]
+
+
+class CategorySchema(Schema):
+    title: str
+
+
+class EventSchema(Schema):
+    title: str
+    category: Optional[CategorySchema]
+
+
+class CategoryWithEvent(Schema):
+    title: str
+    event: Optional[EventSchema]  # reverse one-to-one
+
+
+class GroupWithUsers(Schema):
+    name: str
+    user_set: List["UserWithGroups"]
+
+
+class UserWithGroups(Schema):
+    username: str
+    groups: List[GroupWithUsers]
+
+
+GroupWithUsers.update_forward_refs()
+
+# ModelSchema: foreign keys are read by attname (category_id), m2m by name
+EventModelSchema = create_schema(Event, fields=["title", "category"])
+GroupModelSchema = create_schema(Group, fields=["name", "permissions"])
+
+
+def test_lookups():
+    assert get_related_lookups(UserSchema, User) == (
+        (),
+        ("groups", "groups__permissions", "groups__permissions__content_type"),
+    )
+    assert get_related_lookups(PermissionSchema, Permission) == (
+        ("content_type",),
+        (),
+    )
+    assert get_related_lookups(EventSchema, Event) == (("category",), ())
+    assert get_related_lookups(CategoryWithEvent, Category) == (
+        ("event", "event__category"),
+        (),
+    )
+    assert get_related_lookups(UserWithGroups, User) == (
+        (),
+        ("groups", "groups__user_set"),
+    )
+    assert get_related_lookups(EventModelSchema, Event) == ((), ())
+    assert get_related_lookups(GroupModelSchema, Group) == ((), ("permissions",))
+
+
+api = NinjaAPI()
+
+
+@api.get("/users", response=List[UserSchema])
+def users(request):
+    return User.objects.order_by("id")
+
+
+@api.get("/users/manager", response=List[UserSchema])
+def users_manager(request):
+    return User.objects
+
+
+@api.get("/users/raw", response=List[UserSchema], auto_related=False)
+def users_raw(request):
+    return User.objects.order_by("id")
+
+
+@api.get("/users/stream", response=List[UserSchema], stream=True)
+def users_stream(request):
+    return User.objects.order_by("id")
+
+
+@api.get(
+    "/users/stream-raw", response=List[UserSchema], stream=True, auto_related=False
+)
+def users_stream_raw(request):
+    return User.objects
+
+
+@api.get("/users/paged-raw", response=List[UserSchema], auto_related=False)
+@paginate(LimitOffsetPagination)
+def users_paged_raw(request, **kwargs):
+    return User.objects.order_by("id")
+
+
+@api.get("/users/paged", response=List[UserSchema])
+@paginate(LimitOffsetPagination, count="window")
+def users_paged(request, **kwargs):
+    return User.objects.order_by("id")
+
+
+@api.get("/users/{int:user_id}", response=UserSchema)
+def user(request, user_id: int):
+    return User.objects.get(id=user_id)
+
+
+@api.get("/events", response=List[EventSchema])
+def events(request):
+    return Event.objects.order_by("id")
+
+
+@api.get("/events/evaluated", response=List[EventSchema])
+def events_evaluated(request):
+    events = Event.objects.order_by("id")
+    for event in events:
+        event.title = event.title.upper()
+    return events
+
+
+@api.get("/events/deferred", response=List[EventSchema])
+def events_deferred(request, only: bool = False):
+    if only:
+        return Event.objects.only("title").order_by("id")
+    return Event.objects.defer("category").order_by("id")
+
+
+client = TestClient(api)
+
+
+def create_users(count):
+    content_type = ContentType.objects.get_for_model(User)
+    for i in range(count):
+        user = User.objects.create(username=f"u{i}")
+        group = Group.objects.create(name=f"g{i}")
+        group.permissions.add(
+            Permission.objects.create(
+                codename=f"p{i}", name=f"p{i}", content_type=content_type
+            )
+        )
+        user.groups.add(group)
+
+
+@pytest.mark.django_db
+def test_prefetch(django_assert_num_queries):
+    create_users(3)
+    expected = {
+        "username": "u0",
+        "groups": [
+            {
+                "name": "g0",
+                "permissions": [
+                    {"codename": "p0", "content_type": {"app_label": "auth"}}
+                ],
+            }
+        ],
+    }
+    # users + groups + permissions + content types
+    with django_assert_num_queries(4):
+        response = client.get("/users").json()
+    assert len(response) == 3
+    assert response[0] == expected
+
+    with django_assert_num_queries(4):
+        assert len(client.get("/users/manager").json()) == 3
+
+    with django_assert_num_queries(1 + 3 * 3):
+        assert client.get("/users/raw").json()[0] == expected
+
+    with django_assert_num_queries(4):
+        assert client.get("/users/paged?limit=2").json()["count"] == 3
+
+    with django_assert_num_queries(1 + 2 * 3):
+        assert client.get("/users/paged-raw?limit=2").json()[0] == expected
+
+    assert client.get("/users/stream").json()[0] == expected
+    assert client.get("/users/stream-raw").json()[0] == expected
+    assert client.get("/users/1").json() == expected
+
+
+@pytest.mark.django_db
+def test_select_related(django_assert_num_queries):
+    for i in range(3):
+        category = Category.objects.create(title=f"c{i}")
+        Event.objects.create(
+            title=f"e{i}",
+            category=category,
+            start_date="2020-01-01",
+            end_date="2020-01-01",
+        )
+    with django_assert_num_queries(1):
+        response = client.get("/events").json()
+    assert response[0] == {"title": "e0", "category": {"title": "c0"}}
+
+    # querysets evaluated by the view are not queried again
+    with django_assert_num_queries(1 + 3):
+        response = client.get("/events/evaluated").json()
+    assert response[0] == {"title": "E0", "category": {"title": "c0"}}
+
+    # .only()/.defer() querysets are left as is (relations are lazy-loaded)
+    for path in ("/events/deferred", "/events/deferred?only=true"):
+        response = client.get(path).json()
+        assert response[0] == {"title": "e0", "category": {"title": "c0"}}
+
+
+@pytest.mark.django_db
+def test_optimize_queryset():
+    queryset = User.objects.prefetch_related(
+        Prefetch("groups", queryset=Group.objects.order_by("-name"))
+    )
+    optimized = optimize_queryset(queryset, UserSchema)
+    assert optimized._prefetch_related_lookups[1:] == (
+        "groups__permissions",
+        "groups__permissions__content_type",
+    )
+    values = User.objects.values("username")
+    assert optimize_queryset(values, UserSchema) is values
+    assert optimize_queryset([1], UserSchema) == [1]
@@ -0,0 +1,198 @@
+import asyncio
+import json
+from types import ModuleType
+from typing import List
+
+import django
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import path, resolve
+
+from ninja import NinjaAPI, Query, Schema
+from ninja.security import HttpBearer
+from ninja.testing import TestAsyncClient, TestClient
+
+
+class Bearer(HttpBearer):
+    def authenticate(self, request, token):
+        if token == "secret":
+            return token
+
+
+class Item(Schema):
+    name: str
+    price: float
+
+
+api = NinjaAPI(auth=Bearer(), batch_url="/batch", urls_namespace="batch")
+
+
+@api.get("/items/{int:item_id}")
+def get_item(request, item_id: int, fields: List[str] = Query(None)):
+    return {"id": item_id, "fields": fields, "path": request.path}
+
+
+@api.post("/items", response={201: Item})
+def create_item(request, item: Item):
+    return 201, item
+
+
+@api.get("/numbers", response=List[int], stream=True)
+def numbers(request):
+    return range(3)
+
+
+@api.get("/text")
+def text(request):
+    return HttpResponse("plain text")
+
+
+@api.get("/public", auth=None)
+def public(request):
+    return "public"
+
+
+@api.get("/fail")
+def fail(request):
+    raise RuntimeError("boom")
+
+
+client = TestClient(api)
+headers = {"Authorization": "Bearer secret"}
+
+
+def test_batch():
+    batch = [
+        {"path": "/items/1", "query": {"fields": ["name", "price"]}},
+        {"method": "post", "path": "/items", "body": {"name": "a", "price": 1}},
+        {"method": "POST", "path": "items", "body": {"name": "a"}},
+        {"path": "/items/2?fields=name"},
+        {"path": "/numbers"},
+        {"path": "/text"},
+        {"path": "/unknown"},
+        {"method": "DELETE", "path": "/items"},
+    ]
+    response = client.post("/batch", json=batch, headers=headers)
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["status"] for r in results] == [200, 201, 422, 200, 200, 200, 404, 405]
+    assert results[0]["body"] == {
+        "id": 1,
+        "fields": ["name", "price"],
+        "path": "/items/1",
+    }
+    assert results[0]["headers"]["Content-Type"] == "application/json; charset=utf-8"
+    assert results[1]["body"] == {"name": "a", "price": 1.0}
+    assert results[2]["body"]["detail"][0]["loc"] == ["body", "item", "price"]
+    assert results[3]["body"]["fields"] == ["name"]
+    assert results[4]["body"] == [0, 1, 2]
+    assert results[5]["body"] == "plain text"
+    assert results[6] == {"status": 404, "headers": {}, "body": {"detail": "Not Found"}}
+
+
+def test_sub_requests_auth():
+    batch = [{"path": "/items/1"}, {"path": "/public"}]
+    results = client.post("/batch", json=batch).json()
+    assert [r["status"] for r in results] == [401, 200]
+
+
+def test_batch_errors(monkeypatch):
+    response = client.post("/batch", body=b"[", headers=headers)
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Cannot parse request body"}
+
+    response = client.post("/batch", json=[{"method": "GET"}], headers=headers)
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 0, "path"]
+
+    monkeypatch.setattr("ninja.batch.settings.BATCH_MAX_ITEMS", 1)
+    response = client.post("/batch", json=[{"path": "/"}] * 2, headers=headers)
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Too many batch items (max 1)"}
+
+
+def test_unhandled_exception(caplog):
+    batch = [{"path": "/fail"}, {"path": "/items/1"}]
+    results = client.post("/batch", json=batch, headers=headers).json()
+    assert results[0] == {
+        "status": 500,
+        "headers": {},
+        "body": {"detail": "Internal Server Error"},
+    }
+    assert results[1]["status"] == 200
+    assert "Batch sub-request failed" in caplog.text
+
+
+def test_real_request():
+    urlconf = ModuleType("test_batch_urls")
+    urlconf.urlpatterns = [path("api/", api.urls)]
+    batch = [
+        {"path": "/items/1"},
+        {"method": "POST", "path": "/items", "body": {"name": "b", "price": 2}},
+    ]
+    request = RequestFactory().post(
+        "/api/batch",
+        json.dumps(batch),
+        content_type="application/json",
+        HTTP_AUTHORIZATION="Bearer secret",
+    )
+    match = resolve("/api/batch", urlconf)
+    assert match.url_name == "batch"
+    results = json.loads(match.func(request).content)
+    assert results[0]["body"]["path"] == "/api/items/1"
+    assert results[1]["body"] == {"name": "b", "price": 2.0}
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher")
+@pytest.mark.asyncio
+async def test_async_batch():
+    api = NinjaAPI(batch_url="/batch/", route_tree=True)
+    event = asyncio.Event()
+
+    @api.get("/wait")
+    async def wait(request):
+        await asyncio.wait_for(event.wait(), 1)
+        return "waited"
+
+    @api.get("/set")
+    async def set_event(request):
+        event.set()
+        return "set"
+
+    @api.get("/sync")
+    def sync_view(request):
+        return "sync"
+
+    @api.get("/fail")
+    async def fail(request):
+        raise RuntimeError("boom")
+
+    @api.get("/cancel")
+    async def cancel(request):
+        raise asyncio.CancelledError()
+
+    batch = [
+        {"path": "/wait"},
+        {"path": "/set"},
+        {"path": "/sync"},
+        {"path": "/x"},
+        {"path": "/fail"},
+    ]
+    # /wait finishes only if /set runs concurrently
+    response = await TestAsyncClient(api).post("/batch/", json=batch)
+    results = response.json()
+    assert [r["body"] for r in results] == [
+        "waited",
+        "set",
+        "sync",
+        {"detail": "Not Found"},
+        {"detail": "Internal Server Error"},
+    ]
+    assert results[4]["status"] == 500
+
+    with pytest.raises(asyncio.CancelledError):
+        await TestAsyncClient(api).post("/batch/", json=[{"path": "/cancel"}])
+
+    response = await TestAsyncClient(api).post("/batch/", body=b"{")
+    assert response.status_code == 400
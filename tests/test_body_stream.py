@@ -0,0 +1,141 @@
+import json
+from io import BytesIO
+from types import ModuleType
+from typing import Iterator, List
+
+import pytest
+from django.test import RequestFactory
+from django.urls import path, resolve
+
+from ninja import Body, NinjaAPI, Schema
+from ninja.errors import ConfigError
+from ninja.parser import JSONArrayReader, Parser
+from ninja.testing import TestClient
+
+
+class Item(Schema):
+    name: str
+    price: float = 0
+
+
+class SmallChunksParser(Parser):
+    stream_chunk_size = 3
+
+
+api = NinjaAPI(parser=SmallChunksParser())
+
+
+@api.post("/import")
+def bulk_import(request, items: Iterator[Item] = Body(..., stream=True)):
+    names = []
+    for item in items:
+        assert isinstance(item, Item)
+        names.append(item.name)
+    return {"names": names}
+
+
+@api.post("/import-list")
+def bulk_import_list(request, items: List[int] = Body(..., stream=True)):
+    return sum(items)
+
+
+client = TestClient(api)
+
+ITEMS = [{"name": "ы", "price": 12345}, {"name": "b"}, {"name": "c", "price": 1.5}]
+
+
+def test_json_array():
+    response = client.post("/import", json=ITEMS)
+    assert response.json() == {"names": ["ы", "b", "c"]}
+
+    body = b" \n[ 1 ,\n 22,333  ,4444] \n"
+    assert client.post("/import-list", body=body).json() == 4800
+    assert client.post("/import-list", body=b"[]").json() == 0
+    assert client.post("/import-list", body="").json() == 0
+
+
+def test_ndjson():
+    body = "\n".join(json.dumps(item) for item in ITEMS) + "\n\n"
+    response = client.post(
+        "/import",
+        body=body.encode(),
+        headers={"Content-Type": "application/x-ndjson; charset=utf-8"},
+    )
+    assert response.json() == {"names": ["ы", "b", "c"]}
+
+
+def test_item_errors():
+    response = client.post("/import", json=[{"name": "a"}, {"price": "x"}])
+    assert response.status_code == 422
+    assert response.json() == {
+        "detail": [
+            {
+                "loc": ["body", "items", 1, "name"],
+                "msg": "field required",
+                "type": "value_error.missing",
+            },
+            {
+                "loc": ["body", "items", 1, "price"],
+                "msg": "value is not a valid float",
+                "type": "type_error.float",
+            },
+        ]
+    }
+
+    response = client.post("/import-list", body=b"[1, 2, oops]")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Cannot parse request body"}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"{}", b"[1 2]", b"[1, 2] 3", b"[1, 2", b"[1, ", b'["abc'],
+)
+def test_invalid_json(body):
+    reader = JSONArrayReader(BytesIO(body), chunk_size=2)
+    with pytest.raises(ValueError):
+        list(reader)
+
+
+def test_real_request():
+    urlconf = ModuleType("test_body_stream_urls")
+    urlconf.urlpatterns = [path("api/", api.urls)]
+    request = RequestFactory().post(
+        "/api/import", json.dumps(ITEMS), content_type="application/json"
+    )
+    match = resolve("/api/import", urlconf)
+    response = match.func(request)
+    assert json.loads(response.content) == {"names": ["ы", "b", "c"]}
+    assert "_body" not in request.__dict__  # body was not loaded into memory
+
+
+def test_schema():
+    schema = api.get_openapi_schema()["paths"]["/api/import"]["post"]
+    assert schema["requestBody"] == {
+        "content": {
+            "application/json": {
+                "schema": {
+                    "title": "Items",
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/Item"},
+                }
+            }
+        },
+        "required": True,
+    }
+
+
+def test_config_errors():
+    api = NinjaAPI()
+
+    with pytest.raises(ConfigError):
+
+        @api.post("/two")
+        def two(request, a: List[int] = Body(..., stream=True), b: int = Body(...)):
+            pass
+
+    with pytest.raises(ConfigError):
+
+        @api.post("/annotation")
+        def annotation(request, a: Item = Body(..., stream=True)):
+            pass
@@ -0,0 +1,39 @@
+from unittest import mock
+
+from ninja.cache import TTLCache
+
+
+def test_ttl():
+    cache = TTLCache(ttl=10)
+    with mock.patch("ninja.cache.monotonic", return_value=100):
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=20)
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+
+    with mock.patch("ninja.cache.monotonic", return_value=110):
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert len(cache) == 1
+
+
+def test_lru():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_delete_and_clear():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
@@ -4,3 +4,4 @@ from ninja.conf import settings
 def test_default_configuration():
     assert settings.PAGINATION_CLASS == "ninja.pagination.LimitOffsetPagination"
     assert settings.PAGINATION_PER_PAGE == 100
+    assert settings.STREAM_CHUNK_SIZE == 2000
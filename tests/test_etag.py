@@ -0,0 +1,138 @@
+from typing import List
+
+import django
+import pytest
+from django.http import HttpResponse, StreamingHttpResponse
+
+from ninja import NinjaAPI
+from ninja.errors import ConfigError
+from ninja.testing import TestAsyncClient, TestClient
+
+api = NinjaAPI()
+versions = {"1": 1}
+calls = []
+
+
+@api.get("/items", response=List[int], etag=True)
+def items(request):
+    calls.append("items")
+    return [1, 2, 3]
+
+
+@api.get("/items/{item_id}", etag=lambda request, item_id: versions[item_id])
+def item(request, item_id: str):
+    calls.append("item")
+    return {"id": item_id, "version": versions[item_id]}
+
+
+@api.api_operation(["GET", "POST"], "/empty", etag=True)
+def empty(request):
+    return HttpResponse()
+
+
+@api.get("/stream", etag=True)
+def stream(request):
+    return StreamingHttpResponse([b"1"])
+
+
+@api.get("/custom", etag=True)
+def custom(request):
+    response = HttpResponse("custom")
+    response["ETag"] = '"custom"'
+    return response
+
+
+@api.get("/missing", etag=True)
+def missing(request):
+    return HttpResponse("Not Found", status=404)
+
+
+client = TestClient(api)
+
+
+def test_etag_from_body():
+    response = client.get("/items")
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert etag.startswith('"') and len(etag) == 34
+
+    response = client.get("/items", META={"HTTP_IF_NONE_MATCH": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response["ETag"] == etag
+
+    response = client.get("/items", META={"HTTP_IF_NONE_MATCH": '"other"'})
+    assert response.status_code == 200
+
+    response = client.get("/items", META={"HTTP_IF_MATCH": '"other"'})
+    assert response.status_code == 412
+
+
+def test_etag_callable():
+    del calls[:]
+    response = client.get("/items/1")
+    assert response.status_code == 200
+    assert response["ETag"] == '"1"'
+    assert calls == ["item"]
+
+    response = client.get("/items/1", META={"HTTP_IF_NONE_MATCH": '"1"'})
+    assert response.status_code == 304
+    assert response["ETag"] == '"1"'
+    assert calls == ["item"]  # view was not called
+
+    versions["1"] = 2
+    response = client.get("/items/1", META={"HTTP_IF_NONE_MATCH": '"1"'})
+    assert response.status_code == 200
+    assert response.json() == {"id": "1", "version": 2}
+    assert response["ETag"] == '"2"'
+
+
+def test_skipped_responses():
+    for path in ["/empty", "/stream", "/missing"]:
+        response = client.get(path, META={"HTTP_IF_NONE_MATCH": "*"})
+        assert not response._response.has_header("ETag")
+        assert response.status_code != 304
+
+    response = client.post("/empty", META={"HTTP_IF_NONE_MATCH": "*"})
+    assert response.status_code == 200
+
+    response = client.get("/custom", META={"HTTP_IF_NONE_MATCH": '"custom"'})
+    assert response.status_code == 304
+
+
+def test_invalid_etag():
+    api = NinjaAPI()
+
+    with pytest.raises(ConfigError, match="etag must be a bool or a callable"):
+
+        @api.get("/", etag="yes")
+        def view(request):
+            pass
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher")
+@pytest.mark.asyncio
+async def test_async_etag():
+    api = NinjaAPI()
+
+    async def version(request):
+        return "v1"
+
+    @api.get("/async", etag=version)
+    async def view(request):
+        return "data"
+
+    @api.get("/async-body", etag=True)
+    async def body_view(request):
+        return "data"
+
+    client = TestAsyncClient(api)
+    response = await client.get("/async")
+    assert response["ETag"] == '"v1"'
+    response = await client.get("/async", META={"HTTP_IF_NONE_MATCH": '"v1"'})
+    assert response.status_code == 304
+
+    response = await client.get("/async-body")
+    etag = response["ETag"]
+    response = await client.get("/async-body", META={"HTTP_IF_NONE_MATCH": etag})
+    assert response.status_code == 304
@@ -0,0 +1,127 @@
+import hashlib
+import json
+from types import ModuleType
+from typing import List
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory
+from django.urls import path, resolve
+from django.utils.datastructures import MultiValueDict
+
+from ninja import File, Form, NinjaAPI, UploadedFile
+from ninja.errors import ConfigError
+from ninja.testing import TestClient
+
+api = NinjaAPI(csrf=True)
+
+
+@api.post("/avatar")
+def avatar(
+    request,
+    file: UploadedFile = File(
+        ..., max_size=10, content_types=["image/*"], hash_algorithm="md5"
+    ),
+):
+    return {"name": file.name, "hash": file.hash, "data": file.read().decode()}
+
+
+@api.post("/documents")
+def documents(
+    request,
+    title: str = Form(...),
+    files: List[UploadedFile] = File(..., max_files=2, memory_size=4),
+    other: UploadedFile = File(None),
+):
+    return {
+        "title": title,
+        "files": [f.read().decode() for f in files],
+        "other": other and other.read().decode(),
+    }
+
+
+urlconf = ModuleType("test_file_limits_urls")
+urlconf.urlpatterns = [path("api/", api.urls)]
+
+
+def call(url, data):
+    request = RequestFactory().post(url, data)
+    request._dont_enforce_csrf_checks = True
+    match = resolve(url, urlconf)
+    return match.func(request, **match.kwargs)
+
+
+def image(data=b"img", name="a.png", content_type="image/png"):
+    return SimpleUploadedFile(name, data, content_type=content_type)
+
+
+def test_limits_while_reading():
+    response = call("/api/avatar", {"file": image()})
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "name": "a.png",
+        "hash": hashlib.md5(b"img").hexdigest(),
+        "data": "img",
+    }
+
+    response = call("/api/avatar", {"file": image(b"x" * 11)})
+    assert response.status_code == 413
+    assert json.loads(response.content) == {
+        "detail": "File 'a.png' exceeds max size of 10 bytes"
+    }
+
+    response = call("/api/avatar", {"file": image(content_type="text/plain")})
+    assert response.status_code == 415
+    assert json.loads(response.content) == {
+        "detail": "File 'a.png' has unsupported content type 'text/plain'"
+    }
+
+
+def test_count_and_spooling():
+    files = [image(b"short"), image(b"longer than memory size")]
+    response = call(
+        "/api/documents", {"title": "t", "files": files, "other": image(b"other")}
+    )
+    assert json.loads(response.content) == {
+        "title": "t",
+        "files": ["short", "longer than memory size"],
+        "other": "other",
+    }
+
+    files = [image(b"1"), image(b"2"), image(b"3"), image(b"4")]
+    response = call("/api/documents", {"title": "t", "files": files})
+    assert response.status_code == 400
+    assert json.loads(response.content) == {
+        "detail": "Too many files in 'files' (max 2)"
+    }
+
+
+def test_files_read_before_operation():
+    # limits are still checked if request.FILES was parsed before
+    request = RequestFactory().post("/api/avatar", {"file": image(b"x" * 11)})
+    request._dont_enforce_csrf_checks = True
+    assert request.FILES
+    match = resolve("/api/avatar", urlconf)
+    assert match.func(request).status_code == 413
+
+
+def test_test_client():
+    client = TestClient(api)
+    response = client.post("/avatar", FILES={"file": image()})
+    assert response.json()["hash"] == hashlib.md5(b"img").hexdigest()
+
+    response = client.post("/avatar", FILES={"file": image(content_type="text/plain")})
+    assert response.status_code == 415
+
+    assert client.post("/avatar").status_code == 422
+
+    files = [image(), image(), image()]
+    response = client.post(
+        "/documents", POST={"title": "t"}, FILES=MultiValueDict({"files": files})
+    )
+    assert response.status_code == 400
+
+
+def test_unknown_hash_algorithm():
+    with pytest.raises(ConfigError):
+        File(..., hash_algorithm="unknown")
@@ -0,0 +1,151 @@
+import datetime
+import json
+from decimal import Decimal
+from typing import NamedTuple
+from uuid import UUID
+
+import pytest
+from django.utils.translation import gettext_lazy
+
+from ninja import NinjaAPI, Schema, json_backends
+from ninja.json_backends import (
+    JSONBackend,
+    OrjsonBackend,
+    StdlibJSONBackend,
+    get_default_json_backend,
+)
+from ninja.parser import Parser
+from ninja.renderers import JSONRenderer
+from ninja.responses import NinjaJSONEncoder
+from ninja.testing import TestClient
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Item(Schema):
+    name: str
+    created: datetime.datetime
+
+
+DATA = [
+    {"str": "ünicode", "int": 1, "float": 1.5, "bool": True, "none": None},
+    [1, "2", [3, {"4": 5}]],
+    datetime.datetime(2020, 1, 2, 3, 4, 5, 123456),
+    datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    datetime.date(2020, 1, 2),
+    datetime.time(3, 4, 5, 678901),
+    datetime.timedelta(days=1, seconds=5),
+    Decimal("1.10"),
+    UUID("8c8f4b4d-1111-4d3d-a111-4d4d4d4d4d4d"),
+    gettext_lazy("lazy"),
+    Item(name="item", created=datetime.datetime(2020, 1, 1)),
+    {1: "int key", "nested": {"date": datetime.date(2020, 1, 1)}},
+    2**70,
+    Point(1, 2),
+]
+
+
+@pytest.mark.parametrize("data", DATA)
+@pytest.mark.parametrize("backend", [StdlibJSONBackend(), OrjsonBackend()])
+def test_same_result_as_encoder(backend, data):
+    content = backend.dumps(data)
+    assert isinstance(content, bytes)
+    expected = json.dumps(data, cls=NinjaJSONEncoder)
+    assert json.loads(content) == json.loads(expected)
+    assert backend.loads(content) == json.loads(expected)
+
+
+@pytest.mark.parametrize("backend", [StdlibJSONBackend(), OrjsonBackend()])
+def test_errors(backend):
+    with pytest.raises(ValueError, match="timezone-aware"):
+        backend.dumps(datetime.time(1, tzinfo=datetime.timezone.utc))
+
+    with pytest.raises(TypeError):
+        backend.dumps(object())
+
+    with pytest.raises(ValueError, match="Expecting value"):
+        backend.loads(b"invalid")
+
+
+class Measure(Schema):
+    value: float
+
+
+@pytest.mark.parametrize("backend", [StdlibJSONBackend(), OrjsonBackend()])
+def test_non_finite_floats(backend):
+    data = [1.5, {"nan": float("nan")}, (float("inf"), None)]
+    assert backend.dumps(data) == b'[1.5, {"nan": NaN}, [Infinity, null]]'
+    assert backend.dumps(Measure(value=float("-inf"))) == b'{"value": -Infinity}'
+    # null for None only
+    assert json.loads(backend.dumps([None, {"a": [1.0]}])) == [None, {"a": [1.0]}]
+
+
+def test_orjson_loads_nan_like_stdlib():
+    assert repr(OrjsonBackend().loads("[NaN]")) == "[nan]"
+
+
+def test_default_backend(monkeypatch):
+    assert isinstance(get_default_json_backend(), OrjsonBackend)
+
+    monkeypatch.setattr(json_backends, "orjson", None)
+    assert isinstance(get_default_json_backend(), StdlibJSONBackend)
+    with pytest.raises(ImportError):
+        OrjsonBackend()
+
+
+def test_not_implemented():
+    backend = JSONBackend()
+    with pytest.raises(NotImplementedError):
+        backend.dumps({})
+    with pytest.raises(NotImplementedError):
+        backend.loads(b"{}")
+
+
+class CountingBackend(StdlibJSONBackend):
+    calls = 0
+
+    def dumps(self, data):
+        CountingBackend.calls += 1
+        return super().dumps(data)
+
+    def loads(self, data):
+        CountingBackend.calls += 1
+        return super().loads(data)
+
+
+class CountingRenderer(JSONRenderer):
+    json_backend = CountingBackend()
+
+
+class CountingParser(Parser):
+    json_backend = CountingBackend()
+
+
+class IndentRenderer(CountingRenderer):
+    json_dumps_params = {"indent": 2}
+
+
+def test_renderer_and_parser_backend():
+    api = NinjaAPI(renderer=CountingRenderer(), parser=CountingParser())
+
+    @api.post("/echo")
+    def echo(request, payload: Item):
+        return payload
+
+    CountingBackend.calls = 0
+    response = TestClient(api).post(
+        "/echo", json={"name": "x", "created": "2020-01-01T00:00:00"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"name": "x", "created": "2020-01-01T00:00:00"}
+    assert CountingBackend.calls == 2
+
+
+def test_renderer_with_dumps_params():
+    CountingBackend.calls = 0
+    content = IndentRenderer().render(None, {"a": 1}, response_status=200)
+    assert content == '{\n  "a": 1\n}'
+    assert CountingBackend.calls == 0
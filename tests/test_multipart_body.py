@@ -0,0 +1,93 @@
+import ast
+from typing import List
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from ninja import Body, File, NinjaAPI, Schema, UploadedFile
+from ninja.parser import Parser
+from ninja.testing import TestClient
+
+
+class Data(Schema):
+    name: str
+    tags: List[str] = []
+
+
+def create_api(**kwargs):
+    api = NinjaAPI(**kwargs)
+
+    @api.post("/upload")
+    def upload(
+        request,
+        file: UploadedFile = File(...),
+        title: str = Body(...),
+        count: int = Body(0),
+        data: Data = Body(None),
+    ):
+        return {"file": file.name, "title": title, "count": count, "data": data}
+
+    return api
+
+
+file = SimpleUploadedFile("test.txt", b"data123")
+
+
+def test_fields():
+    client = TestClient(create_api())
+    post = {
+        "title": 'multi\nline \\"title',
+        "count": "3",
+        "data": '{"name": "n", "tags": ["a"]}',
+    }
+    response = client.post("/upload", POST=post, FILES={"file": file})
+    assert response.status_code == 200, response.json()
+    assert response.json() == {
+        "file": "test.txt",
+        "title": 'multi\nline \\"title',
+        "count": 3,
+        "data": {"name": "n", "tags": ["a"]},
+    }
+
+    # quoted strings are json strings
+    response = client.post("/upload", POST={"title": '"a\\tb"'}, FILES={"file": file})
+    assert response.json()["title"] == "a\tb"
+
+    response = client.post("/upload", POST={"title": ""}, FILES={"file": file})
+    assert response.json()["title"] == ""
+
+
+def test_errors():
+    client = TestClient(create_api())
+    response = client.post(
+        "/upload", POST={"title": "t", "count": "{"}, FILES={"file": file}
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Cannot parse request body"}
+
+    response = client.post(
+        "/upload", POST={"title": "t", "count": "x1"}, FILES={"file": file}
+    )
+    assert response.status_code == 400
+
+    response = client.post("/upload", POST={"count": "1"}, FILES={"file": file})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "title"]
+
+
+class LiteralParser(Parser):
+    "Parses python literals"
+
+    def parse_body(self, request):
+        return ast.literal_eval(request.body.decode())
+
+
+def test_custom_parser():
+    client = TestClient(create_api(parser=LiteralParser()))
+    post = {"title": "t", "count": "5", "data": "{'name': 'n', 'tags': ('x', 'y')}"}
+    response = client.post("/upload", POST=post, FILES={"file": file})
+    assert response.json() == {
+        "file": "test.txt",
+        "title": "t",
+        "count": 5,
+        "data": {"name": "n", "tags": ["x", "y"]},
+    }
@@ -0,0 +1,125 @@
+import json
+from typing import List
+
+import pytest
+
+from ninja import NinjaAPI, Router, Schema
+from ninja.renderers import NDJSONRenderer
+from ninja.testing import TestClient
+
+
+class Item(Schema):
+    id: int
+    name: str
+
+
+def lines(response):
+    return [json.loads(line) for line in response.content.splitlines()]
+
+
+api = NinjaAPI()
+router = Router()
+
+
+@api.get("/items", response=List[Item], renderer=NDJSONRenderer())
+def items(request, count: int = 3):
+    return ({"id": i, "name": f"item {i}", "extra": i} for i in range(count))
+
+
+@api.get("/item", response={200: Item, 404: str}, renderer=NDJSONRenderer())
+def item(request, found: bool = True):
+    if not found:
+        return 404, "not found"
+    return {"id": 1, "name": "one"}
+
+
+@router.get("/plain", renderer=NDJSONRenderer())
+def plain(request):
+    return [{"a": 1}, {"b": 2}]
+
+
+@api.get("/json", response=List[Item])
+def default_json(request):
+    return [{"id": 1, "name": "one"}]
+
+
+api.add_router("/router", router)
+
+client = TestClient(api)
+
+
+def test_ndjson_list():
+    response = client.get("/items")
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson; charset=utf-8"
+    assert response.content.endswith(b"\n")
+    assert lines(response) == [{"id": i, "name": f"item {i}"} for i in range(3)]
+
+    response = client.get("/items?count=0")
+    assert response.content == b""
+
+
+def test_ndjson_single_object():
+    response = client.get("/item")
+    assert not response.streaming
+    assert response["Content-Type"] == "application/x-ndjson; charset=utf-8"
+    assert response.content == b'{"id":1,"name":"one"}\n'
+
+    response = client.get("/item?found=false")
+    assert response.status_code == 404
+    assert lines(response) == ["not found"]
+
+
+def test_ndjson_without_response_schema():
+    response = client.get("/router/plain")
+    assert not response.streaming
+    assert lines(response) == [{"a": 1}, {"b": 2}]
+
+
+def test_other_operations_use_api_renderer():
+    response = client.get("/json")
+    assert response["Content-Type"] == "application/json; charset=utf-8"
+    assert response.json() == [{"id": 1, "name": "one"}]
+
+
+def test_ndjson_buffer():
+    class SmallBuffer(NDJSONRenderer):
+        stream_buffer_size = 10
+
+    chunks = list(
+        SmallBuffer().render_stream(None, [1, "long string", 2], response_status=200)
+    )
+    assert chunks == [b'1\n"long string"\n', b"2\n"]
+
+    class Indent(NDJSONRenderer):
+        json_dumps_params = {"indent": None, "separators": (",", ":")}
+
+    assert Indent().render(None, [{"a": 1}], response_status=200) == b'{"a":1}\n'
+
+
+def test_openapi_media_type():
+    schema = api.get_openapi_schema()
+    content = schema["paths"]["/api/items"]["get"]["responses"][200]["content"]
+    assert list(content) == ["application/x-ndjson"]
+    content = schema["paths"]["/api/json"]["get"]["responses"][200]["content"]
+    assert list(content) == ["application/json"]
+
+
+@pytest.mark.parametrize("renderer", [None, NDJSONRenderer()])
+def test_custom_create_response(renderer):
+    class CustomAPI(NinjaAPI):
+        def create_response(self, request, data, *, status=200):
+            response = super().create_response(request, data, status=status)
+            response["X-Custom"] = "yes"
+            return response
+
+    api = CustomAPI()
+
+    @api.get("/item", response=Item, renderer=renderer)
+    def item(request):
+        return {"id": 1, "name": "one"}
+
+    response = TestClient(api).get("/item")
+    # operation renderer is used as is, without going through create_response
+    assert response._response.has_header("X-Custom") == (renderer is None)
@@ -0,0 +1,346 @@
+from typing import List, Optional
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import models
+from django.db.models import F
+from someapp.models import Category, Event
+
+from ninja import NinjaAPI, Schema
+from ninja.orm import create_schema
+from ninja.orm.projection import get_projection, project_queryset
+from ninja.pagination import CursorPagination, LimitOffsetPagination, paginate
+from ninja.testing import TestClient
+
+
+class CategorySchema(Schema):
+    title: str
+
+
+class EventSchema(Schema):
+    title: str
+    category: Optional[CategorySchema]
+
+
+class EventFlat(Schema):
+    pk: int
+    title: str
+    category_id: Optional[int]
+
+
+class EventAnnotated(Schema):
+    title: str
+    category_title: Optional[str]  # annotation
+    missing: str = "default"
+
+
+class UserNamed(Schema):
+    username: str
+    is_anonymous: bool  # property
+
+
+class CategoryRepr(Schema):
+    title: str
+    check: str  # method
+
+
+class EventCategoryRepr(Schema):
+    title: str
+    category: Optional[CategoryRepr]
+
+
+class CategoryWithEvent(Schema):
+    title: str
+    event: Optional[EventSchema]  # reverse one-to-one
+
+
+class CategoryLoop(Schema):
+    title: str
+    event: Optional["EventLoop"]
+
+
+class EventLoop(Schema):
+    title: str
+    category: Optional[CategoryLoop]
+
+
+class GroupSchema(Schema):
+    name: str
+
+
+class UserSchema(Schema):
+    username: str
+    groups: List[GroupSchema]
+
+
+class UserLink(Schema):
+    username: str
+    groups: List["GroupLink"]
+
+
+class GroupLink(Schema):
+    name: str
+    user_set: List[UserLink]
+
+
+class CategoryIds(Schema):
+    event: Optional[Schema]  # no columns read
+
+
+UserLink.update_forward_refs()
+CategoryLoop.update_forward_refs()
+
+# ModelSchema: foreign keys are read by attname (category_id)
+EventModelSchema = create_schema(Event, fields=["id", "title", "category"])
+
+
+def test_projection():
+    assert get_projection(EventSchema, Event) == (
+        ("title", "category__title"),
+        None,
+        (),
+    )
+    assert get_projection(EventFlat, Event) == (
+        ("id", "title", "category"),
+        ("pk", "title", "category_id"),
+        (),
+    )
+    assert get_projection(EventModelSchema, Event) == (
+        ("id", "title", "category"),
+        ("id", "title", "category_id"),
+        (),
+    )
+    assert get_projection(EventAnnotated, Event) == (
+        ("title",),
+        ("title",),
+        ("category_title", "missing"),
+    )
+    assert get_projection(UserNamed, User) is None
+    # related object with properties is loaded with all columns
+    assert get_projection(EventCategoryRepr, Event) == (
+        ("title", "category"),
+        None,
+        (),
+    )
+    assert get_projection(CategoryWithEvent, Category) == (
+        ("title", "event__title", "event__category__title"),
+        None,
+        (),
+    )
+    assert get_projection(CategoryLoop, Category) == (
+        ("title", "event__title", "event__category"),
+        None,
+        (),
+    )
+    assert get_projection(CategoryIds, Category) == (("event",), None, ())
+    # to-many relations are prefetched with separate queries
+    assert get_projection(UserSchema, User) == (("username",), None, ())
+    assert get_projection(UserLink, User) == (("username",), None, ())
+
+
+def test_file_fields():
+    class Document(models.Model):
+        title = models.CharField(max_length=10)
+        file = models.FileField()
+
+        class Meta:
+            app_label = "tests"
+
+    class DocumentSchema(Schema):
+        title: str
+        file: str
+
+    assert get_projection(DocumentSchema, Document) == (
+        ("title", "file"),
+        None,  # FieldFile values are needed
+        (),
+    )
+
+
+api = NinjaAPI()
+
+
+@api.get("/events", response=List[EventSchema], only_fields=True)
+def events(request):
+    return Event.objects.order_by("id")
+
+
+@api.get("/events/flat", response=List[EventFlat], only_fields=True)
+def events_flat(request):
+    return Event.objects.order_by("id")
+
+
+@api.get("/events/annotated", response=List[EventAnnotated], only_fields=True)
+def events_annotated(request):
+    return Event.objects.annotate(category_title=F("category__title")).order_by("id")
+
+
+@api.get("/users", response=List[UserNamed], only_fields=True)
+def users(request):
+    return User.objects.order_by("id")
+
+
+@api.get("/events/default", response=List[EventFlat])
+def events_default(request):
+    return Event.objects.order_by("id")
+
+
+@api.get("/events/{int:event_id}", response=EventSchema, only_fields=True)
+def event(request, event_id: int):
+    return Event.objects.get(id=event_id)
+
+
+@api.get("/categories", response=List[CategoryWithEvent], only_fields=True)
+def categories(request):
+    return Category.objects.order_by("id")
+
+
+@api.get("/events/paged", response=List[EventFlat], only_fields=True)
+@paginate(LimitOffsetPagination)
+def events_paged(request, **kwargs):
+    return Event.objects.order_by("id")
+
+
+@api.get("/events/cursor", response=List[EventSchema], only_fields=True)
+@paginate(CursorPagination, ordering="-start_date", page_size=2)
+def events_cursor(request, **kwargs):
+    return Event.objects
+
+
+@api.get(
+    "/events/cursor-flat",
+    response=List[EventFlat],
+    only_fields=True,
+    auto_related=False,
+)
+@paginate(CursorPagination, ordering="-start_date", page_size=2)
+def events_cursor_flat(request, **kwargs):
+    return Event.objects
+
+
+client = TestClient(api)
+
+
+def create_events(count):
+    for i in range(count):
+        Event.objects.create(
+            title=f"e{i}",
+            category=Category.objects.create(title=f"c{i}"),
+            start_date=f"2020-01-0{i + 1}",
+            end_date="2020-02-01",
+        )
+
+
+def get_sql(captured_queries):
+    return captured_queries[0]["sql"].split(" FROM ")[0]
+
+
+@pytest.mark.django_db
+def test_only(django_assert_num_queries):
+    create_events(3)
+    with django_assert_num_queries(1) as ctx:
+        response = client.get("/events").json()
+    assert response[0] == {"title": "e0", "category": {"title": "c0"}}
+    sql = get_sql(ctx.captured_queries)
+    assert '"someapp_event"."title"' in sql
+    assert '"someapp_category"."title"' in sql
+    assert "start_date" not in sql
+
+    with django_assert_num_queries(1) as ctx:
+        response = client.get("/categories").json()
+    assert response[1] == {
+        "title": "c1",
+        "event": {"title": "e1", "category": {"title": "c1"}},
+    }
+    assert "start_date" not in get_sql(ctx.captured_queries)
+
+    # single objects are not projected
+    event_id = Event.objects.get(title="e0").id
+    with django_assert_num_queries(2) as ctx:
+        assert client.get(f"/events/{event_id}").json()["title"] == "e0"
+    assert "start_date" in get_sql(ctx.captured_queries)
+
+    # properties - all columns
+    User.objects.create(username="u0")
+    with django_assert_num_queries(1) as ctx:
+        response = client.get("/users").json()
+    assert response == [{"username": "u0", "is_anonymous": False}]
+    assert "last_login" in get_sql(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_values(django_assert_num_queries):
+    create_events(2)
+    with django_assert_num_queries(1) as ctx:
+        response = client.get("/events/flat").json()
+    event = Event.objects.get(title="e0")
+    assert response[0] == {
+        "pk": event.pk,
+        "title": "e0",
+        "category_id": event.category_id,
+    }
+    assert "start_date" not in get_sql(ctx.captured_queries)
+    assert client.get("/events/default").json() == response
+
+    with django_assert_num_queries(1) as ctx:
+        response = client.get("/events/annotated").json()
+    assert response[0] == {
+        "title": "e0",
+        "category_title": "c0",
+        "missing": "default",
+    }
+    assert "start_date" not in get_sql(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_pagination(django_assert_num_queries):
+    create_events(3)
+    with django_assert_num_queries(1) as ctx:
+        response = client.get("/events/paged?limit=2").json()
+    assert [e["title"] for e in response] == ["e0", "e1"]
+    assert "start_date" not in get_sql(ctx.captured_queries)
+
+    # ordering fields are loaded for the cursor
+    for path in ("/events/cursor", "/events/cursor-flat"):
+        with django_assert_num_queries(1) as ctx:
+            response = client.get(path).json()
+        assert [e["title"] for e in response["items"]] == ["e2", "e1"]
+        sql = get_sql(ctx.captured_queries)
+        assert "start_date" in sql and "end_date" not in sql
+
+        response = client.get(f"{path}?cursor={response['next']}").json()
+        assert [e["title"] for e in response["items"]] == ["e0"]
+
+
+@pytest.mark.django_db
+def test_project_queryset():
+    queryset = Event.objects.select_related("category").order_by("id")
+    projected = project_queryset(queryset, EventAnnotated)
+    # selected relations that schema does not read are loaded completely
+    assert projected.query.deferred_loading == (
+        frozenset({"title", "category"}),
+        False,
+    )
+    queryset = Event.objects.select_related("category__event")
+    projected = project_queryset(queryset, EventSchema)
+    assert projected.query.deferred_loading == (
+        frozenset({"title", "category__title", "category__event"}),
+        False,
+    )
+
+    # already projected querysets, values and lists are not changed
+    queryset = Event.objects.only("start_date")
+    assert project_queryset(queryset, EventFlat) is queryset
+    queryset = Event.objects.select_related()
+    assert project_queryset(queryset, EventFlat) is queryset
+    values = Event.objects.values("title")
+    assert project_queryset(values, EventFlat) is values
+    evaluated = Event.objects.all()
+    list(evaluated)
+    assert project_queryset(evaluated, EventFlat) is evaluated
+    assert project_queryset([1], EventFlat) == [1]
+    projected = project_queryset(Event.objects, EventFlat)
+    assert list(projected) == []
+
+    projected = project_queryset(Event.objects.prefetch_related("category"), EventFlat)
+    assert projected.query.deferred_loading[1] is False  # .only(), not .values()
@@ -0,0 +1,86 @@
+import datetime
+from typing import List
+
+import django
+import pytest
+from asgiref.sync import sync_to_async
+from someapp.models import Event
+
+from ninja import NinjaAPI, Schema
+from ninja.pagination import (
+    CursorPagination,
+    LimitOffsetPagination,
+    PageNumberPagination,
+    paginate,
+)
+from ninja.signature import is_async
+from ninja.testing import TestAsyncClient
+
+pytestmark = [
+    pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher"),
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+class EventSchema(Schema):
+    title: str
+    start_date: datetime.date
+
+
+api = NinjaAPI()
+
+
+@api.get("/events", response=List[EventSchema])
+@paginate
+async def events(request, **kwargs):
+    return Event.objects.order_by("id")
+
+
+@api.get("/events/count", response=List[EventSchema])
+@paginate(PageNumberPagination, page_size=2, count="window")
+async def events_count(request, **kwargs):
+    return Event.objects.order_by("id")
+
+
+@api.get("/events/cursor", response=List[EventSchema])
+@paginate(CursorPagination, page_size=2)
+async def events_cursor(request, **kwargs):
+    return Event.objects.all()
+
+
+@api.get("/numbers", response=List[int])
+@paginate(LimitOffsetPagination)
+async def numbers(request, **kwargs):
+    return list(range(10))
+
+
+client = TestAsyncClient(api)
+
+
+@sync_to_async
+def create_events(count):
+    for i in range(count):
+        Event.objects.create(
+            title=f"e{i}", start_date="2020-01-01", end_date="2020-01-01"
+        )
+
+
+async def test_async_paginate():
+    assert is_async(events)
+    await create_events(5)
+
+    response = (await client.get("/events?limit=2&offset=1")).json()
+    assert [i["title"] for i in response] == ["e1", "e2"]
+
+    response = (await client.get("/events/count?page=3")).json()
+    assert response == {
+        "items": [{"title": "e4", "start_date": "2020-01-01"}],
+        "count": 5,
+    }
+
+    page = (await client.get("/events/cursor")).json()
+    page = (await client.get(f"/events/cursor?cursor={page['next']}")).json()
+    assert [i["title"] for i in page["items"]] == ["e2", "e3"]
+
+    assert (await client.get("/numbers?limit=3")).json() == [0, 1, 2]
@@ -0,0 +1,217 @@
+import datetime
+from typing import List
+from unittest import mock
+
+import pytest
+from django.db import connection
+from someapp.models import Event
+
+from ninja import NinjaAPI, Schema
+from ninja.errors import ConfigError
+from ninja.pagination import (
+    ItemsCounter,
+    LimitOffsetPagination,
+    PageNumberPagination,
+    _estimate_count,
+    paginate,
+)
+from ninja.testing import TestClient
+
+
+class EventSchema(Schema):
+    title: str
+    start_date: datetime.date
+
+
+api = NinjaAPI()
+
+
+@api.get("/events", response=List[EventSchema])
+@paginate(LimitOffsetPagination, count="window")
+def events(request, title: str = None, **kwargs):
+    events = Event.objects.order_by("id")
+    if title:
+        events = events.filter(title=title)
+    return events
+
+
+@api.get("/cached", response=List[EventSchema])
+@paginate(PageNumberPagination, page_size=2, count="cached", ttl=10)
+def cached(request, title: str = None, **kwargs):
+    events = Event.objects.order_by("id")
+    if title:
+        events = events.filter(title=title)
+    return events
+
+
+@api.get("/values")
+@paginate(LimitOffsetPagination, count="window")
+def values(request, flat: bool = False, **kwargs):
+    if flat:
+        return Event.objects.order_by("id").values_list("title", flat=True)
+    return Event.objects.order_by("id").values("title")
+
+
+@api.get("/distinct")
+@paginate(LimitOffsetPagination, count="window")
+def distinct(request, **kwargs):
+    return Event.objects.order_by("title").values("title").distinct()
+
+
+@api.get("/list")
+@paginate(LimitOffsetPagination, count="window")
+def items_list(request, **kwargs):
+    return range(10)
+
+
+@api.get("/none")
+@paginate(LimitOffsetPagination, count="cached")
+def none(request, **kwargs):
+    return Event.objects.none()
+
+
+@api.get("/estimate", response=List[EventSchema])
+@paginate(LimitOffsetPagination, count="estimate", estimate_threshold=100)
+def estimate(request, **kwargs):
+    return Event.objects.order_by("id")
+
+
+client = TestClient(api)
+
+
+def create_events(count):
+    for i in range(count):
+        Event.objects.create(
+            title=f"e{i}", start_date="2020-01-01", end_date="2020-01-01"
+        )
+
+
+@pytest.mark.django_db
+def test_window_count(django_assert_num_queries):
+    create_events(5)
+    with django_assert_num_queries(1) as ctx:
+        response = client.get("/events?limit=2&offset=1").json()
+    assert "OVER ()" in ctx.captured_queries[0]["sql"]
+    assert response == {
+        "items": [
+            {"title": "e1", "start_date": "2020-01-01"},
+            {"title": "e2", "start_date": "2020-01-01"},
+        ],
+        "count": 5,
+    }
+
+    with django_assert_num_queries(1):
+        response = client.get("/events?title=missing").json()
+    assert response == {"items": [], "count": 0}
+
+    with django_assert_num_queries(2):  # empty page - count is queried
+        response = client.get("/events?offset=10").json()
+    assert response == {"items": [], "count": 5}
+
+
+@pytest.mark.django_db
+def test_distinct_window_count(django_assert_num_queries):
+    for title in "aaab":
+        Event.objects.create(
+            title=title, start_date="2020-01-01", end_date="2020-01-01"
+        )
+    with django_assert_num_queries(2):  # separate count query
+        response = client.get("/distinct").json()
+    assert response == {"items": [{"title": "a"}, {"title": "b"}], "count": 2}
+
+
+@pytest.mark.django_db
+def test_cached_count(django_assert_num_queries):
+    create_events(5)
+    with django_assert_num_queries(1) as ctx:
+        response = client.get("/cached").json()
+    assert response["count"] == 5
+    assert "OVER ()" in ctx.captured_queries[0]["sql"]
+
+    Event.objects.create(title="e5", start_date="2020-01-01", end_date="2020-01-01")
+    with django_assert_num_queries(1) as ctx:
+        response = client.get("/cached?page=3").json()
+    assert [i["title"] for i in response["items"]] == ["e4", "e5"]
+    assert response["count"] == 5  # cached
+    assert "OVER ()" not in ctx.captured_queries[0]["sql"]
+
+    response = client.get("/cached?title=e5").json()  # other sql
+    assert response["count"] == 1
+
+
+@pytest.mark.django_db
+def test_cached_count_unhashable_params(monkeypatch, django_assert_num_queries):
+    create_events(3)
+    counter = ItemsCounter("cached")
+    queryset = Event.objects.order_by("id")
+    # e.g. PostgreSQL array lookups pass lists as params
+    sql = ("SELECT ... WHERE tags @> %s", (["a", "b"],))
+    monkeypatch.setattr(queryset.query, "sql_with_params", lambda: sql)
+    assert counter.page(queryset, 0, 1)["count"] == 3
+    Event.objects.create(title="e3", start_date="2020-01-01", end_date="2020-01-01")
+    with django_assert_num_queries(1):
+        assert counter.page(queryset, 0, 1)["count"] == 3  # cached
+
+
+@pytest.mark.django_db
+def test_other_items(django_assert_num_queries):
+    create_events(3)
+    with django_assert_num_queries(1):
+        response = client.get("/values?limit=1").json()
+    assert response == {"items": [{"title": "e0"}], "count": 3}
+
+    with django_assert_num_queries(2):
+        response = client.get("/values?limit=1&flat=true").json()
+    assert response == {"items": ["e0"], "count": 3}
+
+    assert client.get("/list?limit=2").json() == {"items": [0, 1], "count": 10}
+
+    with django_assert_num_queries(0):
+        response = client.get("/none").json()
+    assert response == {"items": [], "count": 0}
+
+
+@pytest.mark.django_db
+def test_no_window_functions(monkeypatch, django_assert_num_queries):
+    create_events(3)
+    monkeypatch.setattr(connection.features, "supports_over_clause", False)
+    with django_assert_num_queries(2):
+        response = client.get("/events?limit=1").json()
+    assert response["count"] == 3
+
+
+@pytest.mark.django_db
+def test_estimate_count(django_assert_num_queries):
+    create_events(3)
+    with django_assert_num_queries(1):  # not PostgreSQL - window count
+        assert client.get("/estimate?limit=1").json()["count"] == 3
+
+    with mock.patch("ninja.pagination._estimate_count", return_value=1000):
+        assert client.get("/estimate?limit=1").json()["count"] == 1000
+    with mock.patch("ninja.pagination._estimate_count", return_value=50):
+        assert client.get("/estimate?limit=1").json()["count"] == 3
+
+
+@pytest.mark.parametrize(
+    "plan", ['[{"Plan": {"Plan Rows": 123}}]', [{"Plan": {"Plan Rows": 123}}]]
+)
+def test_postgresql_estimate(plan):
+    queryset = Event.objects.all()
+    with mock.patch("ninja.pagination.connections") as connections:
+        db = connections[queryset.db]
+        db.vendor = "postgresql"
+        cursor = db.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = [plan]
+        assert _estimate_count(queryset, ("SELECT 1", ())) == 123
+    cursor.execute.assert_called_with("EXPLAIN (FORMAT JSON) SELECT 1", ())
+
+
+def test_invalid_mode():
+    with pytest.raises(ConfigError, match="count must be one of"):
+        ItemsCounter("exact")
+
+
+def test_schema():
+    schema = api.get_openapi_schema()["components"]["schemas"]["PagedEventSchema"]
+    assert schema["properties"]["count"] == {"title": "Count", "type": "integer"}
+    assert schema["required"] == ["items", "count"]
@@ -0,0 +1,167 @@
+import datetime
+from base64 import urlsafe_b64encode
+from typing import List
+
+import pytest
+from django.contrib.auth.models import User
+from django.utils import timezone
+from someapp.models import Event
+
+from ninja import NinjaAPI, Schema
+from ninja.pagination import CursorPagination, paginate
+from ninja.testing import TestClient
+
+
+class EventSchema(Schema):
+    id: int
+    title: str
+    start_date: datetime.date
+
+
+api = NinjaAPI()
+
+
+@api.get("/events", response=List[EventSchema])
+@paginate(CursorPagination, ordering=["-start_date", "title"], page_size=2)
+def events(request, **kwargs):
+    return Event.objects.all()
+
+
+@api.get("/events/by-id", response=List[EventSchema])
+@paginate(CursorPagination, ordering="-pk", page_size=2)
+def events_by_id(request, **kwargs):
+    return Event.objects.all()
+
+
+@api.get("/events/values")
+@paginate(CursorPagination, page_size=2)
+def events_values(request, **kwargs):
+    return Event.objects.values("id", "title")
+
+
+@api.get("/users")
+@paginate(CursorPagination, ordering="-date_joined", page_size=2)
+def users(request, **kwargs):
+    return User.objects.values("id", "username", "date_joined")
+
+
+client = TestClient(api)
+
+
+def create_events():
+    dates = ["2020-01-03", "2020-01-02", "2020-01-02", "2020-01-02", "2020-01-01"]
+    for i, date in enumerate(dates):
+        Event.objects.create(title=f"e{i}", start_date=date, end_date=date)
+
+
+def titles(page):
+    return [item["title"] for item in page["items"]]
+
+
+@pytest.mark.django_db
+def test_cursor_pagination(django_assert_num_queries):
+    create_events()
+    with django_assert_num_queries(1):
+        page1 = client.get("/events").json()
+    assert titles(page1) == ["e0", "e1"]
+    assert page1["previous"] is None
+    assert page1["items"][0]["start_date"] == "2020-01-03"
+
+    page2 = client.get(f"/events?cursor={page1['next']}").json()
+    assert titles(page2) == ["e2", "e3"]
+    page3 = client.get(f"/events?cursor={page2['next']}").json()
+    assert titles(page3) == ["e4"]
+    assert page3["next"] is None
+
+    back2 = client.get(f"/events?cursor={page3['previous']}").json()
+    assert titles(back2) == ["e2", "e3"]
+    back1 = client.get(f"/events?cursor={back2['previous']}").json()
+    assert titles(back1) == ["e0", "e1"]
+    assert back1["previous"] is None
+    assert titles(client.get(f"/events?cursor={back1['next']}").json()) == [
+        "e2",
+        "e3",
+    ]
+
+
+@pytest.mark.django_db
+def test_ordering_with_pk():
+    create_events()
+    page1 = client.get("/events/by-id").json()
+    assert titles(page1) == ["e4", "e3"]
+    page2 = client.get(f"/events/by-id?cursor={page1['next']}").json()
+    assert titles(page2) == ["e2", "e1"]
+
+    page = client.get("/events/values").json()
+    assert page["items"] == [{"id": 1, "title": "e0"}, {"id": 2, "title": "e1"}]
+    page = client.get(f"/events/values?cursor={page['next']}").json()
+    assert [i["title"] for i in page["items"]] == ["e2", "e3"]
+
+
+@pytest.mark.django_db
+def test_empty():
+    page = client.get("/events").json()
+    assert page == {"items": [], "next": None, "previous": None}
+    # going back from the first item
+    cursor = urlsafe_b64encode(b'{"p": ["2020-01-03", "e0", 1], "r": true}')
+    page = client.get(f"/events?cursor={cursor.decode()}").json()
+    assert page == {"items": [], "next": None, "previous": None}
+
+
+@pytest.mark.django_db
+def test_datetime_microseconds():
+    joined = timezone.now().replace(microsecond=123456)
+    for i in range(5):
+        User.objects.create(
+            username=f"u{i}", date_joined=joined + datetime.timedelta(microseconds=i)
+        )
+    names = []
+    page = client.get("/users").json()
+    while True:
+        names += [item["username"] for item in page["items"]]
+        if page["next"] is None:
+            break
+        page = client.get(f"/users?cursor={page['next']}").json()
+    assert names == ["u4", "u3", "u2", "u1", "u0"]
+
+
+@pytest.mark.parametrize(
+    "cursor", ["invalid", urlsafe_b64encode(b'{"p": [1], "r": false}').decode()]
+)
+def test_invalid_cursor(cursor):
+    response = client.get(f"/events?cursor={cursor}")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "path,position",
+    [
+        ("/events/by-id", '["abc"]'),
+        ("/events/by-id", '[{"x": 1}]'),
+        ("/events", '["2020-99-99", "e0", 1]'),
+    ],
+)
+def test_invalid_cursor_values(path, position):
+    cursor = urlsafe_b64encode(f'{{"p": {position}, "r": false}}'.encode())
+    response = client.get(f"{path}?cursor={cursor.decode()}")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+def test_schema():
+    schema = api.get_openapi_schema()
+    get = schema["paths"]["/api/events"]["get"]
+    assert get["parameters"][0]["name"] == "cursor"
+    ref = get["responses"][200]["content"]["application/json"]["schema"]["$ref"]
+    assert ref == "#/components/schemas/PagedEventSchema"
+    assert schema["components"]["schemas"]["PagedEventSchema"]["properties"] == {
+        "items": {
+            "title": "Items",
+            "type": "array",
+            "items": {"$ref": "#/components/schemas/EventSchema"},
+        },
+        "next": {"title": "Next", "type": "string"},
+        "previous": {"title": "Previous", "type": "string"},
+    }
@@ -0,0 +1,193 @@
+from decimal import Decimal
+from enum import Enum, IntEnum
+from typing import List, Optional
+from uuid import UUID
+
+import pydantic
+import pytest
+
+from ninja import Header, Query, Schema
+from ninja.signature import ViewSignature
+
+
+class Color(str, Enum):
+    red = "red"
+    blue = "blue"
+
+
+class Level(IntEnum):
+    low = 1
+    high = 2
+
+
+class Size(int, Enum):
+    small = 1
+
+
+class Filters(Schema):
+    q: str
+
+
+def view_int(request, value: int):
+    pass
+
+
+def view_float(request, value: float = 0.5):
+    pass
+
+
+def view_str(request, value: Optional[str] = None):
+    pass
+
+
+def view_bool(request, value: bool = False):
+    pass
+
+
+def view_uuid(request, value: UUID):
+    pass
+
+
+def view_color(request, value: Color = Color.red):
+    pass
+
+
+def view_level(request, value: Level):
+    pass
+
+
+def view_size(request, value: Size):
+    pass
+
+
+def view_int_constrained(request, value: int = Query(..., gt=0, le=10)):
+    pass
+
+
+def view_float_constrained(request, value: float = Query(..., ge=0, lt=1)):
+    pass
+
+
+def view_str_constrained(request, value: str = Query(..., min_length=2, max_length=3)):
+    pass
+
+
+def view_alias(request, value: int = Query(1, alias="v")):
+    pass
+
+
+VALUES = [
+    None,
+    "",
+    "1",
+    " 2 ",
+    "-5",
+    "0",
+    "1.5",
+    "1e3",
+    "nan",
+    "abc",
+    "abcd",
+    "True",
+    "off",
+    "red",
+    "blue",
+    "a" * 5000,
+    "0" * 4301,
+    "8c8f4b4d-1111-4d3d-a111-4d4d4d4d4d4d",
+    3,
+    3.5,
+    True,
+    b"1",
+]
+
+
+@pytest.mark.parametrize(
+    "view",
+    [
+        view_int,
+        view_float,
+        view_str,
+        view_bool,
+        view_uuid,
+        view_color,
+        view_level,
+        view_size,
+        view_int_constrained,
+        view_float_constrained,
+        view_str_constrained,
+    ],
+)
+@pytest.mark.parametrize("value", VALUES)
+def test_same_result_as_pydantic(view, value):
+    model = ViewSignature("/", view).models[0]
+    assert model._coercer is not None
+    data = {} if value is None else {"value": value}
+
+    try:
+        expected = dict(model(**model._map_data_paths(data)))
+    except pydantic.ValidationError:
+        expected = None
+
+    try:
+        result = model._coercer(data)
+    except (TypeError, ValueError):
+        result = None
+
+    if result is not None:
+        # coercer is allowed to give up, but never to disagree with pydantic
+        # (repr also compares types and works for nan)
+        assert repr(result) == repr(expected)
+
+
+def test_alias():
+    model = ViewSignature("/", view_alias).models[0]
+    assert model._coercer({"v": "5"}) == {"value": 5}
+    assert model._coercer({"value": "5"}) == {"value": 1}
+
+
+def test_sources():
+    def view(
+        request,
+        item_id: int,
+        q: str,
+        x_token: str = Header(...),
+    ):
+        pass
+
+    models = ViewSignature("/{item_id}", view).models
+    assert all(m._coercer is not None for m in models)
+    assert [m._param_source for m in models] == ["path", "query", "header"]
+
+
+def regex_view(request, value: str = Query(..., regex="^a")):
+    pass
+
+
+def list_view(request, value: List[int] = Query(...)):
+    pass
+
+
+def schema_view(request, filters: Filters = Query(...)):
+    pass
+
+
+def union_view(request, value: Optional[List[int]] = Query(None)):
+    pass
+
+
+def bytes_view(request, value: bytes = Query(...)):
+    pass
+
+
+def decimal_view(request, value: Decimal = Query(..., gt=0)):
+    pass
+
+
+@pytest.mark.parametrize(
+    "view",
+    [regex_view, list_view, schema_view, union_view, bytes_view, decimal_view],
+)
+def test_not_scalar(view):
+    for model in ViewSignature("/", view).models:
+        assert model._coercer is None
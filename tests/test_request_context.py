@@ -0,0 +1,88 @@
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from ninja import NinjaAPI, Query, Schema
+from ninja.context import RequestContext, get_request_context
+from ninja.parser import Parser
+from ninja.security import APIKeyHeader
+from ninja.testing import TestClient
+
+
+class CountingParser(Parser):
+    calls = 0
+
+    def parse_body(self, request):
+        CountingParser.calls += 1
+        return super().parse_body(request)
+
+
+class SignatureAuth(APIKeyHeader):
+    "Checks that X-Signature header matches the parsed body"
+
+    param_name = "X-Signature"
+
+    def authenticate(self, request, key):
+        context = get_request_context(request)
+        if key == str(context.body.get("value")):
+            return key
+
+
+class Payload(Schema):
+    value: int
+
+
+api = NinjaAPI(parser=CountingParser(), auth=SignatureAuth())
+
+
+@api.post("/signed")
+def signed(request, payload: Payload, flag: int = 0):
+    context = get_request_context(request)
+    assert context.body == {"value": payload.value}
+    return {"value": payload.value, "auth": request.auth}
+
+
+@api.get("/query", auth=None)
+def query(request, tags: List[str] = Query(...)):
+    context = get_request_context(request)
+    return {"tags": tags, "all": context.query(["tags"]), "first": context.query()}
+
+
+client = TestClient(api)
+
+
+def test_body_parsed_once():
+    CountingParser.calls = 0
+    response = client.post(
+        "/signed?flag=1", json={"value": 5}, headers={"X-Signature": "5"}
+    )
+    assert response.json() == {"value": 5, "auth": "5"}
+    assert CountingParser.calls == 1
+
+    response = client.post("/signed", json={"value": 5}, headers={"X-Signature": "1"})
+    assert response.status_code == 401
+
+
+def test_query():
+    response = client.get("/query?tags=a&tags=b")
+    assert response.json() == {
+        "tags": ["a", "b"],
+        "all": {"tags": ["a", "b"]},
+        "first": {"tags": "b"},
+    }
+
+
+def test_context():
+    request = Mock(GET={}, body=b"{]")
+    context = get_request_context(request)
+    assert isinstance(context, RequestContext)
+    assert type(context.parser) is Parser
+    assert get_request_context(request, api) is context
+    assert context.headers is context.headers
+    assert context.query() is context.query()
+
+    # parsing errors are raised every time
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            context.body
@@ -1,9 +1,11 @@
 from typing import List, Union
 
 import pytest
+from django.http import HttpResponse
 from pydantic import BaseModel, ValidationError
 
 from ninja import Router
+from ninja.operation import ResponseObject
 from ninja.testing import TestClient
 
 router = Router()
@@ -95,3 +97,9 @@ def test_validates():
 
     with pytest.raises(ValidationError):
         client.get("/check_union?q=2")
+
+
+def test_response_object():
+    # kept for backwards compatibility (no longer used by operations)
+    response = HttpResponse()
+    assert ResponseObject(response).response is response
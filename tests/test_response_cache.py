@@ -0,0 +1,236 @@
+import datetime
+from enum import Enum
+from typing import List
+from unittest import mock
+
+import django
+import pytest
+from django.core.cache import cache as default_cache
+from django.http import HttpResponse
+
+from ninja import NinjaAPI, Query, Schema
+from ninja.cache import ResponseCache, cache_response
+from ninja.security import APIKeyHeader
+from ninja.testing import TestAsyncClient, TestClient
+
+
+class KeyAuth(APIKeyHeader):
+    param_name = "key"
+
+    def authenticate(self, request, key):
+        if key in ("a", "b"):
+            return key
+
+
+class Filters(Schema):
+    a: int = 0
+    b: int = 0
+
+
+class Color(Enum):
+    red = "red"
+    blue = "blue"
+
+
+class ColorFilters(Schema):
+    color: Color = Color.red
+
+
+api = NinjaAPI()
+calls = []
+
+
+@api.api_operation(["GET", "POST"], "/items", response=List[int])
+@cache_response(ttl=60)
+def items(request, filters: Filters = Query(...)):
+    calls.append(filters.dict())
+    return [filters.a, filters.b]
+
+
+@api.get("/colors/{color}")
+@cache_response()
+def colors(request, color: Color, filters: ColorFilters = Query(...)):
+    calls.append((color, filters.color))
+    return [color.value, filters.color.value]
+
+
+@api.get("/lang")
+@cache_response(vary_on_headers=["Accept-Language"], cache=None)
+def lang(request):
+    calls.append("lang")
+    return request.headers.get("Accept-Language")
+
+
+@api.get("/me", auth=KeyAuth())
+@cache_response()
+def me(request):
+    calls.append(request.auth)
+    return request.auth
+
+
+@api.get("/status/{int:status}")
+@cache_response()
+def status(request, status: int):
+    calls.append(status)
+    response = HttpResponse(str(status), status=status)
+    if status == 201:
+        response.set_cookie("a", "b")
+    return response
+
+
+client = TestClient(api)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    default_cache.clear()
+    for op in [items, colors, lang, me, status]:
+        op._ninja_response_cache.clear()
+    del calls[:]
+
+
+def test_validated_params_key():
+    response = client.get("/items?a=1&b=2")
+    assert response.json() == [1, 2]
+    response = client.get("/items?b=2&a=01")
+    assert response.json() == [1, 2]
+    assert response["Content-Type"] == "application/json; charset=utf-8"
+    assert calls == [{"a": 1, "b": 2}]
+
+    client.get("/items?a=2")
+    client.post("/items?a=1&b=2")  # only GET responses are cached
+    assert len(calls) == 3
+
+
+def test_shared_backend():
+    client.get("/items?a=1")
+    items._ninja_response_cache.clear()  # another process
+    assert client.get("/items?a=1").json() == [1, 0]
+    assert len(calls) == 1
+
+    default_cache.clear()  # served from the in-process cache
+    assert client.get("/items?a=1").json() == [1, 0]
+    assert len(calls) == 1
+
+
+def test_expiration():
+    with mock.patch("ninja.cache.time", return_value=1000):
+        client.get("/items")
+    with mock.patch("ninja.cache.monotonic", return_value=10**9):
+        # local entry expired, backend entry is used until it expires
+        with mock.patch("ninja.cache.time", return_value=1030):
+            client.get("/items")
+            assert len(calls) == 1
+    items._ninja_response_cache.clear()
+    with mock.patch("ninja.cache.time", return_value=1061):
+        client.get("/items")  # expired backend entry
+    assert len(calls) == 2
+
+
+def test_vary_on_headers():
+    for language in ["en", "de", "en"]:
+        meta = {"HTTP_ACCEPT_LANGUAGE": language}
+        response = client.get("/lang", META=meta)
+        assert response.json() == language
+        assert response["Vary"] == "Accept-Language"
+    assert calls == ["lang", "lang"]
+
+
+def test_vary_on_auth():
+    for key in ["a", "b", "a"]:
+        assert client.get("/me", headers={"key": key}).json() == key
+    assert calls == ["a", "b"]
+    assert client.get("/me").status_code == 401
+
+
+def test_not_cached_responses():
+    for _ in range(2):
+        client.get("/status/200")
+        client.get("/status/201")
+        client.get("/status/404")
+    assert calls == [200, 201, 404, 201, 404]
+
+
+def test_key():
+    cache = ResponseCache(vary_on_auth=False)
+    request = mock.Mock()
+    key = cache.get_key("op", request, {"b": 1, "a": [1, 2]})
+    assert key.startswith("ninja:response:op:")
+    assert key == cache.get_key("op", request, {"a": [1, 2], "b": 1})
+
+    # values the json encoder does not support
+    now = datetime.datetime(2020, 1, 1, 12, 0, 0, 1)
+    values = {"c": Color.red, "s": {Color.blue, Color.red}, "d": now, "o": object}
+    key = cache.get_key("op", request, values)
+    assert key == cache.get_key("op", request, {**values, "s": {"blue", "red"}})
+    later = now + datetime.timedelta(microseconds=1)
+    assert key != cache.get_key("op", request, {**values, "d": later})
+
+
+def test_enum_params():
+    assert client.get("/colors/red?color=blue").json() == ["red", "blue"]
+    assert client.get("/colors/red?color=blue").json() == ["red", "blue"]
+    assert client.get("/colors/red").json() == ["red", "red"]
+    assert calls == [(Color.red, Color.blue), (Color.red, Color.red)]
+
+
+def test_operation_id_only_for_cached_operations():
+    operation_ids = []
+
+    class CustomAPI(NinjaAPI):
+        def get_openapi_operation_id(self, operation):
+            operation_ids.append(operation.view_func.__name__)
+            return super().get_openapi_operation_id(operation)
+
+    api = CustomAPI(urls_namespace="custom")
+
+    @api.get("/plain")
+    def plain(request):
+        return 1
+
+    @api.get("/cached")
+    @cache_response(ttl=10)
+    def cached(request):
+        return 1
+
+    assert operation_ids == ["cached"]
+    operation = api.default_router.path_operations["/cached"].operations[0]
+    assert operation._cache_prefix == "custom:test_response_cache_cached"
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher")
+@pytest.mark.asyncio
+async def test_async_cache():
+    api = NinjaAPI()
+    async_calls = []
+
+    @api.get("/async")
+    @cache_response(ttl=10)
+    async def view(request, a: int = 0):
+        async_calls.append(a)
+        return a
+
+    @api.get("/async-error")
+    @cache_response(ttl=10)
+    async def error(request):
+        async_calls.append("error")
+        return HttpResponse(status=500)
+
+    @api.get("/async-local")
+    @cache_response(cache=None)
+    async def local(request):
+        async_calls.append("local")
+        return "local"
+
+    client = TestAsyncClient(api)
+    assert (await client.get("/async?a=1")).json() == 1
+    view._ninja_response_cache.clear()
+    assert (await client.get("/async?a=1")).json() == 1
+    assert (await client.get("/async?a=1")).json() == 1
+    assert async_calls == [1]
+
+    await client.get("/async-error")
+    await client.get("/async-error")
+    await client.get("/async-local")
+    await client.get("/async-local")
+    assert async_calls == [1, "error", "error", "local"]
@@ -0,0 +1,156 @@
+import uuid
+from types import ModuleType
+
+import pytest
+from django.urls import Resolver404, path, reverse
+from django.urls.resolvers import get_resolver
+
+from ninja import NinjaAPI, Router
+from ninja.routing import RouteTree, RouteTreePattern
+from ninja.testing import TestClient
+
+api = NinjaAPI(route_tree=True, urls_namespace="tree")
+router = Router()
+
+
+@api.get("/items", url_name="items")
+def items(request):
+    return "items"
+
+
+@api.get("/items/{int:item_id}", url_name="item")
+def item(request, item_id: int):
+    return f"item {item_id}"
+
+
+@api.get("/items/{slug}")
+def item_slug(request, slug: str):
+    return f"slug {slug}"
+
+
+@api.get("/items/new")
+def item_new(request):
+    return "new"
+
+
+@api.get("/items/{int:item_id}/parts/{uuid:part_id}")
+def part(request, item_id: int, part_id: uuid.UUID):
+    return f"part {item_id} {part_id}"
+
+
+@api.get("/items/{int:item_id}/tags/")
+def tags(request, item_id: int):
+    return f"tags {item_id}"
+
+
+@api.get("/files/{path:name}")
+def file(request, name: str):
+    return f"file {name}"
+
+
+@api.get("/report-{int:year}.csv")
+def report(request, year: int):
+    return f"report {year}"
+
+
+@router.get("/{name}")
+def hello(request, name: str):
+    return f"hello {name}"
+
+
+api.add_router("/hello/", router)
+
+urlconf = ModuleType("test_routing_urls")
+urlconf.urlpatterns = [path("api/", api.urls)]
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("/items", "items"),
+        ("/items/1", "item 1"),
+        ("/items/abc", "slug abc"),
+        ("/items/new", "new"),
+        (
+            "/items/5/parts/8c8f4b4d-1111-4d3d-a111-4d4d4d4d4d4d",
+            "part 5 8c8f4b4d-1111-4d3d-a111-4d4d4d4d4d4d",
+        ),
+        ("/items/5/tags/", "tags 5"),
+        ("/files/a/b.txt", "file a/b.txt"),
+        ("/report-2020.csv", "report 2020"),
+        ("/hello/world", "hello world"),
+    ],
+)
+def test_resolve(url, expected):
+    response = TestClient(api).get(url)
+    assert response.json() == expected
+
+
+def test_django_resolver():
+    resolver = get_resolver(urlconf)
+    match = resolver.resolve("/api/items/5/parts/8c8f4b4d-1111-4d3d-a111-4d4d4d4d4d4d")
+    assert match.kwargs == {
+        "item_id": 5,
+        "part_id": "8c8f4b4d-1111-4d3d-a111-4d4d4d4d4d4d",  # NinjaUUIDConverter
+    }
+    assert match.route == "api/items/<int:item_id>/parts/<uuid:part_id>"
+    assert match.namespace == "tree"
+
+    match = resolver.resolve("/api/items/1")
+    assert match.url_name == "item"
+
+    with pytest.raises(Resolver404):
+        resolver.resolve("/api/items/5/parts/not-uuid")
+    with pytest.raises(Resolver404):
+        resolver.resolve("/api/items/5/tags")
+
+    assert resolver.resolve("/api/docs").url_name == "openapi-swagger"
+    assert resolver.resolve("/api/").url_name == "api-root"
+
+
+def test_reverse():
+    assert reverse("tree:items", urlconf=urlconf) == "/api/items"
+    assert reverse("tree:item", kwargs={"item_id": 3}, urlconf=urlconf) == (
+        "/api/items/3"
+    )
+
+
+def test_tree_pattern_position():
+    patterns = api.urls[0]
+    tree_patterns = [p for p in patterns if isinstance(p, RouteTreePattern)]
+    assert len(tree_patterns) == 1
+    # operations that can't be resolved by the tree are left to django patterns
+    assert tree_patterns[0].resolve("files/a/b") is None
+    assert tree_patterns[0].resolve("report-2020.csv") is None
+
+    assert not any(isinstance(p, RouteTreePattern) for p in NinjaAPI().urls[0])
+
+
+def test_first_route_wins():
+    first = path("<int:value>", lambda request: None, name="first")
+    second = path("<int:value>", lambda request: None, name="second")
+    other = path("<str:value>", lambda request: None, name="other")
+    tree = RouteTree()
+    assert tree.add(first) and tree.add(second) and tree.add(other)
+
+    (callback, name, route), kwargs = tree.resolve("1")
+    assert (name, route, kwargs) == ("first", "<int:value>", {"value": 1})
+    assert tree.resolve("x")[0][1] == "other"
+    assert tree.resolve("") is None
+
+
+def test_converter_value_error():
+    class EvenConverter:
+        regex = "[0-9]+"
+
+        def to_python(self, value):
+            if int(value) % 2:
+                raise ValueError(value)
+            return int(value)
+
+    even = path("<int:value>", lambda request: None, name="even")
+    even.pattern.converters["value"] = EvenConverter()
+    tree = RouteTree()
+    tree.add(even)
+    assert tree.resolve("2")[1] == {"value": 2}
+    assert tree.resolve("3") is None
@@ -1,11 +1,22 @@
-from typing import List
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, List, Optional, Set, Union
 from unittest.mock import Mock
 
+from django.db import models
 from django.db.models import Manager, QuerySet
 from django.db.models.fields.files import ImageFieldFile
+from pydantic import constr
 
-from ninja import Schema
-from ninja.schema import Field
+from ninja import ModelSchema, Schema
+from ninja.schema import (
+    DjangoGetter,
+    Field,
+    _convert_file,
+    _convert_many,
+    get_converters,
+    get_getter_dict,
+)
 
 
 class FakeManager(Manager):
@@ -80,3 +91,103 @@ def test_schema_with_image():
         "tags": [{"id": "1", "title": "foo"}, {"id": "2", "title": "bar"}],
         "avatar": "/smile.jpg",
     }
+
+
+class Color(Enum):
+    red = "red"
+
+
+def test_converters():
+    class Item(Schema):
+        name: str
+
+    class Custom:
+        @classmethod
+        def __get_validators__(cls):
+            yield lambda v: v
+
+    class ConverterSchema(Schema):
+        id: int
+        price: Optional[Decimal]
+        name: constr(max_length=10)
+        data: bytes
+        tags: List[int]
+        ids: Set[int]
+        mapping: Dict[str, int]
+        union: Union[int, str]
+        item: Item
+        custom: Custom
+        color: Color
+
+    converters = get_converters(ConverterSchema)
+    assert converters == {
+        "id": None,
+        "price": None,
+        "name": _convert_file,
+        "data": _convert_file,
+        "tags": _convert_many,
+        "ids": _convert_many,
+        "mapping": DjangoGetter.convert_result,
+        "union": DjangoGetter.convert_result,
+        "item": DjangoGetter.convert_result,
+        "custom": DjangoGetter.convert_result,
+        "color": DjangoGetter.convert_result,
+    }
+
+
+def test_model_schema_converters():
+    class DocumentTag(models.Model):
+        class Meta:
+            app_label = "tests"
+
+    class TaggedDocument(models.Model):
+        title = models.CharField(max_length=10)
+        file = models.FileField()
+        tags = models.ManyToManyField(DocumentTag)
+        owner = models.ForeignKey(
+            DocumentTag, on_delete=models.CASCADE, related_name="+"
+        )
+
+        class Meta:
+            app_label = "tests"
+
+    class DocumentSchema(ModelSchema):
+        title: int  # custom fields are checked by type
+
+        class Config:
+            model = TaggedDocument
+            model_fields = ["id", "title", "file", "tags", "owner"]
+
+    assert get_converters(DocumentSchema) == {
+        "id": None,
+        "title": None,
+        "file": _convert_file,
+        "tags": _convert_many,
+        "owner_id": None,
+    }
+
+
+def test_getter_dict():
+    user = User()
+    # attributes that are not schema fields are fully converted
+    getter = get_getter_dict(UserSchema)(user)
+    assert getter.get("group_set") == [1, 2, 3]
+    assert getter.get("extra_set", FakeManager([1])) == [1]
+    assert DjangoGetter(user).get("avatar") is None
+    # from_orm with a getter
+    assert UserSchema.from_orm(getter).name == "John"
+
+    class CustomGetter(DjangoGetter):
+        @staticmethod
+        def convert_result(result):
+            return "custom"
+
+    class CustomSchema(Schema):
+        name: str
+
+        class Config:
+            getter_dict = CustomGetter
+
+    # getters that change convert_result get no converters
+    assert get_getter_dict(CustomSchema) is CustomGetter
+    assert CustomSchema.from_orm(user).name == "custom"
@@ -0,0 +1,227 @@
+from base64 import b64encode
+from unittest.mock import Mock
+
+import django
+import pytest
+from django.conf import settings
+
+from ninja import NinjaAPI, utils
+from ninja.security import (
+    APIKeyCookie,
+    APIKeyHeader,
+    APIKeyQuery,
+    HttpBasicAuth,
+    HttpBearer,
+)
+from ninja.testing import TestClient as BaseTestClient
+
+
+class TestClient(BaseTestClient):
+    def _build_request(self, *args, **kwargs):
+        request = super()._build_request(*args, **kwargs)
+        request._dont_enforce_csrf_checks = False
+        return request
+
+
+calls = []
+
+
+class Bearer(HttpBearer):
+    def authenticate(self, request, token):
+        calls.append("bearer")
+        if token == "secret":
+            return token
+
+
+class Basic(HttpBasicAuth):
+    def authenticate(self, request, username, password):
+        calls.append("basic")
+        if password == "secret":
+            return username
+
+
+class KeyQuery(APIKeyQuery):
+    def authenticate(self, request, key):
+        calls.append("query")
+        if key == "secret":
+            return key
+
+
+class KeyCookie(APIKeyCookie):
+    def authenticate(self, request, key):
+        if key == "secret":
+            return key
+
+
+class KeyHeaderFromCookie(APIKeyHeader):
+    def _get_key(self, request):
+        return request.COOKIES.get(self.param_name)
+
+    def authenticate(self, request, key):
+        return key
+
+
+class KeyQueryFromHeader(KeyQuery):
+    def _get_key(self, request):
+        return request.headers.get(self.param_name)
+
+
+class KeyCookieFromQuery(KeyCookie):
+    def _get_key(self, request):
+        return request.GET.get(self.param_name)
+
+
+class CustomBearer(HttpBearer):
+    "Reads the token from the X-Token header"
+
+    def __call__(self, request):
+        return self.authenticate(request, request.headers.get("X-Token"))
+
+    def authenticate(self, request, token):
+        if token == "secret":
+            return token
+
+
+def test_auth_candidates():
+    api = NinjaAPI(auth=[Bearer(), Basic(), KeyQuery()])
+
+    @api.get("/some")
+    def some(request):
+        return request.auth
+
+    client = TestClient(api)
+    calls.clear()
+    response = client.get("/some")
+    assert response.status_code == 401
+    # header auths are skipped when request has no Authorization header
+    # api key auths are always called (they get key=None)
+    assert calls == ["query"]
+
+    calls.clear()
+    assert client.get("/some?key=secret").json() == "secret"
+    assert calls == ["query"]
+
+    calls.clear()
+    assert client.get("/some", headers={"Authorization": "Bearer secret"}).json()
+    assert calls == ["bearer"]
+
+
+def test_csrf_skipped_for_header_auth():
+    api = NinjaAPI(csrf=True, auth=Bearer())
+
+    @api.post("/header")
+    def header(request):
+        return request.auth
+
+    @api.post("/basic", auth=[Bearer(), Basic()])
+    def basic(request):
+        return request.auth
+
+    @api.post("/cookie", auth=[Bearer(), KeyCookie()])
+    def cookie(request):
+        return request.auth
+
+    @api.post("/custom", auth=CustomBearer())
+    def custom(request):
+        return request.auth
+
+    client = TestClient(api)
+    cookies = {settings.CSRF_COOKIE_NAME: "1" * 64, "key": "secret"}
+    headers = {"Authorization": "Bearer secret"}
+    assert client.post("/header", headers=headers).json() == "secret"
+    # browsers re-send basic credentials on their own - csrf is checked
+    basic_auth = {"Authorization": "Basic " + b64encode(b"user:secret").decode()}
+    assert client.post("/basic", headers=basic_auth).status_code == 403
+    assert client.post("/basic", headers=headers).status_code == 403
+    assert client.post("/basic", headers=basic_auth, COOKIES=cookies).status_code == 403
+    # cookie auth can be sent by browser on its own - csrf is checked
+    assert client.post("/cookie", headers=headers, COOKIES=cookies).status_code == 403
+    # unknown credential location - csrf is checked
+    response = client.post("/custom", headers={"X-Token": "secret"}, COOKIES=cookies)
+    assert response.status_code == 403
+
+
+def test_csrf_middleware_reused():
+    api = NinjaAPI(csrf=True)
+
+    @api.post("/some")
+    def some(request):
+        return 1
+
+    client = TestClient(api)
+    cookies = {settings.CSRF_COOKIE_NAME: "1" * 64}
+    client.post("/some", COOKIES=cookies)
+    middleware = utils._csrf_middleware
+    assert middleware is not None
+    client.post("/some", COOKIES=cookies)
+    assert utils._csrf_middleware is middleware
+
+
+def test_unauthorized_response():
+    api = NinjaAPI(auth=Bearer())
+
+    @api.get("/some")
+    def some(request):
+        return 1
+
+    response = TestClient(api).get("/some")
+    assert response.status_code == 401
+    assert response["Content-Type"] == "application/json; charset=utf-8"
+    assert response.json() == {"detail": "Unauthorized"}
+
+    class CustomAPI(NinjaAPI):
+        def create_response(self, request, data, *, status=200):
+            data = {"error": data, "path": request.path}
+            return super().create_response(request, data, status=status)
+
+    api = CustomAPI(auth=Bearer())
+    api.get("/some")(some)
+    response = TestClient(api).get("/some")
+    assert response.status_code == 401
+    assert response.json() == {"error": {"detail": "Unauthorized"}, "path": "/some"}
+
+
+@pytest.mark.parametrize(
+    "auth,location",
+    [
+        (Bearer(), "header"),
+        (Basic(), None),
+        (KeyQuery(), "query"),
+        (KeyCookie(), "cookie"),
+        (KeyHeaderFromCookie(), None),
+        (KeyQueryFromHeader(), None),
+        (KeyCookieFromQuery(), None),
+        (CustomBearer(), None),
+    ],
+)
+def test_credential_check(auth, location):
+    check = auth._get_credential_check()
+    assert (check and check[0]) == location
+
+
+def test_http_auth_without_header():
+    request = Mock(headers={}, META={})
+    assert Bearer()(request) is None
+    assert Basic()(request) is None
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher")
+@pytest.mark.asyncio
+async def test_async_operation_with_cookie_auth_csrf():
+    from ninja.testing import TestAsyncClient
+
+    class AsyncClient(TestAsyncClient):
+        def _build_request(self, *args, **kwargs):
+            request = super()._build_request(*args, **kwargs)
+            request._dont_enforce_csrf_checks = False
+            return request
+
+    api = NinjaAPI(csrf=True, auth=KeyCookie())
+
+    @api.post("/some")
+    async def some(request):
+        return request.auth
+
+    cookies = {settings.CSRF_COOKIE_NAME: "1" * 64, "key": "secret"}
+    response = await AsyncClient(api).post("/some", COOKIES=cookies)
+    assert response.status_code == 403
@@ -0,0 +1,147 @@
+import datetime
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import pytest
+from pydantic import Field, conint
+
+from ninja import Schema
+from ninja.serializers import SchemaSerializer
+
+
+class Color(str, Enum):
+    red = "red"
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Tag(Schema):
+    name: str
+    title: Optional[str] = Field(None, alias="tagTitle")
+
+
+class Item(Schema):
+    id: int
+    name: str = "default"
+    price: Optional[float] = None
+    color: Color = Color.red
+    created: Optional[datetime.date] = None
+    tags: List[Tag] = []
+    main_tag: Optional[Tag] = None
+    scores: List[int] = []
+    optional_tags: List[Optional[Tag]] = []
+    meta: Dict[str, Tag] = {}
+    point: Optional[Point] = None
+    pair: Tuple[int, str] = (1, "a")
+    anything: Any = None
+    union: Union[Tag, int] = 0
+    rank: conint(gt=0) = 1
+
+
+class Extra(Schema):
+    name: str
+
+    class Config:
+        extra = "allow"
+
+
+class Root(Schema):
+    __root__: List[Tag]
+
+
+class Container(Schema):
+    root: Root
+    extra: Extra
+
+
+class EnumValues(Schema):
+    color: Color
+
+    class Config:
+        use_enum_values = True
+
+
+class EnumRoot(Schema):
+    __root__: List[Color]
+
+    class Config:
+        use_enum_values = True
+
+
+class EnumContainer(Schema):
+    colors: EnumRoot
+
+
+class Excluded(Schema):
+    name: str
+    secret: str = Field("", exclude=True)
+
+
+ITEMS = [
+    Item(id=1),
+    Item(
+        id=2,
+        name="two",
+        price=None,
+        created=datetime.date(2020, 1, 1),
+        tags=[{"name": "a"}, {"name": "b", "tagTitle": "B"}],
+        main_tag={"name": "main"},
+        scores=[1, 2, 3],
+        optional_tags=[None, {"name": "c"}],
+        meta={"key": {"name": "d"}},
+        point=(1, 2),
+        pair=(2, "b"),
+        anything={"nested": [Tag(name="e")], "tuple": (1, 2)},
+        union={"name": "f"},
+        rank=5,
+    ),
+    Container(root=[{"name": "g"}], extra={"name": "h", "other": [1, 2]}),
+    EnumValues(color="red"),
+    EnumContainer(colors=["red"]),
+    Excluded(name="i", secret="j"),
+]
+
+
+@pytest.mark.parametrize("item", ITEMS)
+@pytest.mark.parametrize("by_alias", [False, True])
+@pytest.mark.parametrize("exclude_unset", [False, True])
+@pytest.mark.parametrize("exclude_defaults", [False, True])
+@pytest.mark.parametrize("exclude_none", [False, True])
+def test_same_result_as_dict(
+    item, by_alias, exclude_unset, exclude_defaults, exclude_none
+):
+    options = dict(
+        by_alias=by_alias,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        exclude_none=exclude_none,
+    )
+    serializer = SchemaSerializer(**options)
+    assert serializer.serialize(item) == item.dict(**options)
+
+
+def test_for_field():
+    class Response(Schema):
+        response: Optional[List[Tag]]
+
+    serializer = SchemaSerializer(by_alias=True)
+    serialize = serializer.for_field(Response.__fields__["response"])
+    assert serialize(None) is None
+    assert serialize([Tag(name="a", tagTitle="A")]) == [{"name": "a", "tagTitle": "A"}]
+
+    class ScalarResponse(Schema):
+        response: List[int]
+
+    serialize = serializer.for_field(ScalarResponse.__fields__["response"])
+    assert serialize([1, 2]) == [1, 2]
+
+
+def test_root_response():
+    class Response(Schema):
+        response: Root
+
+    serialize = SchemaSerializer().for_field(Response.__fields__["response"])
+    assert serialize(Root(__root__=[{"name": "a"}])) == [{"name": "a", "title": None}]
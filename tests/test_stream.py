@@ -0,0 +1,145 @@
+import datetime
+from typing import List
+
+import pydantic
+import pytest
+from django.db.models import QuerySet
+from someapp.models import Event
+
+from ninja import NinjaAPI, Schema
+from ninja.conf import settings
+from ninja.errors import ConfigError
+from ninja.renderers import BaseRenderer, JSONRenderer
+from ninja.testing import TestClient
+
+
+class EventSchema(Schema):
+    title: str
+    start_date: datetime.date
+
+
+class SmallBufferRenderer(JSONRenderer):
+    stream_buffer_size = 10
+
+
+class TextRenderer(BaseRenderer):
+    media_type = "text/plain"
+
+    def render(self, request, data, *, response_status):
+        return "\n".join(item["title"] for item in data)
+
+
+api = NinjaAPI()
+
+
+@api.get("/events", response=List[EventSchema], stream=True)
+def events(request):
+    return Event.objects.order_by("id")
+
+
+@api.get("/manager", response=List[EventSchema], stream=True)
+def manager(request):
+    return Event.objects
+
+
+@api.get("/dicts", response={200: List[EventSchema], 404: str}, stream=True)
+def dicts(request, found: bool = True):
+    if not found:
+        return 404, "not found"
+    return ({"title": f"t{i}", "start_date": "2020-01-01"} for i in range(3))
+
+
+@api.get("/invalid", response=List[EventSchema], stream=True)
+def invalid(request):
+    return [{"title": "ok", "start_date": "2020-01-01"}, {"title": "no date"}]
+
+
+client = TestClient(api)
+
+
+def create_events(count):
+    Event.objects.bulk_create(
+        Event(
+            title=f"event {i}",
+            start_date=datetime.date(2020, 1, 1),
+            end_date=datetime.date(2020, 1, 2),
+        )
+        for i in range(count)
+    )
+
+
+@pytest.mark.django_db
+def test_stream_queryset(monkeypatch, django_assert_num_queries):
+    create_events(5)
+    monkeypatch.setattr(settings, "STREAM_CHUNK_SIZE", 2)
+    chunk_sizes = []
+    iterator = QuerySet.iterator
+
+    def spy(self, chunk_size):
+        chunk_sizes.append(chunk_size)
+        return iterator(self, chunk_size)
+
+    monkeypatch.setattr(QuerySet, "iterator", spy)
+
+    with django_assert_num_queries(1):
+        response = client.get("/events")
+    assert chunk_sizes == [2]
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "application/json; charset=utf-8"
+    assert response.json() == [
+        {"title": f"event {i}", "start_date": "2020-01-01"} for i in range(5)
+    ]
+
+    assert len(client.get("/manager").json()) == 5
+
+
+@pytest.mark.django_db
+def test_stream_empty():
+    response = client.get("/events")
+    assert response.streaming
+    assert response.json() == []
+
+
+def test_stream_iterable():
+    response = client.get("/dicts")
+    assert response.streaming
+    assert response.json() == [
+        {"title": f"t{i}", "start_date": "2020-01-01"} for i in range(3)
+    ]
+
+    response = client.get("/dicts?found=false")
+    assert not response.streaming
+    assert response.status_code == 404
+    assert response.json() == "not found"
+
+
+def test_stream_invalid_item():
+    with pytest.raises(pydantic.ValidationError) as exc:
+        client.get("/invalid")
+    assert exc.value.errors()[0]["loc"] == ("response", 1, "start_date")
+
+
+def test_render_stream():
+    items = [{"title": "a" * 8}, {"title": "b"}]
+
+    chunks = list(SmallBufferRenderer().render_stream(None, items, response_status=200))
+    assert chunks == [b'[{"title":"aaaaaaaa"}', b',{"title":"b"}', b"]"]
+
+    class IndentRenderer(JSONRenderer):
+        json_dumps_params = {"indent": 1}
+
+    chunks = list(IndentRenderer().render_stream(None, items[1:], response_status=200))
+    assert chunks == [b'[{\n "title": "b"\n}]']
+
+    chunks = list(TextRenderer().render_stream(None, iter(items), response_status=200))
+    assert chunks == ["aaaaaaaa\nb"]
+
+
+def test_stream_requires_list_response():
+    api = NinjaAPI()
+    with pytest.raises(ConfigError):
+
+        @api.get("/single", response=EventSchema, stream=True)
+        def single(request):
+            pass  # pragma: no cover
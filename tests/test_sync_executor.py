@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+import pytest
+
+from ninja import NinjaAPI, Router
+from ninja.errors import ConfigError
+from ninja.testing import TestAsyncClient
+
+router_executor = ThreadPoolExecutor(1, thread_name_prefix="router-pool")
+operation_executor = ThreadPoolExecutor(1, thread_name_prefix="operation-pool")
+
+
+def create_api(**kwargs):
+    api = NinjaAPI(**kwargs)
+    router = Router(sync_executor=router_executor)
+
+    @api.get("/default")
+    async def async_default(request):
+        pass  # pragma: no cover
+
+    @api.post("/default")
+    def sync_default(request):
+        return threading.current_thread().name
+
+    @router.get("/router")
+    async def async_router(request):
+        pass  # pragma: no cover
+
+    @router.post("/router")
+    def sync_router(request):
+        return threading.current_thread().name
+
+    @router.put("/router", sync_executor=operation_executor)
+    def sync_operation(request):
+        return threading.current_thread().name
+
+    api.add_router("/", router)
+    return api
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires django 3.1 or higher")
+@pytest.mark.asyncio
+async def test_sync_executors():
+    client = TestAsyncClient(create_api())
+    main_thread = (await client.post("/default")).json()
+    assert not main_thread.startswith("ninja-sync")
+    assert (await client.post("/router")).json().startswith("router-pool")
+    assert (await client.put("/router")).json().startswith("operation-pool")
+
+    client = TestAsyncClient(create_api(sync_executor="thread_pool"))
+    assert (await client.post("/default")).json().startswith("ninja-sync")
+    assert (await client.post("/default")).json().startswith("ninja-sync")
+    assert (await client.post("/router")).json().startswith("router-pool")
+
+    # thread pool is shared between apis
+    client = TestAsyncClient(create_api(sync_executor="thread_pool"))
+    assert (await client.post("/default")).json().startswith("ninja-sync")
+
+
+def test_invalid_executor():
+    api = NinjaAPI()
+    with pytest.raises(ConfigError):
+
+        @api.get("/invalid", sync_executor="threads")
+        def invalid(request):
+            pass  # pragma: no cover
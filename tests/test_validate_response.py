@@ -0,0 +1,213 @@
+import datetime
+from typing import Dict, List, Optional
+from unittest import mock
+
+import pydantic
+import pytest
+from pydantic import conint
+
+from ninja import Field, NinjaAPI, Schema
+from ninja.errors import ConfigError
+from ninja.serializers import SchemaSerializer
+from ninja.testing import TestClient
+
+
+class Obj:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class Tag(Schema):
+    name: str
+    label: str = Field("", alias="tagLabel")
+
+
+class Node(Schema):
+    name: str
+    children: List["Node"] = []
+
+
+Node.update_forward_refs()
+
+
+class Item(Schema):
+    id: int
+    title: Optional[str] = None
+    created: datetime.date
+    tags: List[Tag] = []
+    main_tag: Optional[Tag] = None
+    meta: Dict[str, Tag] = {}
+    node: Optional[Node] = None
+
+
+class ByName(Schema):
+    full_name: str = Field(..., alias="fullName")
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class NoOrm(pydantic.BaseModel):
+    value: int
+
+
+ITEMS = [
+    Obj(id=1, created=datetime.date(2020, 1, 1)),
+    Obj(
+        id=2,
+        title=None,
+        created=datetime.date(2020, 1, 2),
+        tags=[Obj(name="a", tagLabel="A"), {"name": "b"}],
+        main_tag=Tag(name="c"),
+        meta={"d": {"name": "d"}},
+        node=Obj(name="root", children=[Obj(name="child", children=[])]),
+        ignored="not in schema",
+    ),
+    {"id": 3, "title": "dict", "created": datetime.date(2020, 1, 3)},
+]
+
+
+@pytest.mark.parametrize("item", ITEMS)
+@pytest.mark.parametrize("by_alias", [False, True])
+@pytest.mark.parametrize("exclude_unset", [False, True])
+@pytest.mark.parametrize("exclude_defaults", [False, True])
+@pytest.mark.parametrize("exclude_none", [False, True])
+def test_same_result_as_validated(
+    item, by_alias, exclude_unset, exclude_defaults, exclude_none
+):
+    options = dict(
+        by_alias=by_alias,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        exclude_none=exclude_none,
+    )
+    serializer = SchemaSerializer(**options)
+
+    class Response(Schema):
+        response: Item
+
+    field = Response.__fields__["response"]
+    serialize = serializer.for_trusted_field(field, Response)
+    validated = field.validate(item, {}, loc="response", cls=Response)[0]
+    assert serialize(item) == serializer.for_field(field)(validated)
+
+
+def test_trusted_field_types():
+    class Response(Schema):
+        response: List[ByName]
+
+    serializer = SchemaSerializer()
+    serialize = serializer.for_trusted_field(Response.__fields__["response"], Response)
+    assert serialize(None) is None
+    assert serialize([{"fullName": "a"}, {"full_name": "b"}]) == [
+        {"full_name": "a"},
+        {"full_name": "b"},
+    ]
+
+    class Scalars(Schema):
+        response: List[int]
+
+    serialize = serializer.for_trusted_field(Scalars.__fields__["response"], Scalars)
+    assert serialize((1, 2)) == [1, 2]
+
+    class NoOrmResponse(Schema):
+        response: NoOrm
+
+    serialize = serializer.for_trusted_field(
+        NoOrmResponse.__fields__["response"], NoOrmResponse
+    )
+    assert serialize({"value": 1}) == {"value": 1}
+    with pytest.raises(pydantic.ValidationError):
+        serialize(Obj(value=1))
+
+
+def test_trusted_missing_required():
+    class Response(Schema):
+        response: Tag
+
+    serializer = SchemaSerializer()
+    serialize = serializer.for_trusted_field(Response.__fields__["response"], Response)
+    with pytest.raises(pydantic.ValidationError):
+        serialize(Obj(label="no name"))
+    with pytest.raises(pydantic.ValidationError):
+        serialize({"label": "no name"})
+
+
+def test_trusted_fallback_to_validation():
+    class Response(Schema):
+        response: Dict[str, int]
+
+    serializer = SchemaSerializer()
+    serialize = serializer.for_trusted_field(Response.__fields__["response"], Response)
+    assert serialize({"a": "1"}) == {"a": 1}
+    with pytest.raises(pydantic.ValidationError):
+        serialize({"a": "x"})
+
+    class Constrained(Schema):
+        response: conint(gt=0)
+
+    field = Constrained.__fields__["response"]
+    serialize = serializer.for_trusted_field(field, Constrained)
+    assert serialize("1") == 1
+    with pytest.raises(pydantic.ValidationError):
+        serialize(0)
+
+
+api = NinjaAPI(validate_response=False)
+
+
+@api.get("/trusted", response=Item)
+def trusted(request):
+    return Obj(id="1", created="2020-01-01", extra=1)
+
+
+@api.get("/validated", response=Item, validate_response=True)
+def validated(request):
+    return Obj(id="1", created="2020-01-01")
+
+
+@api.get("/stream", response=List[Tag], stream=True)
+def stream(request):
+    return [Obj(name=1), None]
+
+
+client = TestClient(api)
+
+
+def test_api_validate_response():
+    # data is trusted as is (types are not converted)
+    assert client.get("/trusted").json() == {
+        "id": "1",
+        "title": None,
+        "created": "2020-01-01",
+        "tags": [],
+        "main_tag": None,
+        "meta": {},
+        "node": None,
+    }
+    assert client.get("/validated").json()["id"] == 1
+    assert client.get("/stream").json() == [{"name": 1, "label": ""}, None]
+
+
+def test_validate_rate():
+    api = NinjaAPI()
+
+    @api.get("/sampled", response=Tag, validate_response=0.25)
+    def sampled(request):
+        return Obj(name=1)
+
+    client = TestClient(api)
+    with mock.patch("ninja.operation.random", return_value=0.5):
+        assert client.get("/sampled").json() == {"name": 1, "label": ""}
+    with mock.patch("ninja.operation.random", return_value=0.1):
+        assert client.get("/sampled").json() == {"name": "1", "label": ""}
+
+
+@pytest.mark.parametrize("value", [-1, 1.5])
+def test_invalid_rate(value):
+    api = NinjaAPI()
+    with pytest.raises(ConfigError):
+
+        @api.get("/invalid", validate_response=value)
+        def invalid(request):
+            pass  # pragma: no cover